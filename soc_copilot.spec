@@ -33,6 +33,7 @@ a = Analysis(
         (str(config_path), 'config'),
         (str(models_path), 'data/models'),
         (str(assets_path), 'assets'),
+        (str(src_path / 'soc_copilot' / 'phase4' / 'ui' / 'styles.qss'), 'soc_copilot/phase4/ui'),
     ],
     hiddenimports=[
         # PyQt6
@@ -1,6 +1,6 @@
 """Application controller layer for orchestrating analysis"""
 
-from .schemas import AnalysisResult, AlertSummary, PipelineStats
+from .schemas import AnalysisResult, AlertSummary, PipelineStats, PRIORITY_BUCKETS, priority_bucket
 from .result_store import ResultStore
 from .app_controller import AppController
 
@@ -8,6 +8,8 @@ __all__ = [
     "AnalysisResult",
     "AlertSummary",
     "PipelineStats",
+    "PRIORITY_BUCKETS",
+    "priority_bucket",
     "ResultStore",
     "AppController",
 ]
@@ -2,8 +2,8 @@
 
 from collections import deque
 from threading import Lock
-from typing import List, Optional
-from .schemas import AnalysisResult
+from typing import Dict, List, Optional, Tuple
+from .schemas import AnalysisResult, AlertSummary, PRIORITY_BUCKETS
 
 
 class ResultStore:
@@ -13,17 +13,69 @@ class ResultStore:
         self.max_results = max_results
         self._results = deque(maxlen=max_results)
         self._lock = Lock()
+        self._added = 0  # results ever added; cursor for get_since()
+        # Alerts per PRIORITY_BUCKETS index across stored results
+        self._priority_counts = [0] * len(PRIORITY_BUCKETS)
     
     def add(self, result: AnalysisResult):
         """Add analysis result"""
         with self._lock:
+            counts = self._priority_counts
+            if len(self._results) == self._results.maxlen:
+                for alert in self._results[0].alerts:
+                    counts[alert.priority_bucket] -= 1
+            for alert in result.alerts:
+                counts[alert.priority_bucket] += 1
+            
             self._results.append(result)
+            self._added += 1
     
     def get_latest(self, limit: int = 10) -> List[AnalysisResult]:
         """Get latest N results"""
         with self._lock:
             return list(self._results)[-limit:]
     
+    def get_recent_alerts(self, limit: int = 15) -> List[Tuple[str, AlertSummary]]:
+        """Get the newest `limit` alerts, newest first, as (batch_id, alert) pairs"""
+        with self._lock:
+            return self._recent_alerts(limit)
+    
+    def priority_counts(self) -> Dict[str, int]:
+        """Alert counts by priority across stored results, plus a total"""
+        with self._lock:
+            return self._counts()
+    
+    def snapshot(self, limit: int = 15) -> Tuple[Dict[str, int], List[Tuple[str, AlertSummary]]]:
+        """Priority counts and the newest `limit` alerts, read under one lock"""
+        with self._lock:
+            return self._counts(), self._recent_alerts(limit)
+    
+    def _counts(self) -> Dict[str, int]:
+        counts = dict(zip(PRIORITY_BUCKETS, self._priority_counts))
+        counts["total"] = sum(self._priority_counts)
+        return counts
+    
+    def _recent_alerts(self, limit: int) -> List[Tuple[str, AlertSummary]]:
+        recent = []
+        for result in reversed(self._results):
+            for alert in reversed(result.alerts):
+                recent.append((result.batch_id, alert))
+                if len(recent) >= limit:
+                    return recent
+        return recent
+    
+    def get_since(self, cursor: int) -> Tuple[List[AnalysisResult], int]:
+        """Get results added after `cursor`, plus the cursor to pass next time
+        
+        Results already evicted from the store are skipped; clear() does
+        not rewind cursors.
+        """
+        with self._lock:
+            new_count = min(self._added - cursor, len(self._results))
+            if new_count <= 0:
+                return [], self._added
+            return list(self._results)[-new_count:], self._added
+    
     def get_all(self) -> List[AnalysisResult]:
         """Get all stored results"""
         with self._lock:
@@ -46,3 +98,4 @@ class ResultStore:
         """Clear all results"""
         with self._lock:
             self._results.clear()
+            self._priority_counts = [0] * len(PRIORITY_BUCKETS)
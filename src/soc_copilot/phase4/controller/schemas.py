@@ -1,10 +1,29 @@
 """Typed schemas for analysis results (view models only)"""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
 
 
+# Priority buckets, most severe first; the index is AlertSummary.priority_bucket
+PRIORITY_BUCKETS = ("critical", "high", "medium", "low", "info")
+
+
+@lru_cache(maxsize=256)
+def priority_bucket(priority: str) -> int:
+    """Map a priority label such as "P1-High" to its PRIORITY_BUCKETS index
+    
+    Labels come from a small closed set, so each distinct label is
+    classified once and later lookups are a cache hit.
+    """
+    p = priority.lower()
+    for index, name in enumerate(PRIORITY_BUCKETS[:-1]):
+        if name in p:
+            return index
+    return len(PRIORITY_BUCKETS) - 1
+
+
 @dataclass
 class AlertSummary:
     """Alert summary view model"""
@@ -19,6 +38,10 @@ class AlertSummary:
     timestamp: datetime
     reasoning: str
     suggested_action: str
+    priority_bucket: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.priority_bucket = priority_bucket(self.priority)
 
 
 @dataclass
@@ -9,12 +9,14 @@ from .splash_screen import SplashScreen, create_splash
 from .about_dialog import AboutDialog
 from .system_status_bar import SystemStatusBar, PermissionBanner, KillSwitchBanner
 from .dashboard_components import (
+    AlertRow,
     ThreatLevelBanner,
     RecentAlertsTimeline,
     EmptyStateCard,
     QuickActionsBar,
     CompactMetricCard,
-    SystemHealthGrid
+    SystemHealthGrid,
+    StaticTextLabel
 )
 
 __all__ = [
@@ -29,10 +31,12 @@ __all__ = [
     "SystemStatusBar",
     "PermissionBanner",
     "KillSwitchBanner",
+    "AlertRow",
     "ThreatLevelBanner",
     "RecentAlertsTimeline",
     "EmptyStateCard",
     "QuickActionsBar",
     "CompactMetricCard",
-    "SystemHealthGrid"
+    "SystemHealthGrid",
+    "StaticTextLabel"
 ]
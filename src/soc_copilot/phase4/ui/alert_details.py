@@ -85,8 +85,9 @@ class AlertDetailsPanel(QWidget):
         header.addStretch()
         layout.addLayout(header)
         
-        # Scroll area for details
-        scroll = QScrollArea()
+        # Scroll area for details (content widget is built by _clear_details)
+        self.scroll = QScrollArea()
+        scroll = self.scroll
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("""
             QScrollArea { border: none; background: transparent; }
@@ -101,13 +102,6 @@ class AlertDetailsPanel(QWidget):
                 min-height: 30px;
             }
         """)
-        
-        self.details_widget = QWidget()
-        self.details_layout = QVBoxLayout()
-        self.details_layout.setSpacing(12)
-        self.details_widget.setLayout(self.details_layout)
-        
-        scroll.setWidget(self.details_widget)
         layout.addWidget(scroll)
         
         self.setLayout(layout)
@@ -128,11 +122,20 @@ class AlertDetailsPanel(QWidget):
         self.details_layout.addWidget(placeholder)
     
     def _clear_details(self):
-        """Clear details panel"""
-        while self.details_layout.count():
-            item = self.details_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Clear details panel by swapping in a fresh content widget
+        
+        Deleting the old widget takes every child and nested layout with it
+        in one go, instead of removing layout items one at a time.
+        """
+        old = self.scroll.takeWidget()
+        if old is not None:
+            old.deleteLater()
+        
+        self.details_widget = QWidget()
+        self.details_layout = QVBoxLayout()
+        self.details_layout.setSpacing(12)
+        self.details_widget.setLayout(self.details_layout)
+        self.scroll.setWidget(self.details_widget)
     
     def show_alert(self, batch_id: str, alert_classification: str):
         """Display alert details with enhanced layout"""
@@ -1,11 +1,105 @@
 """Optimized alerts table with incremental updates and scroll preservation"""
 
+import time
+from collections import Counter
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, 
-    QHeaderView, QLabel, QPushButton, QComboBox, QLineEdit
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
+    QStyledItemDelegate, QStyleOptionViewItem, QLabel, QPushButton, QComboBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QColor, QPalette
+
+from ..controller import PRIORITY_BUCKETS, priority_bucket
+
+
+# Custom role returning {role: value} for a cell in one data() call
+MULTIPLE_ROLES = Qt.ItemDataRole.UserRole + 1000
+
+ALERT_COLUMNS = ("time", "priority", "classification", "source_ip", "confidence", "batch_id")
+ALERT_HEADERS = ("Time", "Priority", "Classification", "Source IP", "Confidence", "Batch ID")
+
+PRIORITY_COLORS = {
+    "critical": QColor("#ff4444"),
+    "high": QColor("#ff8800"),
+    "medium": QColor("#ffaa00"),
+}
+DEFAULT_COLOR = QColor("#ffffff")
+
+
+def _priority_color(priority: str) -> QColor:
+    """Foreground color for a priority string"""
+    priority_lower = priority.lower()
+    for level, color in PRIORITY_COLORS.items():
+        if level in priority_lower:
+            return color
+    return DEFAULT_COLOR
+
+
+class AlertsTableModel(QAbstractTableModel):
+    """Read-only table model over the alert dicts shown in AlertsView"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []    # alert dicts
+        self._colors = []  # per-row foreground color, resolved once
+    
+    def set_alerts(self, alerts_data: list):
+        """Replace all rows in one model reset"""
+        self.beginResetModel()
+        self._rows = list(alerts_data)
+        self._colors = [_priority_color(a["priority"]) for a in self._rows]
+        self.endResetModel()
+    
+    def alert_at(self, row: int) -> dict:
+        """Alert dict backing a row"""
+        return self._rows[row]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ALERT_COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == MULTIPLE_ROLES:
+            return {
+                Qt.ItemDataRole.DisplayRole: self._rows[row][ALERT_COLUMNS[index.column()]],
+                Qt.ItemDataRole.ForegroundRole: self._colors[row],
+            }
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][ALERT_COLUMNS[index.column()]]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors[row]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ALERT_HEADERS[section]
+        return None
+
+
+class MultipleRolesDelegate(QStyledItemDelegate):
+    """Delegate that fills the style option from a single MULTIPLE_ROLES fetch
+    
+    The default initStyleOption queries data() once per role (display,
+    foreground, font, alignment, decoration, check state...); this asks
+    the model once per cell.
+    """
+    
+    def initStyleOption(self, option, index):
+        roles = index.data(MULTIPLE_ROLES)
+        if roles is None:
+            super().initStyleOption(option, index)
+            return
+        option.index = index
+        option.text = roles[Qt.ItemDataRole.DisplayRole]
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+        option.displayAlignment = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        option.palette.setColor(QPalette.ColorRole.Text, roles[Qt.ItemDataRole.ForegroundRole])
 
 
 class AlertsView(QWidget):
@@ -13,12 +107,16 @@ class AlertsView(QWidget):
     
     alert_selected = pyqtSignal(str, str)  # batch_id, alert_id
     
+    # Seconds a rendered empty-state message is reused by timer refreshes
+    EMPTY_STATE_TTL = 10.0
+    
     def __init__(self, bridge):
         super().__init__()
         self.bridge = bridge
         self._alert_cache = {}  # batch_id -> alert data
         self._current_filter = "All"
         self._search_text = ""
+        self._empty_cache = None  # (stats, message, timestamp)
         self._init_ui()
         
         # Fast refresh for real-time feel
@@ -39,20 +137,19 @@ class AlertsView(QWidget):
         layout.addLayout(header)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Time", "Priority", "Classification", "Source IP", "Confidence", "Batch ID"
-        ])
+        self.table = QTableView()
+        self.model = AlertsTableModel(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(MultipleRolesDelegate(self.table))
         
         # Optimize table for performance
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(False)  # Disable during updates
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setDefaultSectionSize(32)  # Compact rows
-        self.table.itemClicked.connect(self._on_row_clicked)
+        self.table.clicked.connect(self._on_row_clicked)
         
         # Performance: disable updates during batch operations
         self.table.setUpdatesEnabled(True)
@@ -168,8 +265,8 @@ class AlertsView(QWidget):
                         "time": alert.timestamp.strftime("%H:%M:%S") if hasattr(alert.timestamp, 'strftime') else str(alert.timestamp),
                         "priority": alert.priority,
                         "classification": alert.classification,
-                        "source_ip": getattr(alert, 'source_ip', None) or "N/A",
-                        "confidence": f"{alert.confidence:.2f}" if hasattr(alert, 'confidence') else "N/A"
+                        "source_ip": alert.source_ip or "N/A",
+                        "confidence": f"{alert.confidence:.2f}"
                     }
                     self._alert_cache[key] = alert_dict
                     alerts_data.append(alert_dict)
@@ -179,7 +276,7 @@ class AlertsView(QWidget):
             
             # Handle empty state
             if not alerts_data:
-                self.table.setRowCount(0)
+                self.model.set_alerts([])
                 self._show_empty_state()
                 return
             
@@ -210,14 +307,21 @@ class AlertsView(QWidget):
                             "time": alert.timestamp.strftime("%H:%M:%S") if hasattr(alert.timestamp, 'strftime') else str(alert.timestamp),
                             "priority": alert.priority,
                             "classification": alert.classification,
-                            "source_ip": getattr(alert, 'source_ip', None) or "N/A",
-                            "confidence": f"{alert.confidence:.2f}" if hasattr(alert, 'confidence') else "N/A"
+                            "source_ip": alert.source_ip or "N/A",
+                            "confidence": f"{alert.confidence:.2f}"
                         }
                         self._alert_cache[key] = alert_dict
                         new_alerts.append(alert_dict)
             
+            # Keep the empty-state message current while nothing has arrived
+            if not self._alert_cache:
+                self._show_empty_state(use_cache=True)
+                return
+            
             # Only update if there are new alerts
             if new_alerts:
+                self.empty_label.hide()
+                self.table.show()
                 all_alerts = list(self._alert_cache.values())
                 self._update_counter(all_alerts)
                 filtered = self._apply_filters(all_alerts)
@@ -248,10 +352,12 @@ class AlertsView(QWidget):
     
     def _update_counter(self, alerts_data: list):
         """Update alert counters"""
+        # Tally labels in C, then classify each distinct label once
+        buckets = [0] * len(PRIORITY_BUCKETS)
+        for label, n in Counter(a["priority"] for a in alerts_data).items():
+            buckets[priority_bucket(label)] += n
+        critical, high, medium = buckets[:3]
         total = len(alerts_data)
-        critical = sum(1 for a in alerts_data if "critical" in a["priority"].lower())
-        high = sum(1 for a in alerts_data if "high" in a["priority"].lower())
-        medium = sum(1 for a in alerts_data if "medium" in a["priority"].lower())
         
         parts = [f"Total: {total}"]
         if critical: parts.append(f"Critical: {critical}")
@@ -285,81 +391,88 @@ class AlertsView(QWidget):
         filtered = self._apply_filters(all_alerts)
         self._update_table(filtered)
     
-    def _show_empty_state(self):
-        """Show appropriate empty state message"""
-        try:
-            stats = self.bridge.get_stats()
-            pipeline_active = stats.get("pipeline_loaded", False)
-            
-            # Get ingestion status
-            running = stats.get('running', False)
-            shutdown_flag = stats.get('shutdown_flag', False)
-            sources_count = stats.get('sources_count', 0)
-            
-            if shutdown_flag:
-                ingestion_status = "Stopped"
-            elif running and sources_count > 0:
-                ingestion_status = "Active"
-            elif sources_count > 0:
-                ingestion_status = "Configured"
-            else:
-                ingestion_status = "Not Started"
-            
-            if not pipeline_active:
-                message = (
-                    "⚠️ Pipeline not active\n\n"
-                    "Models may be missing. Run:\n"
-                    "python scripts/train_models.py"
-                )
-            elif ingestion_status == "Not Started":
-                message = (
-                    "📁 No log sources configured\n\n"
-                    "Add log files or directories to start monitoring"
-                )
-            elif ingestion_status == "Stopped":
-                message = (
-                    "⏸️ Ingestion stopped\n\n"
-                    "Restart the application to resume monitoring"
-                )
-            elif ingestion_status == "Active":
-                message = (
-                    "🔄 Monitoring active - No alerts yet\n\n"
-                    "System is actively monitoring for security threats.\n"
-                    "This is good - no threats detected!"
-                )
-            else:
-                message = (
-                    "✅ No alerts detected\n\n"
-                    "System is ready to monitor for security threats."
-                )
-            
-            self.empty_label.setText(message)
-        except Exception:
-            self.empty_label.setText("No alerts to display.")
-        
+    def _show_empty_state(self, use_cache: bool = False):
+        """Show appropriate empty state message
+        
+        Timer-driven refreshes pass use_cache=True so consecutive empty
+        polls reuse the last rendered message for EMPTY_STATE_TTL seconds
+        instead of hitting bridge.get_stats() every tick. Explicit
+        refreshes always refetch.
+        """
+        now = time.monotonic()
+        cached = self._empty_cache
+        if use_cache and cached is not None and now - cached[2] < self.EMPTY_STATE_TTL:
+            message = cached[1]
+        else:
+            try:
+                stats = self.bridge.get_stats()
+                message = self._build_empty_message(stats)
+                self._empty_cache = (stats, message, now)
+            except Exception:
+                message = "No alerts to display."
+                self._empty_cache = None
+        
+        self.empty_label.setText(message)
         self.empty_label.show()
         self.table.hide()
     
+    @staticmethod
+    def _build_empty_message(stats: dict) -> str:
+        """Render the empty state message for a stats snapshot"""
+        pipeline_active = stats.get("pipeline_loaded", False)
+        
+        # Get ingestion status
+        running = stats.get('running', False)
+        shutdown_flag = stats.get('shutdown_flag', False)
+        sources_count = stats.get('sources_count', 0)
+        
+        if shutdown_flag:
+            ingestion_status = "Stopped"
+        elif running and sources_count > 0:
+            ingestion_status = "Active"
+        elif sources_count > 0:
+            ingestion_status = "Configured"
+        else:
+            ingestion_status = "Not Started"
+        
+        if not pipeline_active:
+            return (
+                "⚠️ Pipeline not active\n\n"
+                "Models may be missing. Run:\n"
+                "python scripts/train_models.py"
+            )
+        if ingestion_status == "Not Started":
+            return (
+                "📁 No log sources configured\n\n"
+                "Add log files or directories to start monitoring"
+            )
+        if ingestion_status == "Stopped":
+            return (
+                "⏸️ Ingestion stopped\n\n"
+                "Restart the application to resume monitoring"
+            )
+        if ingestion_status == "Active":
+            return (
+                "🔄 Monitoring active - No alerts yet\n\n"
+                "System is actively monitoring for security threats.\n"
+                "This is good - no threats detected!"
+            )
+        return (
+            "✅ No alerts detected\n\n"
+            "System is ready to monitor for security threats."
+        )
+    
     def _show_error_state(self, error: str):
         """Show error state"""
-        self.table.setRowCount(0)
+        self.model.set_alerts([])
         error_msg = error[:100] + "..." if len(error) > 100 else error
         self.empty_label.setText(f"❌ Error loading alerts:\n{error_msg}\n\nCheck logs for details.")
         self.empty_label.show()
         self.table.hide()
     
     def _update_table(self, alerts_data: list):
-        """Full table update - optimized batch operation"""
-        # Disable updates during batch operation
-        self.table.setUpdatesEnabled(False)
-        
-        self.table.setRowCount(len(alerts_data))
-        
-        for row, alert in enumerate(alerts_data):
-            self._set_row_data(row, alert)
-        
-        # Re-enable updates and refresh
-        self.table.setUpdatesEnabled(True)
+        """Full table update - one model reset, no per-cell items"""
+        self.model.set_alerts(alerts_data)
         self.table.resizeColumnsToContents()
     
     def _update_table_incremental(self, alerts_data: list, preserve_scroll: bool = True):
@@ -368,57 +481,16 @@ class AlertsView(QWidget):
         scroll_bar = self.table.verticalScrollBar()
         scroll_pos = scroll_bar.value() if preserve_scroll else 0
         
-        # Disable updates
-        self.table.setUpdatesEnabled(False)
-        
-        self.table.setRowCount(len(alerts_data))
+        self.model.set_alerts(alerts_data)
         
-        for row, alert in enumerate(alerts_data):
-            self._set_row_data(row, alert)
-        
-        # Re-enable and restore scroll
-        self.table.setUpdatesEnabled(True)
         if preserve_scroll:
             scroll_bar.setValue(scroll_pos)
     
-    def _set_row_data(self, row: int, alert: dict):
-        """Set data for a single row - reusable method"""
-        items = [
-            QTableWidgetItem(alert["time"]),
-            QTableWidgetItem(alert["priority"]),
-            QTableWidgetItem(alert["classification"]),
-            QTableWidgetItem(alert["source_ip"]),
-            QTableWidgetItem(alert["confidence"]),
-            QTableWidgetItem(alert["batch_id"])
-        ]
-        
-        # Set items
-        for col, item in enumerate(items):
-            self.table.setItem(row, col, item)
-        
-        # Color by priority
-        priority_lower = alert["priority"].lower()
-        if "critical" in priority_lower:
-            color = QColor("#ff4444")
-        elif "high" in priority_lower:
-            color = QColor("#ff8800")
-        elif "medium" in priority_lower:
-            color = QColor("#ffaa00")
-        else:
-            color = QColor("#ffffff")
-        
-        # Apply color
-        for col in range(6):
-            item = self.table.item(row, col)
-            if item:
-                item.setForeground(color)
-    
-    def _on_row_clicked(self, item):
+    def _on_row_clicked(self, index):
         """Handle row click with error handling"""
         try:
-            row = item.row()
-            batch_id = self.table.item(row, 5).text()
-            alert_id = self.table.item(row, 2).text()  # Use classification as identifier
-            self.alert_selected.emit(batch_id, alert_id)
+            alert = self.model.alert_at(index.row())
+            # Use classification as identifier
+            self.alert_selected.emit(alert["batch_id"], alert["classification"])
         except Exception:
             pass  # Ignore click errors
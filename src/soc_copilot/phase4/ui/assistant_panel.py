@@ -1,21 +1,136 @@
 """Interactive Chat Assistant Panel with user input support"""
 
+import html
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QLabel, QLineEdit, QPushButton, QFrame
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QColor, QTextCursor, QTextCharFormat, QTextBlockFormat
+
+from .styles import MASTER_QSS
+
+
+# Classification -> plain-language description
+_CLASSIFICATION_TEMPLATES = {
+    "BruteForce": "A brute force attack involves repeated login attempts to guess credentials. Multiple failed authentication attempts from the same source indicate credential stuffing or password guessing.",
+    "PortScan": "Port scanning is reconnaissance activity where an attacker probes network ports to identify running services and potential vulnerabilities.",
+    "DDoS": "Distributed Denial of Service attack floods your systems with traffic to make services unavailable. High volume traffic from multiple sources is a key indicator.",
+    "DataExfiltration": "Data exfiltration involves unauthorized transfer of data outside the network. Large outbound transfers to unusual destinations indicate possible data theft.",
+    "SQLInjection": "SQL injection exploits vulnerabilities in database queries to access or manipulate data through malicious input.",
+    "XSS": "Cross-Site Scripting injects malicious scripts into web pages to steal data or hijack user sessions.",
+    "Benign": "This activity appears to be normal network behavior with no indicators of malicious intent.",
+}
+
+# Keyword -> canned answer for questions without a selected alert
+_GENERAL_ANSWERS = {
+    "help": "I can help you understand alerts. Select an alert and ask:\n• Why was this generated?\n• What should I do?\n• What's the risk level?",
+    "hi": "Hello! I'm your SOC assistant. Select an alert to analyze.",
+    "hello": "Hi there! Ready to help you investigate security alerts.",
+    "commands": "Available commands:\n• why - Get reason for alert\n• explain - Full explanation\n• action - Recommended actions\n• risk - Risk assessment",
+}
+
+# One scan over the question for any whole-word keyword
+_GENERAL_KEYWORD_RE = re.compile(r"\b(" + "|".join(map(re.escape, _GENERAL_ANSWERS)) + r")\b")
+
+# Quick action -> AssistantPanel response generator
+_RESPONSE_GENERATORS = {
+    "why": "_generate_why",
+    "explain": "_generate_explanation",
+    "action": "_generate_action",
+    "risk": "_generate_risk",
+}
+
+# Chat message colors: (block background, label color, label text)
+_MESSAGE_STYLES = {
+    "user": ("#0f3460", "#00d4ff", "You: "),
+    "assistant": ("#16213e", "#4CAF50", "Assistant:\u2028"),
+}
+_SYSTEM_TEXT_COLOR = "#888888"
+
+# Splits text into alternating plain / **bold** segments
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+_WHY_TEMPLATE = """This alert was generated because:
+
+• **Classification**: {} (conf: {:.0%})
+• **Anomaly Score**: {:.3f}
+• **Risk Score**: {:.3f}
+• **Priority**: {}
+
+{}"""
+
+_ACTION_TEMPLATE = """**Recommended Actions:**
+
+{}
+
+**Investigation Steps:**
+1. Review source IP reputation: {}
+2. Check historical activity for this pattern
+3. Correlate with other security events
+4. Document findings in incident report"""
+
+_RISK_TEMPLATE = """**Risk Assessment**
+
+• Level: **{}**
+• Score: {:.2f}/1.00
+• Priority: {}
+• Confidence: {:.0%}
+
+{}"""
+
+_RISK_NOTES = {
+    "HIGH": "⚠️ Requires immediate attention!",
+    "MEDIUM": "🔍 Investigate when possible.",
+    "LOW": "✅ Monitor and review as needed.",
+}
 
 
 class AssistantPanel(QWidget):
     """Interactive chat assistant with Q&A input"""
     
+    # Scroll-back limit; oldest blocks are evicted on append
+    MAX_CHAT_BLOCKS = 300
+    
+    # Generated responses kept per (alert fields, action), LRU-evicted
+    RESPONSE_CACHE_SIZE = 128
+    
     def __init__(self):
         super().__init__()
         self.current_alert = None
+        self._response_cache = OrderedDict()
+        self._init_formats()
         self._init_ui()
     
+    def _init_formats(self):
+        """Build the text formats used to write chat messages"""
+        bold = QTextCharFormat()
+        bold.setFontWeight(QFont.Weight.Bold)
+        self._body_fmt = QTextCharFormat()
+        self._bold_fmt = bold
+        
+        self._label_fmts = {}
+        self._block_fmts = {}
+        for role, (background, label_color, _) in _MESSAGE_STYLES.items():
+            label_fmt = QTextCharFormat(bold)
+            label_fmt.setForeground(QColor(label_color))
+            self._label_fmts[role] = label_fmt
+            block_fmt = QTextBlockFormat()
+            block_fmt.setBackground(QColor(background))
+            self._block_fmts[role] = block_fmt
+        
+        self._system_fmt = QTextCharFormat()
+        self._system_fmt.setForeground(QColor(_SYSTEM_TEXT_COLOR))
+        self._system_fmt.setFontItalic(True)
+        self._system_bold_fmt = QTextCharFormat(self._system_fmt)
+        self._system_bold_fmt.setFontWeight(QFont.Weight.Bold)
+        self._system_block_fmt = QTextBlockFormat()
+    
     def _init_ui(self):
         layout = QVBoxLayout()
         layout.setSpacing(10)
@@ -23,116 +138,76 @@ class AssistantPanel(QWidget):
         
         # Header
         header = QLabel("🤖 SOC Assistant")
+        header.setObjectName("assistantHeader")
         header.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #00d4ff;")
         layout.addWidget(header)
         
         # Chat display
-        self.chat_display = QTextEdit()
+        # Plain-text widget: append-heavy log, cheaper layout than rich text
+        self.chat_display = QPlainTextEdit()
+        self.chat_display.setObjectName("chatDisplay")
         self.chat_display.setReadOnly(True)
-        self.chat_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a1a2e;
-                color: #ffffff;
-                border: 1px solid #2a2a4e;
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 13px;
-                line-height: 1.5;
-            }
-        """)
+        self.chat_display.setMaximumBlockCount(self.MAX_CHAT_BLOCKS)
+        # Read-only log: no undo history per insert, no recentering on scroll
+        self.chat_display.setUndoRedoEnabled(False)
+        self.chat_display.setCenterOnScroll(False)
         layout.addWidget(self.chat_display)
         
-        # Quick action buttons
-        actions_frame = QFrame()
-        actions_frame.setStyleSheet("background: transparent;")
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(8)
-        actions_layout.setContentsMargins(0, 0, 0, 0)
-        
+        # Quick action buttons are built on the first explain_alert()
         self.quick_buttons = []
-        quick_actions = [
-            ("❓ Why", "why"),
-            ("📖 Explain", "explain"),
-            ("🛡️ Action", "action"),
-            ("📊 Risk", "risk"),
-        ]
-        
-        for text, cmd in quick_actions:
-            btn = QPushButton(text)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #16213e;
-                    color: #ffffff;
-                    border: 1px solid #0f3460;
-                    border-radius: 5px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #0f3460;
-                    border-color: #00d4ff;
-                }
-                QPushButton:disabled {
-                    background-color: #1a1a2e;
-                    color: #555555;
-                }
-            """)
-            btn.clicked.connect(lambda checked, c=cmd: self._handle_quick_action(c))
-            actions_layout.addWidget(btn)
-            self.quick_buttons.append(btn)
-        
-        actions_frame.setLayout(actions_layout)
-        layout.addWidget(actions_frame)
+        self._main_layout = layout
         
         # Input area
         input_frame = QFrame()
-        input_frame.setStyleSheet("""
-            QFrame {
-                background-color: #16213e;
-                border-radius: 8px;
-            }
-        """)
+        input_frame.setObjectName("inputFrame")
         input_layout = QHBoxLayout()
         input_layout.setContentsMargins(10, 8, 10, 8)
         
         self.input_field = QLineEdit()
+        self.input_field.setObjectName("chatInput")
         self.input_field.setPlaceholderText("Ask a question about the selected alert...")
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background-color: transparent;
-                border: none;
-                color: #ffffff;
-                font-size: 13px;
-                padding: 5px;
-            }
-        """)
         self.input_field.returnPressed.connect(self._handle_user_input)
         input_layout.addWidget(self.input_field)
         
         self.send_btn = QPushButton("Send")
-        self.send_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00d4ff;
-                color: #1a1a2e;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00a8cc;
-            }
-        """)
+        self.send_btn.setObjectName("sendBtn")
         self.send_btn.clicked.connect(self._handle_user_input)
         input_layout.addWidget(self.send_btn)
         
         input_frame.setLayout(input_layout)
         layout.addWidget(input_frame)
         
+        # One shared sheet for the whole panel, matched by object name
+        self.setStyleSheet(MASTER_QSS)
         self.setLayout(layout)
         self._show_welcome()
     
+    def _build_quick_actions(self):
+        """Create the quick action row below the chat display"""
+        actions_frame = QFrame()
+        actions_frame.setObjectName("actionsFrame")
+        actions_layout = QHBoxLayout()
+        actions_layout.setSpacing(8)
+        actions_layout.setContentsMargins(0, 0, 0, 0)
+        
+        quick_actions = [
+            ("❓ Why", "why"),
+            ("📖 Explain", "explain"),
+            ("🛡️ Action", "action"),
+            ("📊 Risk", "risk"),
+        ]
+        
+        for text, cmd in quick_actions:
+            btn = QPushButton(text)
+            btn.setObjectName("quickAction")
+            btn.clicked.connect(lambda checked, c=cmd: self._handle_quick_action(c))
+            actions_layout.addWidget(btn)
+            self.quick_buttons.append(btn)
+        
+        actions_frame.setLayout(actions_layout)
+        index = self._main_layout.indexOf(self.chat_display) + 1
+        self._main_layout.insertWidget(index, actions_frame)
+    
     def _show_welcome(self):
         """Show welcome message"""
         self.chat_display.clear()
@@ -141,21 +216,69 @@ class AssistantPanel(QWidget):
         self._add_message("system", "Quick commands: why, explain, action, risk")
     
     def explain_alert(self, alert):
-        """Display alert explanation"""
+        """Display alert explanation
+        
+        The explanation has a fixed shape, so it goes into a small cluster
+        of labels above the chat; the chat display is cleared for
+        follow-up questions.
+        """
         self.current_alert = alert
-        self.chat_display.clear()
         
-        self._add_message("system", f"📋 Analyzing: {alert.classification}")
+        # Header and quick buttons only make sense once an alert is selected
+        if not self.quick_buttons:
+            self._build_explanation_header()
+            self._build_quick_actions()
         
-        # Auto-generate initial explanation
-        self._add_message("user", "What is this alert about?")
+        self.explanation_title.setText(f"📋 Analyzing: {alert.classification}")
+        self._set_label_text(self.explanation_answer, self._cached_response("explain", alert))
+        self.explanation_frame.show()
+        self.chat_display.clear()
+    
+    def _build_explanation_header(self):
+        """Create the fixed explanation labels above the chat display"""
+        self.explanation_frame = QFrame()
+        self.explanation_frame.setObjectName("explanationFrame")
+        frame_layout = QVBoxLayout()
+        frame_layout.setContentsMargins(12, 10, 12, 10)
+        frame_layout.setSpacing(6)
+        
+        self.explanation_title = QLabel()
+        self.explanation_title.setObjectName("explanationTitle")
+        question = QLabel("You: What is this alert about?")
+        question.setObjectName("explanationQuestion")
+        self.explanation_answer = QLabel()
+        self.explanation_answer.setObjectName("explanationAnswer")
+        self.explanation_answer.setWordWrap(True)
         
-        explanation = self._generate_explanation(alert)
-        self._add_message("assistant", explanation)
+        for label in (self.explanation_title, question, self.explanation_answer):
+            frame_layout.addWidget(label)
+        self.explanation_frame.setLayout(frame_layout)
         
-        # Enable quick buttons
-        for btn in self.quick_buttons:
-            btn.setEnabled(True)
+        index = self._main_layout.indexOf(self.chat_display)
+        self._main_layout.insertWidget(index, self.explanation_frame)
+    
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set label text, using rich text only when it has **bold** spans"""
+        if "**" in text:
+            label.setTextFormat(Qt.TextFormat.RichText)
+            text = _BOLD_RE.sub(r"<b>\1</b>", html.escape(text, quote=False)).replace("\n", "<br>")
+        else:
+            label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setText(text)
+    
+    @contextmanager
+    def _batched_updates(self):
+        """Group several appends into one document edit and one repaint"""
+        display = self.chat_display
+        display.setUpdatesEnabled(False)
+        cursor = display.textCursor()
+        cursor.beginEditBlock()
+        try:
+            yield
+        finally:
+            cursor.endEditBlock()
+            display.setUpdatesEnabled(True)
     
     def _handle_user_input(self):
         """Process user input"""
@@ -176,20 +299,35 @@ class AssistantPanel(QWidget):
             self._add_message("assistant", "Please select an alert first.")
             return
         
-        self._add_message("user", action.capitalize())
+        with self._batched_updates():
+            self._add_message("user", action.capitalize())
+            
+            response = self._cached_response(action, self.current_alert)
+            self._add_message("assistant", response)
+    
+    def _cached_response(self, action: str, alert) -> str:
+        """Return the generated response for an action, memoized per alert"""
+        generator_name = _RESPONSE_GENERATORS.get(action)
+        if generator_name is None:
+            return "Unknown action"
         
-        if action == "why":
-            response = self._generate_why(self.current_alert)
-        elif action == "explain":
-            response = self._generate_explanation(self.current_alert)
-        elif action == "action":
-            response = self._generate_action(self.current_alert)
-        elif action == "risk":
-            response = self._generate_risk(self.current_alert)
-        else:
-            response = "Unknown action"
+        # Alert summaries are not hashable; key on the fields the text uses
+        key = (
+            action, alert.classification, alert.confidence, alert.anomaly_score,
+            alert.risk_score, alert.priority, alert.source_ip,
+            alert.reasoning, alert.suggested_action,
+        )
+        cache = self._response_cache
+        response = cache.get(key)
+        if response is not None:
+            cache.move_to_end(key)
+            return response
         
-        self._add_message("assistant", response)
+        response = getattr(self, generator_name)(alert)
+        cache[key] = response
+        if len(cache) > self.RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return response
     
     def _generate_response(self, question: str) -> str:
         """Generate response based on question"""
@@ -199,13 +337,13 @@ class AssistantPanel(QWidget):
         alert = self.current_alert
         
         if "why" in question or "reason" in question:
-            return self._generate_why(alert)
+            return self._cached_response("why", alert)
         elif "action" in question or "do" in question or "fix" in question:
-            return self._generate_action(alert)
+            return self._cached_response("action", alert)
         elif "risk" in question or "score" in question or "severity" in question:
-            return self._generate_risk(alert)
+            return self._cached_response("risk", alert)
         elif "explain" in question or "what" in question or "mean" in question:
-            return self._generate_explanation(alert)
+            return self._cached_response("explain", alert)
         elif "source" in question or "ip" in question or "from" in question:
             return f"Source IP: {alert.source_ip or 'Unknown'}\nDestination: {alert.destination_ip or 'Unknown'}"
         else:
@@ -213,82 +351,63 @@ class AssistantPanel(QWidget):
     
     def _answer_general(self, question: str) -> str:
         """Answer general questions"""
-        general_answers = {
-            "help": "I can help you understand alerts. Select an alert and ask:\n• Why was this generated?\n• What should I do?\n• What's the risk level?",
-            "hi": "Hello! I'm your SOC assistant. Select an alert to analyze.",
-            "hello": "Hi there! Ready to help you investigate security alerts.",
-            "commands": "Available commands:\n• why - Get reason for alert\n• explain - Full explanation\n• action - Recommended actions\n• risk - Risk assessment",
-        }
-        
-        for key, answer in general_answers.items():
-            if key in question:
-                return answer
+        match = _GENERAL_KEYWORD_RE.search(question)
+        if match:
+            return _GENERAL_ANSWERS[match.group(1)]
         
         return "I can help analyze security alerts. Select an alert from the table, then ask me questions about it."
     
     def _generate_why(self, alert) -> str:
         """Generate why explanation"""
-        return f"""This alert was generated because:
-
-• **Classification**: {alert.classification} (conf: {alert.confidence:.0%})
-• **Anomaly Score**: {alert.anomaly_score:.3f}
-• **Risk Score**: {alert.risk_score:.3f}
-• **Priority**: {alert.priority}
-
-{alert.reasoning}"""
+        return _WHY_TEMPLATE.format(
+            alert.classification, alert.confidence, alert.anomaly_score,
+            alert.risk_score, alert.priority, alert.reasoning
+        )
     
     def _generate_explanation(self, alert) -> str:
         """Generate detailed explanation"""
-        templates = {
-            "BruteForce": "A brute force attack involves repeated login attempts to guess credentials. Multiple failed authentication attempts from the same source indicate credential stuffing or password guessing.",
-            "PortScan": "Port scanning is reconnaissance activity where an attacker probes network ports to identify running services and potential vulnerabilities.",
-            "DDoS": "Distributed Denial of Service attack floods your systems with traffic to make services unavailable. High volume traffic from multiple sources is a key indicator.",
-            "DataExfiltration": "Data exfiltration involves unauthorized transfer of data outside the network. Large outbound transfers to unusual destinations indicate possible data theft.",
-            "SQLInjection": "SQL injection exploits vulnerabilities in database queries to access or manipulate data through malicious input.",
-            "XSS": "Cross-Site Scripting injects malicious scripts into web pages to steal data or hijack user sessions.",
-            "Benign": "This activity appears to be normal network behavior with no indicators of malicious intent.",
-        }
-        
-        base = templates.get(alert.classification, 
+        base = _CLASSIFICATION_TEMPLATES.get(alert.classification, 
             f"This {alert.classification} pattern indicates potentially malicious activity requiring investigation.")
         
         return f"**{alert.classification}**\n\n{base}"
     
     def _generate_action(self, alert) -> str:
         """Generate recommended action"""
-        return f"""**Recommended Actions:**
-
-{alert.suggested_action}
-
-**Investigation Steps:**
-1. Review source IP reputation: {alert.source_ip or 'N/A'}
-2. Check historical activity for this pattern
-3. Correlate with other security events
-4. Document findings in incident report"""
+        return _ACTION_TEMPLATE.format(alert.suggested_action, alert.source_ip or 'N/A')
     
     def _generate_risk(self, alert) -> str:
         """Generate risk assessment"""
         risk_level = "LOW" if alert.risk_score < 0.3 else "MEDIUM" if alert.risk_score < 0.7 else "HIGH"
         
-        return f"""**Risk Assessment**
-
-• Level: **{risk_level}**
-• Score: {alert.risk_score:.2f}/1.00
-• Priority: {alert.priority}
-• Confidence: {alert.confidence:.0%}
-
-{'⚠️ Requires immediate attention!' if risk_level == 'HIGH' else '✅ Monitor and review as needed.' if risk_level == 'LOW' else '🔍 Investigate when possible.'}"""
+        return _RISK_TEMPLATE.format(
+            risk_level, alert.risk_score, alert.priority, alert.confidence,
+            _RISK_NOTES[risk_level]
+        )
     
     def _add_message(self, role: str, text: str):
-        """Add styled message to chat"""
-        text = text.replace("\n", "<br>")
-        text = text.replace("**", "<b>").replace("**", "</b>")  # Basic bold
-        
-        if role == "user":
-            html = f'<div style="background-color: #0f3460; padding: 10px; border-radius: 8px; margin: 5px 0;"><span style="color: #00d4ff; font-weight: bold;">You:</span> {text}</div>'
-        elif role == "assistant":
-            html = f'<div style="background-color: #16213e; padding: 10px; border-radius: 8px; margin: 5px 0;"><span style="color: #4CAF50; font-weight: bold;">Assistant:</span><br>{text}</div>'
+        """Add styled message to chat as one block, without HTML parsing"""
+        style = _MESSAGE_STYLES.get(role)
+        if style is None:
+            block_fmt, body_fmt, bold_fmt = self._system_block_fmt, self._system_fmt, self._system_bold_fmt
+        else:
+            block_fmt, body_fmt, bold_fmt = self._block_fmts[role], self._body_fmt, self._bold_fmt
+        
+        document = self.chat_display.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if document.isEmpty():
+            cursor.setBlockFormat(block_fmt)
         else:
-            html = f'<div style="color: #888; padding: 5px; font-style: italic;">{text}</div>'
+            cursor.insertBlock(block_fmt)
+        
+        if style is not None:
+            cursor.insertText(style[2], self._label_fmts[role])
+        
+        # Line separators keep a message in one block for the scroll-back cap
+        segments = _BOLD_RE.split(text.replace("\n", "\u2028"))
+        for i, segment in enumerate(segments):
+            if segment:
+                cursor.insertText(segment, bold_fmt if i % 2 else body_fmt)
         
-        self.chat_display.append(html)
+        self.chat_display.moveCursor(QTextCursor.MoveOperation.End)
+        self.chat_display.ensureCursorVisible()
@@ -5,23 +5,35 @@ pipeline logic, or auto-starting ingestion.
 """
 
 import platform
+import time
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QGroupBox, QGridLayout
+    QGroupBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QFont, QColor, QPainter
 
 from ..config import ConfigManager
 from ..kill_switch import KillSwitch
+from ..ingestion.system_log_reader import SystemLogReader
+from .styles import MASTER_QSS, repolish
+
+
+# Repository root (src/soc_copilot/phase4/ui -> root), resolved once at import
+_DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[4]
 
 
 class ToggleSwitch(QFrame):
     """Custom toggle switch widget"""
     
+    # Knob positions inside the 2px border + 2px margin
+    KNOB_OFF_X = 4
+    KNOB_ON_X = 32
+    KNOB_Y = 4
+    
     def __init__(self, initial_state: bool = False, on_toggle=None):
         super().__init__()
         self._state = initial_state
@@ -33,71 +45,28 @@ class ToggleSwitch(QFrame):
         self.setFixedSize(60, 30)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
-        layout = QHBoxLayout()
-        layout.setContentsMargins(2, 2, 2, 2)
-        
-        self.knob = QLabel()
+        # No layout: the knob is positioned directly so toggling is a move
+        self.knob = QLabel(self)
+        self.knob.setObjectName("toggleKnob")
         self.knob.setFixedSize(24, 24)
-        
-        if self._state:
-            layout.addStretch()
-            layout.addWidget(self.knob)
-        else:
-            layout.addWidget(self.knob)
-            layout.addStretch()
-        
-        self.setLayout(layout)
+        self._move_knob()
     
     def _update_style(self):
-        if self._state:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #4CAF50;
-                    border-radius: 15px;
-                    border: 2px solid #388E3C;
-                }
-            """)
-            self.knob.setStyleSheet("""
-                QLabel {
-                    background-color: white;
-                    border-radius: 12px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #666666;
-                    border-radius: 15px;
-                    border: 2px solid #444444;
-                }
-            """)
-            self.knob.setStyleSheet("""
-                QLabel {
-                    background-color: #cccccc;
-                    border-radius: 12px;
-                }
-            """)
+        self.setProperty("on", self._state)
+        repolish(self)
+        repolish(self.knob)
     
     def mousePressEvent(self, event):
         self._state = not self._state
         self._update_style()
-        self._rebuild_layout()
+        self._move_knob()
         if self._on_toggle:
             self._on_toggle(self._state)
     
-    def _rebuild_layout(self):
-        """Rebuild layout to move knob"""
-        layout = self.layout()
-        while layout.count():
-            item = layout.takeAt(0)
-            # Don't delete the knob widget
-        
-        if self._state:
-            layout.addStretch()
-            layout.addWidget(self.knob)
-        else:
-            layout.addWidget(self.knob)
-            layout.addStretch()
+    def _move_knob(self):
+        """Slide knob to the side matching the current state"""
+        x = self.KNOB_ON_X if self._state else self.KNOB_OFF_X
+        self.knob.move(x, self.KNOB_Y)
     
     def is_on(self) -> bool:
         return self._state
@@ -106,42 +75,94 @@ class ToggleSwitch(QFrame):
         if self._state != state:
             self._state = state
             self._update_style()
-            self._rebuild_layout()
+            self._move_knob()
 
 
-class StatusIndicator(QFrame):
-    """Status indicator with colored dot and label"""
+class StatusGrid(QWidget):
+    """Two-column grid of status rows (dot, label, value) painted in one pass
+    
+    Replaces a frame + three labels + layout per row; an update only
+    repaints the row's cell.
+    """
     
-    def __init__(self, label: str, status: str = "Unknown", color: str = "#888888"):
+    COLUMNS = 2
+    ROW_HEIGHT = 30
+    DOT_SIZE = 10
+    PADDING = 5
+    SPACING = 8
+    LABEL_COLOR = QColor("#888888")
+    VALUE_COLOR = QColor("#ffffff")
+    
+    def __init__(self):
         super().__init__()
-        self._init_ui(label, status, color)
+        self._keys = []
+        self._rows = {}  # key -> [label, status, QColor]
+        self._label_font = QFont(self.font())
+        self._label_font.setBold(True)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
     
-    def _init_ui(self, label: str, status: str, color: str):
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Colored indicator dot
-        self.dot = QLabel("●")
-        self.dot.setStyleSheet(f"color: {color}; font-size: 16px;")
-        layout.addWidget(self.dot)
-        
-        # Label
-        label_widget = QLabel(f"{label}:")
-        label_widget.setStyleSheet("color: #888888; font-weight: bold;")
-        layout.addWidget(label_widget)
-        
-        # Status value
-        self.status_label = QLabel(status)
-        self.status_label.setStyleSheet("color: #ffffff;")
-        layout.addWidget(self.status_label)
-        
-        layout.addStretch()
-        self.setLayout(layout)
+    def add_status(self, key: str, label: str, status: str, color: str):
+        """Append a status row"""
+        self._keys.append(key)
+        self._rows[key] = [f"{label}:", status, QColor(color)]
+        self.updateGeometry()
+        self.update()
     
-    def update_status(self, status: str, color: str):
-        """Update status text and color"""
-        self.status_label.setText(status)
-        self.dot.setStyleSheet(f"color: {color}; font-size: 16px;")
+    def update_status(self, key: str, status: str, color: str):
+        """Update a row, repainting only its cell and only when it changed"""
+        row = self._rows[key]
+        if row[1] == status and row[2].name() == QColor(color).name():
+            return
+        row[1] = status
+        row[2] = QColor(color)
+        self.update(self._cell_rect(self._keys.index(key)))
+    
+    def status(self, key: str) -> tuple:
+        """Current (status, color) of a row"""
+        _, status, color = self._rows[key]
+        return status, color.name()
+    
+    def _cell_rect(self, index: int) -> QRect:
+        width = self.width() // self.COLUMNS
+        row, col = divmod(index, self.COLUMNS)
+        return QRect(col * width, row * self.ROW_HEIGHT, width, self.ROW_HEIGHT)
+    
+    def sizeHint(self) -> QSize:
+        rows = -(-len(self._keys) // self.COLUMNS)
+        return QSize(400, rows * self.ROW_HEIGHT)
+    
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        
+        for index, key in enumerate(self._keys):
+            cell = self._cell_rect(index)
+            if not cell.intersects(event.rect()):
+                continue
+            label, status, color = self._rows[key]
+            
+            x = cell.x() + self.PADDING
+            dot_y = cell.center().y() - self.DOT_SIZE // 2
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(color)
+            painter.drawEllipse(x, dot_y, self.DOT_SIZE, self.DOT_SIZE)
+            x += self.DOT_SIZE + self.SPACING
+            
+            text_rect = QRect(x, cell.y(), cell.right() - x, cell.height())
+            painter.setFont(self._label_font)
+            painter.setPen(self.LABEL_COLOR)
+            bounds = painter.drawText(text_rect, align, label)
+            
+            text_rect.setLeft(bounds.right() + self.SPACING)
+            painter.setFont(self.font())
+            painter.setPen(self.VALUE_COLOR)
+            painter.drawText(text_rect, align, status)
+        
+        painter.end()
 
 
 class ConfigPanel(QWidget):
@@ -153,13 +174,15 @@ class ConfigPanel(QWidget):
     - Read-only status indicators for system state
     """
     
+    # Seconds a system log permission check is reused (permissions rarely change)
+    PERMISSION_CHECK_TTL = 60.0
+    
     def __init__(self, bridge=None, project_root: Optional[Path] = None):
         super().__init__()
         self.bridge = bridge
+        self._perm_cache = None  # (status, color, timestamp)
         
-        if project_root is None:
-            project_root = Path(__file__).parent.parent.parent.parent.parent
-        self.project_root = Path(project_root)
+        self.project_root = Path(project_root) if project_root else _DEFAULT_PROJECT_ROOT
         
         self.config_manager = ConfigManager(self.project_root)
         self.kill_switch = KillSwitch(self.project_root)
@@ -179,18 +202,12 @@ class ConfigPanel(QWidget):
         
         # Restart warning (hidden by default)
         self.restart_warning = QFrame()
-        self.restart_warning.setStyleSheet("""
-            QFrame {
-                background-color: #FFC107;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.restart_warning.setObjectName("restartWarning")
         warning_layout = QHBoxLayout()
         warning_icon = QLabel("⚠️")
         warning_icon.setFont(QFont("Arial", 18))
         warning_text = QLabel("Configuration changed. Restart required for changes to take effect.")
-        warning_text.setStyleSheet("color: #000000; font-weight: bold;")
+        warning_text.setObjectName("warningText")
         warning_layout.addWidget(warning_icon)
         warning_layout.addWidget(warning_text)
         warning_layout.addStretch()
@@ -200,24 +217,10 @@ class ConfigPanel(QWidget):
         
         # System Logs Toggle Section
         toggle_group = QGroupBox("System Log Ingestion")
-        toggle_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #444444;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         toggle_layout = QHBoxLayout()
         
         toggle_label = QLabel("Enable System Logs:")
-        toggle_label.setStyleSheet("color: #ffffff;")
+        toggle_label.setObjectName("toggleLabel")
         toggle_layout.addWidget(toggle_label)
         
         initial_state = self.config_manager.get_system_logs_enabled()
@@ -227,7 +230,7 @@ class ConfigPanel(QWidget):
         toggle_layout.addStretch()
         
         toggle_note = QLabel("Changes require application restart")
-        toggle_note.setStyleSheet("color: #888888; font-style: italic;")
+        toggle_note.setObjectName("toggleNote")
         toggle_layout.addWidget(toggle_note)
         
         toggle_group.setLayout(toggle_layout)
@@ -235,42 +238,15 @@ class ConfigPanel(QWidget):
         
         # Status Indicators Section
         status_group = QGroupBox("System Status")
-        status_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #444444;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        status_layout = QGridLayout()
-        status_layout.setSpacing(10)
+        status_layout = QVBoxLayout()
         
-        # System Logs Enabled
-        self.logs_indicator = StatusIndicator("System Logs", "Disabled", "#666666")
-        status_layout.addWidget(self.logs_indicator, 0, 0)
-        
-        # Operating System
-        self.os_indicator = StatusIndicator("Operating System", platform.system(), "#2196F3")
-        status_layout.addWidget(self.os_indicator, 0, 1)
-        
-        # Permission Status
-        self.perm_indicator = StatusIndicator("Permissions", "Unknown", "#888888")
-        status_layout.addWidget(self.perm_indicator, 1, 0)
-        
-        # Kill Switch
-        self.kill_indicator = StatusIndicator("Kill Switch", "Inactive", "#4CAF50")
-        status_layout.addWidget(self.kill_indicator, 1, 1)
-        
-        # Ingestion Status
-        self.ingestion_indicator = StatusIndicator("Ingestion", "Not Started", "#666666")
-        status_layout.addWidget(self.ingestion_indicator, 2, 0)
+        self.status_grid = StatusGrid()
+        self.status_grid.add_status("logs", "System Logs", "Disabled", "#666666")
+        self.status_grid.add_status("os", "Operating System", platform.system(), "#2196F3")
+        self.status_grid.add_status("perm", "Permissions", "Unknown", "#888888")
+        self.status_grid.add_status("kill", "Kill Switch", "Inactive", "#4CAF50")
+        self.status_grid.add_status("ingestion", "Ingestion", "Not Started", "#666666")
+        status_layout.addWidget(self.status_grid)
         
         status_group.setLayout(status_layout)
         layout.addWidget(status_group)
@@ -280,11 +256,14 @@ class ConfigPanel(QWidget):
             "This panel shows the current configuration and system status. "
             "Only the system logs toggle can be modified. All other indicators are read-only."
         )
-        info_label.setStyleSheet("color: #666666; font-style: italic;")
+        info_label.setObjectName("infoLabel")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
         layout.addStretch()
+        
+        # One shared sheet for the whole panel, matched by object name
+        self.setStyleSheet(MASTER_QSS)
         self.setLayout(layout)
     
     def _on_toggle_changed(self, new_state: bool):
@@ -292,62 +271,76 @@ class ConfigPanel(QWidget):
         success = self.config_manager.set_system_logs_enabled(new_state)
         if success:
             self._config_changed = True
-            self.restart_warning.setVisible(True)
+            if self.restart_warning.isHidden():
+                self.restart_warning.setVisible(True)
             self._update_logs_indicator(new_state)
     
     def _update_logs_indicator(self, enabled: bool):
         """Update system logs status indicator"""
         if enabled:
-            self.logs_indicator.update_status("Enabled", "#4CAF50")
+            self.status_grid.update_status("logs", "Enabled", "#4CAF50")
         else:
-            self.logs_indicator.update_status("Disabled", "#666666")
+            self.status_grid.update_status("logs", "Disabled", "#666666")
     
-    def _refresh_status(self):
-        """Refresh all status indicators"""
-        # System Logs
-        logs_enabled = self.config_manager.get_system_logs_enabled()
-        self._update_logs_indicator(logs_enabled)
+    def _permission_status(self) -> tuple:
+        """System log permission (status, color), cached for PERMISSION_CHECK_TTL"""
+        now = time.monotonic()
+        cached = self._perm_cache
+        if cached is not None and now - cached[2] < self.PERMISSION_CHECK_TTL:
+            return cached[0], cached[1]
         
-        # Permissions (check system log access)
         try:
-            from ..ingestion.system_log_reader import SystemLogReader
-            reader = SystemLogReader()
-            perm_check = reader.validate_system_log_access()
+            perm_check = SystemLogReader().validate_system_log_access()
             if perm_check.has_permission:
-                self.perm_indicator.update_status("OK", "#4CAF50")
+                status = ("OK", "#4CAF50")
             elif perm_check.requires_elevation:
-                self.perm_indicator.update_status("Elevation Required", "#FFC107")
+                status = ("Elevation Required", "#FFC107")
             else:
-                self.perm_indicator.update_status("Limited", "#FFC107")
+                status = ("Limited", "#FFC107")
         except Exception:
-            self.perm_indicator.update_status("Unknown", "#888888")
+            status = ("Unknown", "#888888")
+        
+        self._perm_cache = (*status, now)
+        return status
+    
+    def _ingestion_status(self) -> tuple:
+        """Ingestion (status, color) from bridge stats"""
+        if not self.bridge:
+            return ("Not Started", "#666666")
+        try:
+            stats = self.bridge.get_stats()
+            running = stats.get('running', False)
+            shutdown = stats.get('shutdown_flag', False)
+            sources = stats.get('sources_count', 0)
+            
+            if shutdown:
+                return ("Stopped", "#FFC107")
+            elif running and sources > 0:
+                return ("Active", "#4CAF50")
+            elif sources > 0:
+                return ("Configured", "#2196F3")
+            else:
+                return ("Not Started", "#666666")
+        except Exception:
+            return ("Unknown", "#888888")
+    
+    def _refresh_status(self):
+        """Refresh all status indicators, repainting only what changed"""
+        # System Logs
+        logs_enabled = self.config_manager.get_system_logs_enabled()
+        self._update_logs_indicator(logs_enabled)
+        
+        # Permissions (check system log access)
+        self.status_grid.update_status("perm", *self._permission_status())
         
         # Kill Switch
         if self.kill_switch.is_active():
-            self.kill_indicator.update_status("Active", "#f44336")
+            self.status_grid.update_status("kill", "Active", "#f44336")
         else:
-            self.kill_indicator.update_status("Inactive", "#4CAF50")
+            self.status_grid.update_status("kill", "Inactive", "#4CAF50")
         
         # Ingestion Status
-        if self.bridge:
-            try:
-                stats = self.bridge.get_stats()
-                running = stats.get('running', False)
-                shutdown = stats.get('shutdown_flag', False)
-                sources = stats.get('sources_count', 0)
-                
-                if shutdown:
-                    self.ingestion_indicator.update_status("Stopped", "#FFC107")
-                elif running and sources > 0:
-                    self.ingestion_indicator.update_status("Active", "#4CAF50")
-                elif sources > 0:
-                    self.ingestion_indicator.update_status("Configured", "#2196F3")
-                else:
-                    self.ingestion_indicator.update_status("Not Started", "#666666")
-            except Exception:
-                self.ingestion_indicator.update_status("Unknown", "#888888")
-        else:
-            self.ingestion_indicator.update_status("Not Started", "#666666")
+        self.status_grid.update_status("ingestion", *self._ingestion_status())
     
     def refresh(self):
         """Public method to refresh status (called by timer)"""
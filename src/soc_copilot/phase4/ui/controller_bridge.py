@@ -1,25 +1,105 @@
 """Read-only bridge between UI and AppController"""
 
-from typing import List, Optional, Dict, Any
+import csv
+import ctypes
+import sys
+from itertools import islice
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime
-from ..controller import AppController, AnalysisResult
+from functools import cached_property, lru_cache
+from PyQt6.QtCore import QObject, pyqtSignal
+from soc_copilot.core.logging import get_logger
+from ..controller import AppController, AnalysisResult, AlertSummary
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+logger = get_logger(__name__)
+
+
+# Win32 admin check, bound once at import (None off Windows)
+_is_user_admin = None
+if sys.platform == 'win32':
+    try:
+        _is_user_admin = ctypes.windll.shell32.IsUserAnAdmin
+    except Exception:
+        pass
+
+# (backend name, parser class) for EVTX files, resolved on first use
+_EVTX_BACKEND = None
+
+
+def _evtx_backend() -> tuple:
+    """Import the EVTX parser once: Rust `evtx` bindings, else python-evtx"""
+    global _EVTX_BACKEND
+    if _EVTX_BACKEND is None:
+        try:
+            from evtx import PyEvtxParser
+            _EVTX_BACKEND = ("rust", PyEvtxParser)
+        except ImportError:
+            try:
+                from Evtx.Evtx import Evtx
+                _EVTX_BACKEND = ("python", Evtx)
+            except ImportError:
+                _EVTX_BACKEND = (None, None)
+    return _EVTX_BACKEND
+
+
+# Suffixes whose format is taken at face value
+_SUFFIX_FORMATS = {'.csv': 'csv', '.json': 'json', '.jsonl': 'json', '.evtx': 'evtx'}
+_EVTX_MAGIC = b'ElfFile\x00'
 
 
-class ControllerBridge:
+@lru_cache(maxsize=128)
+def _sniff_format(path: str, mtime_ns: int) -> str:
+    """Guess a log file's format from its first bytes (cached per path and mtime)"""
+    with open(path, 'rb') as f:
+        head = f.read(512)
+    if head.startswith(_EVTX_MAGIC):
+        return 'evtx'
+    head = head.lstrip()
+    # "[" alone is too weak: bracketed timestamps are common in text logs
+    if head.startswith(b'{') or (head.startswith(b'[') and head[1:].lstrip()[:1] in (b'{', b']')):
+        return 'json'
+    return 'text'
+
+
+class ControllerBridge(QObject):
     """Adapter for UI to access AppController with file upload support and status reporting"""
     
+    # Emitted after a batch added results; may fire from a worker thread
+    alerts_changed = pyqtSignal()
+    # Emitted when sources, ingestion or the kill switch changed; may fire
+    # from a worker thread
+    stats_changed = pyqtSignal()
+    
+    # Records handed to process_batch per call when analyzing a file
+    BATCH_SIZE = 1000
+    # Worker threads for the Rust EVTX parser (0 = one per CPU)
+    EVTX_THREADS = 0
+    # Block size for reading plain-text logs
+    TEXT_READ_SIZE = 1 << 20
+    
     def __init__(self, controller: AppController):
+        super().__init__()
         self._controller = controller
-        self._permission_status = None
-        self._check_permissions()
+        self._kill_switch_active = False
     
-    def _check_permissions(self):
-        """Check system permissions on init"""
-        import ctypes
-        import sys
-        
-        self._permission_status = {
+    @cached_property
+    def _permission_status(self) -> Dict[str, Any]:
+        """Check system permissions on first use"""
+        status = {
             "has_permission": False,
             "elevation_required": True,
             "reason": "Administrator rights required",
@@ -27,19 +107,58 @@ class ControllerBridge:
         }
         
         # Check if running as admin on Windows
-        if sys.platform == 'win32':
+        if _is_user_admin is not None:
             try:
-                self._permission_status["has_permission"] = ctypes.windll.shell32.IsUserAnAdmin()
-                if self._permission_status["has_permission"]:
-                    self._permission_status["reason"] = "Full access"
-                    self._permission_status["elevation_required"] = False
+                status["has_permission"] = _is_user_admin()
+                if status["has_permission"]:
+                    status["reason"] = "Full access"
+                    status["elevation_required"] = False
             except Exception:
                 pass
+        
+        return status
     
     def get_latest_alerts(self, limit: int = 50) -> List[AnalysisResult]:
         """Get latest analysis results (read-only)"""
         return self._controller.get_results(limit=limit)
     
+    def get_results_since(self, cursor: int) -> Tuple[List[AnalysisResult], int]:
+        """Get results added after `cursor` and the new cursor (read-only)"""
+        return self._controller.result_store.get_since(cursor)
+    
+    def get_priority_counts(self) -> Dict[str, int]:
+        """Alert counts by priority across stored results (read-only)"""
+        return self._controller.result_store.priority_counts()
+    
+    def get_recent_alerts_for_timeline(self, limit: int = 15) -> List[Tuple[str, AlertSummary]]:
+        """Get the newest alerts as (batch_id, alert) pairs, newest first (read-only)"""
+        return self._controller.result_store.get_recent_alerts(limit)
+    
+    def get_dashboard_snapshot(self, timeline_limit: int = 15) -> Dict[str, Any]:
+        """Counts, newest timeline alerts and stats for one dashboard tick
+        
+        Counts and alerts come from a single locked read of the result
+        store, so they always describe the same set of results.
+        """
+        counts, recent = self._controller.result_store.snapshot(timeline_limit)
+        return {
+            "counts": counts,
+            "recent_alerts": recent,
+            "stats": self.get_stats(),
+        }
+    
+    def get_priority_summary(self) -> Dict[str, Any]:
+        """Alert counts plus headline status, without fetching any results"""
+        stats = self.get_stats()
+        return {
+            **self._controller.result_store.priority_counts(),
+            "pipeline_loaded": stats.get("pipeline_loaded", False),
+            "results_stored": stats.get("results_stored", 0),
+            "sources_count": stats.get("sources_count", 0),
+            "running": stats.get("running", False),
+            "shutdown_flag": stats.get("shutdown_flag", False),
+        }
+    
     def get_alert_by_id(self, batch_id: str) -> Optional[AnalysisResult]:
         """Get specific result by ID (read-only)"""
         return self._controller.get_result_by_id(batch_id)
@@ -83,6 +202,14 @@ class ControllerBridge:
             "checked_at": datetime.now().isoformat()
         }
     
+    def poll_kill_switch(self) -> bool:
+        """Check the kill switch, emitting stats_changed when it flipped"""
+        active = bool(self.get_kill_switch_status()["active"])
+        if active != self._kill_switch_active:
+            self._kill_switch_active = active
+            self.stats_changed.emit()
+        return active
+    
     def get_permission_status(self) -> Dict[str, Any]:
         """Get permission check results (read-only)"""
         return self._permission_status
@@ -92,82 +219,200 @@ class ControllerBridge:
         return self._controller.result_store.count()
     
     def add_file_source(self, filepath: str) -> bool:
-        """Add a file for analysis. Process immediately."""
+        """Add a file for analysis. Process immediately, one batch at a time.
+        
+        Returns True if the whole file was analyzed, or if a later error
+        stopped it after some batches were already stored.
+        """
+        path = Path(filepath)
+        batches = 0
         try:
-            path = Path(filepath)
             if not path.exists():
                 return False
             
-            # Read and parse file content
-            records = self._parse_file(path)
-            if records:
-                self._controller.process_batch(records)
+            # Stream records so memory stays O(batch) rather than O(file)
+            for batch in self._iter_batches(self._iter_file(path), self.BATCH_SIZE):
+                self._process_batch(batch)
+                batches += 1
             return True
-        except Exception:
-            return False
-    
-    def _parse_file(self, path: Path) -> List[dict]:
-        """Parse log file and return records"""
-        records = []
-        suffix = path.suffix.lower()
-        
-        if suffix == '.csv':
-            records = self._parse_csv(path)
-        elif suffix == '.json':
-            records = self._parse_json(path)
-        elif suffix == '.evtx':
-            records = self._parse_evtx(path)
+        except Exception as e:
+            if batches:
+                logger.warning("file_source_partial", path=str(path), batches=batches, error=str(e))
+            return batches > 0
+        finally:
+            if batches:
+                self.stats_changed.emit()
+    
+    def _process_batch(self, batch: List[dict]):
+        """Analyze one batch and notify listeners when it produced a result"""
+        if self._controller.process_batch(batch) is not None:
+            self.alerts_changed.emit()
+    
+    @staticmethod
+    def _iter_batches(records: Iterator[dict], size: int) -> Iterator[List[dict]]:
+        """Slice a record stream into lists of at most `size` records"""
+        while True:
+            batch = list(islice(records, size))
+            if not batch:
+                return
+            yield batch
+    
+    def _iter_file(self, path: Path) -> Iterator[dict]:
+        """Yield records from a log file, dispatching on its format"""
+        fmt = _SUFFIX_FORMATS.get(path.suffix.lower())
+        sniffed = fmt is None
+        if sniffed:
+            # .log/.txt/unknown: the content decides
+            fmt = _sniff_format(str(path), path.stat().st_mtime_ns)
+        
+        if fmt == 'csv':
+            return self._iter_csv(path)
+        elif fmt == 'json':
+            # A sniffed guess can be wrong; such files still read as text
+            return self._iter_json(path, text_fallback=sniffed)
+        elif fmt == 'evtx':
+            return self._iter_evtx(path)
         else:
-            # Plain text - treat each line as a log
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
+            return self._iter_text(path)
+    
+    def _iter_text(self, path: Path) -> Iterator[dict]:
+        """Plain text - treat each line as a log
+        
+        The file is read in TEXT_READ_SIZE blocks that are cut at the last
+        newline, so each block is decoded and split in one call.
+        """
+        with open(path, 'rb') as f:
+            carry = b''
+            while True:
+                data = f.read(self.TEXT_READ_SIZE)
+                if not data:
+                    break
+                data = carry + data
+                cut = data.rfind(b'\n') + 1
+                carry = data[cut:]
+                for line in data[:cut].decode('utf-8', errors='ignore').split('\n'):
                     line = line.strip()
                     if line:
-                        records.append({"raw_line": line})
-        
-        return records
+                        yield {"raw_line": line}
+            
+            line = carry.decode('utf-8', errors='ignore').strip()
+            if line:
+                yield {"raw_line": line}
     
-    def _parse_csv(self, path: Path) -> List[dict]:
-        """Parse CSV file"""
-        import csv
-        records = []
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            reader = csv.DictReader(f)
+    def _iter_csv(self, path: Path) -> Iterator[dict]:
+        """Parse CSV file, keeping each record's source text as raw_line
+        
+        One csv.reader runs over the whole file; the lines it consumes are
+        collected on the way in, so quoted fields spanning lines keep their
+        full text too.
+        """
+        consumed = []
+        
+        def tap(f):
+            for line in f:
+                consumed.append(line)
+                yield line
+        
+        with open(path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+            reader = csv.reader(tap(f))
+            header = next(reader, None)
+            if header is None:
+                return
+            consumed.clear()
             for row in reader:
-                # Create raw_line from the CSV row
-                raw_line = ','.join(f"{k}={v}" for k, v in row.items())
-                records.append({"raw_line": raw_line, **row})
-        return records
-    
-    def _parse_json(self, path: Path) -> List[dict]:
-        """Parse JSON file"""
-        import json
-        records = []
+                raw_line = ''.join(consumed).rstrip('\r\n')
+                consumed.clear()
+                if not row:
+                    continue
+                record = {"raw_line": raw_line}
+                record.update(zip(header, row))
+                yield record
+    
+    def _iter_json(self, path: Path, text_fallback: bool = False) -> Iterator[dict]:
+        """Parse JSON file: newline-delimited objects or a single document
+        
+        JSONL lines are kept verbatim as raw_line; only records from a
+        JSON array/object document have to be serialized again. With
+        `text_fallback`, lines and documents that are not JSON are read
+        as plain text instead of being skipped or failing the file.
+        """
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                for item in data:
-                    raw_line = json.dumps(item)
-                    records.append({"raw_line": raw_line, **item})
-            elif isinstance(data, dict):
-                raw_line = json.dumps(data)
-                records.append({"raw_line": raw_line, **data})
-        return records
-    
-    def _parse_evtx(self, path: Path) -> List[dict]:
-        """Parse Windows Event Log (EVTX) file"""
+            first_line = f.readline()
+            try:
+                first = _json_loads(first_line)
+            except ValueError:
+                first = None
+            
+            if isinstance(first, dict):
+                yield {"raw_line": first_line.strip(), **first}
+                skipped = 0
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # A malformed line is dropped without losing the rest of the file
+                    try:
+                        record = _json_loads(line)
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        yield {"raw_line": line, **record}
+                    elif text_fallback:
+                        yield {"raw_line": line}
+                    else:
+                        skipped += 1
+                if skipped:
+                    logger.warning("json_lines_skipped", path=str(path), skipped=skipped)
+                return
+            
+            try:
+                data = _json_loads(first_line + f.read())
+            except ValueError:
+                if not text_fallback:
+                    raise
+                # Sniffed as JSON but is not; read it as the text log it is
+                yield from self._iter_text(path)
+                return
+        
+        if isinstance(data, list):
+            skipped = 0
+            for item in data:
+                if isinstance(item, dict):
+                    yield {"raw_line": _json_dumps(item), **item}
+                else:
+                    skipped += 1
+            if skipped:
+                logger.warning("json_items_skipped", path=str(path), skipped=skipped)
+        elif isinstance(data, dict):
+            yield {"raw_line": _json_dumps(data), **data}
+    
+    def _iter_evtx(self, path: Path) -> Iterator[dict]:
+        """Parse Windows Event Log (EVTX) file
+        
+        Prefers the Rust-backed `evtx` bindings and falls back to the
+        pure-Python python-evtx package when they are not installed. A
+        file that cannot be read at all yields nothing; a parser error
+        after records were yielded is raised, so add_file_source reports
+        the file as partially ingested instead of complete.
+        """
+        backend, parser_class = _evtx_backend()
+        yielded = False
         try:
-            from Evtx.Evtx import Evtx
-            records = []
-            with Evtx(str(path)) as log:
-                for record in log.records():
-                    xml = record.xml()
-                    records.append({"raw_line": xml})
-            return records
+            if backend == "rust":
+                parser = parser_class(str(path), number_of_threads=self.EVTX_THREADS)
+                for record in parser.records():
+                    yield {"raw_line": record["data"]}
+                    yielded = True
+            elif backend == "python":
+                with parser_class(str(path)) as log:
+                    for record in log.records():
+                        yield {"raw_line": record.xml()}
+                        yielded = True
         except Exception:
-            return []
+            if yielded:
+                raise
+            return
     
     def start_ingestion(self):
         """Placeholder for ingestion start (files are processed immediately)"""
-        pass
-
+        self.stats_changed.emit()
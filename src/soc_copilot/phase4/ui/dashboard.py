@@ -12,20 +12,42 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
     QPushButton, QFileDialog, QProgressBar, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 from datetime import datetime
 
+from .ingest_worker import FileIngestJob
+from .styles import MASTER_QSS
 from .dashboard_components import (
+    AlertRow,
     ThreatLevelBanner,
     RecentAlertsTimeline,
     QuickActionsBar,
     CompactMetricCard,
     SystemHealthGrid,
-    EmptyStateCard
+    EmptyStateCard,
+    StaticTextLabel
 )
 
 
+# Timeline priority per AlertSummary.priority_bucket (info folds into low)
+_TIMELINE_PRIORITIES = ("critical", "high", "medium", "low", "low")
+
+# Upload progress bar style, built once per process
+_PROGRESS_QSS = """
+    QProgressBar {
+        border: none;
+        border-radius: 3px;
+        background-color: #1a1a2e;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #00d4ff, stop:1 #00ff88);
+        border-radius: 3px;
+    }
+"""
+
+
 class Dashboard(QWidget):
     """Modern SOC Dashboard with Zone-Based Layout
     
@@ -40,21 +62,47 @@ class Dashboard(QWidget):
     navigate_to_settings = pyqtSignal()
     alert_selected = pyqtSignal(str, str)  # batch_id, classification
     
+    REFRESH_INTERVAL_MS = 3000
+    MIN_REFRESH_INTERVAL_MS = 1500
+    MAX_REFRESH_INTERVAL_MS = 30000
+    REFRESH_COALESCE_MS = 200
+    
     def __init__(self, bridge):
         super().__init__()
         self.bridge = bridge
         self._last_counts = {"total": 0, "critical": 0, "high": 0, "medium": 0, "low": 0}
+        self._last_fingerprint = None
+        self._trends_shown = False
+        self._last_health = None
+        self._interval = self.REFRESH_INTERVAL_MS
+        self._ingest_job = None
+        self._ingest_running = False
         self._init_ui()
         
-        # Adaptive polling - 3 seconds (reduced from 1.5s for performance)
-        self.timer = QTimer()
+        # Refresh when the bridge reports new results, coalescing bursts
+        # into at most one refresh per REFRESH_COALESCE_MS
+        self._refresh_pending = QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(self.REFRESH_COALESCE_MS)
+        self._refresh_pending.timeout.connect(self.refresh)
+        self.bridge.alerts_changed.connect(self._schedule_refresh)
+        
+        # Adaptive polling as a fallback - backs off to a 30 s heartbeat
+        # while idle, paused while the dashboard is hidden. A coarse timer
+        # avoids raising the system timer resolution.
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.refresh)
-        self.timer.start(3000)
+        self.timer.start(self._interval)
         
         # Initial refresh
         self.refresh()
     
     def _init_ui(self):
+        # One shared sheet styles the dashboard components, matched by
+        # class name, object name and dynamic property
+        self.setStyleSheet(MASTER_QSS)
+        
         layout = QVBoxLayout()
         layout.setSpacing(12)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -78,12 +126,10 @@ class Dashboard(QWidget):
         self.medium_card = CompactMetricCard("Medium", "medium")
         self.low_card = CompactMetricCard("Low", "low")
         
-        # Connect card clicks to filtered navigation
-        self.total_card.clicked.connect(lambda p: self.navigate_to_alerts.emit())
-        self.critical_card.clicked.connect(lambda p: self.navigate_to_alerts_filtered.emit("critical"))
-        self.high_card.clicked.connect(lambda p: self.navigate_to_alerts_filtered.emit("high"))
-        self.medium_card.clicked.connect(lambda p: self.navigate_to_alerts_filtered.emit("medium"))
-        self.low_card.clicked.connect(lambda p: self.navigate_to_alerts_filtered.emit("low"))
+        # Connect card clicks to filtered navigation (cards emit their priority)
+        for card in (self.total_card, self.critical_card, self.high_card,
+                     self.medium_card, self.low_card):
+            card.clicked.connect(self._on_card_clicked)
         
         metrics_layout.addWidget(self.total_card)
         metrics_layout.addWidget(self.critical_card)
@@ -115,24 +161,10 @@ class Dashboard(QWidget):
         layout.addLayout(middle_row)
         
         # ─────────────────────────────────────────────────────────────
-        # Progress bar for file uploads (hidden by default)
+        # Progress bar for file uploads (created on first upload)
         # ─────────────────────────────────────────────────────────────
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setFixedHeight(6)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 3px;
-                background-color: #1a1a2e;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00d4ff, stop:1 #00ff88);
-                border-radius: 3px;
-            }
-        """)
-        layout.addWidget(self.progress_bar)
+        self.progress_bar = None
+        self._progress_index = layout.count()
         
         # ─────────────────────────────────────────────────────────────
         # ZONE F: Recent Alerts Timeline (Tertiary - scrollable)
@@ -146,50 +178,87 @@ class Dashboard(QWidget):
         # Footer: Last update time
         # ─────────────────────────────────────────────────────────────
         footer = QHBoxLayout()
-        self.last_update_label = QLabel("")
+        self.last_update_label = StaticTextLabel("", color="#555555")
         self.last_update_label.setFont(QFont("Segoe UI", 10))
-        self.last_update_label.setStyleSheet("color: #555555;")
         footer.addStretch()
         footer.addWidget(self.last_update_label)
         layout.addLayout(footer)
         
         self.setLayout(layout)
     
+    def _schedule_refresh(self):
+        """Refresh at most once per REFRESH_COALESCE_MS while notifications arrive"""
+        if not self._refresh_pending.isActive():
+            self._refresh_pending.start()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start(self._interval)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+    
     def refresh(self):
         """Refresh dashboard with current data"""
+        if not self.isVisible():
+            return
+        
+        # Refresh time, shared by the footer and every timeline row
+        now_str = datetime.now().strftime("%H:%M:%S")
+        
+        # Collapse all widget updates below into a single repaint
+        self.setUpdatesEnabled(False)
         try:
-            results = self.bridge.get_latest_alerts(limit=100)
+            # Counts, timeline rows and stats in one bridge call
+            snapshot = self.bridge.get_dashboard_snapshot(
+                timeline_limit=RecentAlertsTimeline.MAX_ITEMS
+            )
+            stats = snapshot["stats"]
+            
+            # Count by priority (maintained by the result store on insert)
+            counts = snapshot["counts"]
+            total = counts["total"]
+            critical = counts["critical"]
+            high = counts["high"]
+            medium = counts["medium"]
+            # Anything not critical/high/medium is shown as low here
+            low = counts["low"] + counts["info"]
+            
+            # Only the rows the timeline renders are fetched
+            recent = snapshot["recent_alerts"]
             
-            # Count by priority
-            total = critical = high = medium = low = 0
-            alerts_data = []
+            fingerprint = (
+                total, critical, high, medium, low,
+                tuple((batch_id, alert.alert_id) for batch_id, alert in recent),
+            )
+            changed = fingerprint != self._last_fingerprint
+            self._last_fingerprint = fingerprint
+            self._set_interval(
+                self.MIN_REFRESH_INTERVAL_MS if changed
+                else min(self._interval * 2, self.MAX_REFRESH_INTERVAL_MS)
+            )
             
-            for result in results:
-                for alert in result.alerts:
-                    total += 1
-                    p = alert.priority.lower()
-                    
-                    if "critical" in p:
-                        critical += 1
-                        priority = "critical"
-                    elif "high" in p:
-                        high += 1
-                        priority = "high"
-                    elif "medium" in p:
-                        medium += 1
-                        priority = "medium"
-                    else:
-                        low += 1
-                        priority = "low"
-                    
-                    # Collect alert data for timeline
-                    alerts_data.append({
-                        "batch_id": result.batch_id,
-                        "classification": alert.classification,
-                        "priority": priority,
-                        "source_ip": getattr(alert, "source_ip", "") or "",
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
+            # Nothing changed since the last tick: only the footer moves.
+            # Non-zero trends still need one more full update to clear.
+            if not changed and not self._trends_shown:
+                self._update_system_health(stats)
+                self.last_update_label.setText(
+                    f"Last updated: {now_str}"
+                )
+                return
+            
+            alerts_data = [
+                AlertRow(
+                    batch_id,
+                    alert.classification,
+                    _TIMELINE_PRIORITIES[alert.priority_bucket],
+                    alert.source_ip or "",
+                    now_str
+                )
+                for batch_id, alert in recent
+            ]
             
             # Calculate trends (difference from last refresh)
             trends = {
@@ -205,6 +274,7 @@ class Dashboard(QWidget):
                 "total": total, "critical": critical, 
                 "high": high, "medium": medium, "low": low
             }
+            self._trends_shown = any(trends.values())
             
             # Update Threat Level Banner (Primary Hierarchy)
             self.threat_banner.set_threat_level(critical, high, medium, total)
@@ -217,23 +287,41 @@ class Dashboard(QWidget):
             self.low_card.set_value(low, trends["low"])
             
             # Update Recent Alerts Timeline
-            self.alerts_timeline.update_alerts(alerts_data)
+            self.alerts_timeline.update_alerts(alerts_data, total)
             
             # Update System Health Grid
-            self._update_system_health()
+            self._update_system_health(stats)
             
             # Update footer
             self.last_update_label.setText(
-                f"Last updated: {datetime.now().strftime('%H:%M:%S')}"
+                f"Last updated: {now_str}"
             )
             
         except Exception as e:
             self.last_update_label.setText(f"Error: {str(e)[:40]}")
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _set_interval(self, interval: int):
+        """Apply a new polling interval to the running timer"""
+        if interval != self._interval:
+            self._interval = interval
+            if self.timer.isActive():
+                self.timer.setInterval(interval)
     
-    def _update_system_health(self):
-        """Update system health indicators"""
+    def _update_system_health(self, stats: dict):
+        """Update system health indicators when the underlying stats change"""
         try:
-            stats = self.bridge.get_stats()
+            health = (
+                stats.get("pipeline_loaded"),
+                stats.get("running", False),
+                stats.get("sources_count", 0),
+                stats.get("shutdown_flag", False),
+                stats.get("permission_check", {}).get("has_permission", True),
+            )
+            if health == self._last_health:
+                return
+            self._last_health = health
             
             # Pipeline status
             if stats.get("pipeline_loaded"):
@@ -270,10 +358,23 @@ class Dashboard(QWidget):
         """Manual refresh with visual feedback"""
         self.quick_actions.set_refreshing(True)
         self.refresh()
-        QTimer.singleShot(500, lambda: self.quick_actions.set_refreshing(False))
+        QTimer.singleShot(500, Qt.TimerType.CoarseTimer, self._end_refreshing)
+    
+    def _end_refreshing(self):
+        self.quick_actions.set_refreshing(False)
+    
+    def _on_card_clicked(self, priority: str):
+        """Open the alerts view, filtered unless the total card was clicked"""
+        if priority == "total":
+            self.navigate_to_alerts.emit()
+        else:
+            self.navigate_to_alerts_filtered.emit(priority)
     
     def _upload_logs(self):
         """Upload and analyze log files"""
+        if self._ingest_running:
+            return
+        
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Log Files", "",
             "Log Files (*.json *.jsonl *.csv *.log);;JSON (*.json *.jsonl);;CSV (*.csv);;All (*.*)"
@@ -282,25 +383,33 @@ class Dashboard(QWidget):
         if not files:
             return
         
-        # Show progress
+        # Show progress; files are analyzed on a pool thread
+        if self.progress_bar is None:
+            self.progress_bar = QProgressBar()
+            self.progress_bar.setFixedHeight(6)
+            self.progress_bar.setStyleSheet(_PROGRESS_QSS)
+            self.layout().insertWidget(self._progress_index, self.progress_bar)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, len(files))
         self.progress_bar.setValue(0)
         
-        success_count = 0
-        for i, file_path in enumerate(files):
-            try:
-                self.bridge.add_file_source(file_path)
-                success_count += 1
-            except Exception:
-                pass
-            self.progress_bar.setValue(i + 1)
-        
+        job = FileIngestJob(self.bridge, files)
+        job.signals.progress.connect(self.progress_bar.setValue)
+        job.signals.finished.connect(self._on_upload_finished)
+        self._ingest_job = job
+        self._ingest_running = True
+        # No second upload can be picked until this one finishes
+        self.quick_actions.set_uploading(True)
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_upload_finished(self, success_count: int):
+        self._ingest_running = False
+        self.quick_actions.set_uploading(False)
         self.bridge.start_ingestion()
+        self.refresh()
         
         # Hide progress after delay
-        QTimer.singleShot(1500, self._hide_progress)
-        QTimer.singleShot(500, self.refresh)
+        QTimer.singleShot(1500, Qt.TimerType.CoarseTimer, self._hide_progress)
     
     def _hide_progress(self):
         self.progress_bar.setVisible(False)
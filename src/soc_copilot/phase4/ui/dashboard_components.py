@@ -2,22 +2,65 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QScrollArea, QGraphicsDropShadowEffect, QSizePolicy
+    QPushButton, QScrollArea
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QColor
-from datetime import datetime
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
+from PyQt6.QtGui import QFont, QColor, QPainter, QStaticText
+from collections import namedtuple
+from collections.abc import Sized
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Iterable, Optional
+
+from .styles import repolish
+
+
+# One row of the recent alerts timeline (fields match RecentAlertItem)
+AlertRow = namedtuple("AlertRow", "batch_id classification priority source_ip timestamp")
+
+# Per-level banner text; colors are keyed on the "level" property in styles.qss
+ThreatStyle = namedtuple("ThreatStyle", "icon label")
+
+
+@lru_cache(maxsize=256)
+def _plural(n: int, noun: str) -> str:
+    """Format a count with its noun, e.g. "1 Alert" or "3 Alerts"
+    
+    Counts repeat from one refresh to the next, so most calls are a
+    cache hit.
+    """
+    return f"{n} {noun}{'s' if n != 1 else ''}"
+
+
+# Shared fonts; QFont is a value type, so widgets can reuse one instance
+_F_EMOJI_SM = QFont("Segoe UI Emoji", 12)
+_F_EMOJI_MD = QFont("Segoe UI Emoji", 16)
+_F_EMOJI_LG = QFont("Segoe UI Emoji", 32)
+_F_EMOJI_XL = QFont("Segoe UI Emoji", 40)
+_F_BADGE = QFont("Segoe UI", 9, QFont.Weight.Bold)
+_F_CAPTION = QFont("Segoe UI", 10)
+_F_BODY = QFont("Segoe UI", 11)
+_F_BODY_LG = QFont("Segoe UI", 12)
+_F_MONO = QFont("Consolas", 10)
+_F_HEADING = QFont("Segoe UI", 12, QFont.Weight.Bold)
+_F_TITLE = QFont("Segoe UI", 14, QFont.Weight.Bold)
+_F_TITLE_LG = QFont("Segoe UI", 16, QFont.Weight.Bold)
+_F_TITLE_XL = QFont("Segoe UI", 18, QFont.Weight.Bold)
+_F_COUNT = QFont("Segoe UI", 24, QFont.Weight.Bold)
+_F_METRIC = QFont("Segoe UI", 28, QFont.Weight.Bold)
 
 
 class ThreatLevelBanner(QFrame):
     """Primary visual hierarchy - shows overall threat level at a glance"""
     
-    THREAT_LEVELS = {
-        "critical": {"bg": "#1a0000", "fg": "#ff4444", "border": "#ff4444", "icon": "⚫", "label": "CRITICAL"},
-        "high": {"bg": "#2d1a00", "fg": "#ff8800", "border": "#ff8800", "icon": "🔴", "label": "HIGH"},
-        "elevated": {"bg": "#2d2d00", "fg": "#ffaa00", "border": "#ffaa00", "icon": "🟡", "label": "ELEVATED"},
-        "clear": {"bg": "#0d2818", "fg": "#4CAF50", "border": "#4CAF50", "icon": "🟢", "label": "CLEAR"}
-    }
+    # Read-only, so set_threat_level reads attributes off shared tuples
+    THREAT_LEVELS = MappingProxyType({
+        "critical": ThreatStyle("⚫", "CRITICAL"),
+        "high": ThreatStyle("🔴", "HIGH"),
+        "elevated": ThreatStyle("🟡", "ELEVATED"),
+        "clear": ThreatStyle("🟢", "CLEAR"),
+    })
     
     view_alerts_clicked = pyqtSignal()
     
@@ -25,11 +68,11 @@ class ThreatLevelBanner(QFrame):
         super().__init__()
         self._current_level = "clear"
         self._action_count = 0
+        self.setProperty("level", "clear")
         self._init_ui()
     
     def _init_ui(self):
         self.setFixedHeight(80)
-        self._apply_style("clear")
         
         layout = QHBoxLayout()
         layout.setContentsMargins(20, 15, 20, 15)
@@ -37,29 +80,23 @@ class ThreatLevelBanner(QFrame):
         
         # Left side: Threat level pill
         self.threat_container = QFrame()
-        self.threat_container.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 0, 0, 0.3);
-                border-radius: 20px;
-                padding: 5px 15px;
-            }
-        """)
+        self.threat_container.setObjectName("threatPill")
         threat_layout = QHBoxLayout()
         threat_layout.setContentsMargins(15, 8, 15, 8)
         threat_layout.setSpacing(10)
         
         self.threat_icon = QLabel("🟢")
-        self.threat_icon.setFont(QFont("Segoe UI Emoji", 16))
+        self.threat_icon.setFont(_F_EMOJI_MD)
         threat_layout.addWidget(self.threat_icon)
         
         self.threat_label = QLabel("THREAT LEVEL:")
-        self.threat_label.setFont(QFont("Segoe UI", 11))
-        self.threat_label.setStyleSheet("color: rgba(255, 255, 255, 0.8);")
+        self.threat_label.setFont(_F_BODY)
+        self.threat_label.setObjectName("threatLabel")
         threat_layout.addWidget(self.threat_label)
         
         self.threat_value = QLabel("CLEAR")
-        self.threat_value.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        self.threat_value.setStyleSheet("color: #4CAF50;")
+        self.threat_value.setObjectName("threatValue")
+        self.threat_value.setFont(_F_TITLE)
         threat_layout.addWidget(self.threat_value)
         
         self.threat_container.setLayout(threat_layout)
@@ -70,87 +107,54 @@ class ThreatLevelBanner(QFrame):
         center_layout.setSpacing(2)
         
         self.action_count_label = QLabel("0 Alerts")
-        self.action_count_label.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
-        self.action_count_label.setStyleSheet("color: white;")
+        self.action_count_label.setFont(_F_COUNT)
+        self.action_count_label.setObjectName("actionCount")
         center_layout.addWidget(self.action_count_label)
         
         self.action_text = QLabel("All systems nominal")
-        self.action_text.setFont(QFont("Segoe UI", 11))
-        self.action_text.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        self.action_text.setFont(_F_BODY)
+        self.action_text.setObjectName("actionText")
         center_layout.addWidget(self.action_text)
         
         layout.addLayout(center_layout, 1)
         
         # Right side: View alerts button
         self.view_btn = QPushButton("View Alerts →")
+        self.view_btn.setObjectName("viewAlertsBtn")
         self.view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.view_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.15);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.25);
-                border-color: rgba(255, 255, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.35);
-            }
-        """)
         self.view_btn.clicked.connect(self.view_alerts_clicked.emit)
         layout.addWidget(self.view_btn)
         
         self.setLayout(layout)
-        
-        # Add shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
-    
-    def _apply_style(self, level: str):
-        config = self.THREAT_LEVELS.get(level, self.THREAT_LEVELS["clear"])
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {config['bg']}, stop:1 #0a0a1a);
-                border: 2px solid {config['border']};
-                border-radius: 12px;
-            }}
-        """)
     
     def set_threat_level(self, critical: int, high: int, medium: int, total: int):
         """Update threat level based on alert counts"""
         if critical > 0:
             level = "critical"
-            action_text = f"{critical} Critical Alert{'s' if critical > 1 else ''} Need Immediate Attention"
+            action_text = f"{_plural(critical, 'Critical Alert')} Need Immediate Attention"
         elif high > 0:
             level = "high"
-            action_text = f"{high} High Priority Alert{'s' if high > 1 else ''} Require Review"
+            action_text = f"{_plural(high, 'High Priority Alert')} Require Review"
         elif medium > 0:
             level = "elevated"
-            action_text = f"{medium} Medium Priority Alert{'s' if medium > 1 else ''} Detected"
+            action_text = f"{_plural(medium, 'Medium Priority Alert')} Detected"
         else:
             level = "clear"
             action_text = "All systems nominal • No threats detected"
         
-        config = self.THREAT_LEVELS[level]
-        self._current_level = level
+        # Re-polish only on a level change; the value label's color
+        # depends on the banner's property, so it is re-polished too
+        if level != self._current_level:
+            config = self.THREAT_LEVELS[level]
+            self._current_level = level
+            self.setProperty("level", level)
+            repolish(self)
+            repolish(self.threat_value)
+            self.threat_icon.setText(config.icon)
+            self.threat_value.setText(config.label)
         self._action_count = total
         
-        # Update visuals
-        self._apply_style(level)
-        self.threat_icon.setText(config["icon"])
-        self.threat_value.setText(config["label"])
-        self.threat_value.setStyleSheet(f"color: {config['fg']};")
-        
-        self.action_count_label.setText(f"{total} Alert{'s' if total != 1 else ''}")
+        self.action_count_label.setText(_plural(total, "Alert"))
         self.action_text.setText(action_text)
         
         # Hide button if no alerts
@@ -158,92 +162,100 @@ class ThreatLevelBanner(QFrame):
 
 
 class RecentAlertItem(QFrame):
-    """Single alert item in the recent alerts timeline"""
+    """Single alert item in the recent alerts timeline
     
-    clicked = pyqtSignal(str, str)  # batch_id, classification
+    Items are pooled by RecentAlertsTimeline and re-labelled through
+    update_data() rather than rebuilt on every refresh. Clicks are handled
+    by the timeline, which reads batch_id and classification off the item.
+    """
     
-    PRIORITY_COLORS = {
-        "critical": "#ff4444",
-        "high": "#ff8800",
-        "medium": "#ffaa00",
-        "low": "#4CAF50"
-    }
-    
-    def __init__(self, batch_id: str, classification: str, priority: str, 
-                 source_ip: str, timestamp: str):
+    def __init__(self, batch_id: str = "", classification: str = "", priority: str = "low", 
+                 source_ip: str = "", timestamp: str = ""):
         super().__init__()
-        self.batch_id = batch_id
-        self.classification = classification
-        self.priority = priority.lower()
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._init_ui(classification, priority, source_ip, timestamp)
-    
-    def _init_ui(self, classification: str, priority: str, source_ip: str, timestamp: str):
-        color = self.PRIORITY_COLORS.get(self.priority, "#888888")
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: #16213e;
-                border-left: 4px solid {color};
-                border-radius: 6px;
-                margin: 2px 0;
-            }}
-            QFrame:hover {{
-                background-color: #1a2744;
-            }}
-        """)
-        
+        self.batch_id = ""
+        self.classification = ""
+        self.priority = None
+        self._init_ui()
+        self.update_data(batch_id, classification, priority, source_ip, timestamp)
+    
+    def _init_ui(self):
         layout = QHBoxLayout()
-        layout.setContentsMargins(12, 10, 12, 10)
+        # 12px vertical matches the old per-label margins the item sheet cascaded
+        layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(12)
         
         # Priority indicator
-        priority_label = QLabel(priority.upper()[:4])
-        priority_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-        priority_label.setStyleSheet(f"""
-            color: {color};
-            background-color: rgba({self._hex_to_rgb(color)}, 0.15);
-            padding: 3px 8px;
-            border-radius: 4px;
-        """)
-        priority_label.setFixedWidth(50)
-        layout.addWidget(priority_label)
+        self.priority_label = QLabel()
+        self.priority_label.setObjectName("alertPriority")
+        self.priority_label.setFont(_F_BADGE)
+        self.priority_label.setFixedWidth(50)
+        layout.addWidget(self.priority_label)
         
         # Classification
-        class_label = QLabel(classification)
-        class_label.setFont(QFont("Segoe UI", 11))
-        class_label.setStyleSheet("color: #ffffff;")
-        class_label.setWordWrap(True)
-        layout.addWidget(class_label, 1)
-        
-        # Source IP
-        if source_ip:
-            ip_label = QLabel(source_ip)
-            ip_label.setFont(QFont("Consolas", 10))
-            ip_label.setStyleSheet("color: #888888;")
-            layout.addWidget(ip_label)
+        self.class_label = QLabel()
+        self.class_label.setObjectName("alertClass")
+        self.class_label.setFont(_F_BODY)
+        self.class_label.setWordWrap(True)
+        layout.addWidget(self.class_label, 1)
+        
+        # Source IP (hidden when the alert has none)
+        self.ip_label = QLabel()
+        self.ip_label.setObjectName("alertIp")
+        self.ip_label.setFont(_F_MONO)
+        layout.addWidget(self.ip_label)
         
         # Timestamp
-        time_label = QLabel(timestamp)
-        time_label.setFont(QFont("Segoe UI", 10))
-        time_label.setStyleSheet("color: #555555;")
-        time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        layout.addWidget(time_label)
+        self.time_label = QLabel()
+        self.time_label.setObjectName("alertTime")
+        self.time_label.setFont(_F_CAPTION)
+        self.time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self.time_label)
         
         # Arrow
         arrow = QLabel("→")
-        arrow.setStyleSheet("color: #555555; font-size: 14px;")
+        arrow.setObjectName("alertArrow")
         layout.addWidget(arrow)
         
         self.setLayout(layout)
     
-    def _hex_to_rgb(self, hex_color: str) -> str:
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        return f"{r}, {g}, {b}"
+    def update_data(self, batch_id: str, classification: str, priority: str,
+                    source_ip: str, timestamp: str):
+        """Re-label the item; arguments follow AlertRow field order"""
+        self.batch_id = batch_id
+        self.classification = classification
+        self.class_label.setText(classification)
+        self.ip_label.setText(source_ip)
+        self.ip_label.setVisible(bool(source_ip))
+        self.time_label.setText(timestamp)
+        
+        priority = priority.lower()
+        if priority != self.priority:
+            self.priority = priority
+            self.priority_label.setText(priority.upper()[:4])
+            # Colors come from the shared sheet, keyed on this property
+            self.setProperty("priority", priority)
+            repolish(self)
+            repolish(self.priority_label)
+
+
+class _TimelineItems(QWidget):
+    """Container for pooled RecentAlertItems
+    
+    Items and their labels ignore mouse presses, so presses propagate here
+    and are resolved to the item under the cursor; one handler serves the
+    whole pool.
+    """
+    
+    item_clicked = pyqtSignal(str, str)  # batch_id, classification
     
     def mousePressEvent(self, event):
-        self.clicked.emit(self.batch_id, self.classification)
+        widget = self.childAt(event.position().toPoint())
+        while widget is not None and not isinstance(widget, RecentAlertItem):
+            widget = widget.parentWidget()
+        if widget is None:
+            super().mousePressEvent(event)
+            return
+        self.item_clicked.emit(widget.batch_id, widget.classification)
 
 
 class RecentAlertsTimeline(QFrame):
@@ -251,18 +263,24 @@ class RecentAlertsTimeline(QFrame):
     
     alert_clicked = pyqtSignal(str, str)  # batch_id, classification
     
+    # Rows rendered at most (limit for performance)
+    MAX_ITEMS = 15
+    # Calls arriving within this window are applied as one redraw
+    UPDATE_DEBOUNCE_MS = 30
+    
     def __init__(self):
         super().__init__()
-        self._alert_items = []
+        self._pending = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DEBOUNCE_MS)
+        self._update_timer.timeout.connect(self._do_update)
         self._init_ui()
     
     def _init_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #0f1629;
-                border-radius: 10px;
-            }
-        """)
+        # The frame rule lives in styles.qss; the object name keeps it off
+        # the Zones A-F timeline, which shares this class name
+        self.setObjectName("alertsTimeline")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -272,113 +290,126 @@ class RecentAlertsTimeline(QFrame):
         header = QHBoxLayout()
         
         title = QLabel("📋 Recent Alerts")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #ffffff;")
+        title.setObjectName("timelineTitle")
+        title.setFont(_F_TITLE)
         header.addWidget(title)
         
         header.addStretch()
         
         self.count_label = QLabel("0 alerts")
-        self.count_label.setFont(QFont("Segoe UI", 11))
-        self.count_label.setStyleSheet("color: #888888;")
+        self.count_label.setObjectName("timelineCount")
+        self.count_label.setFont(_F_BODY)
         header.addWidget(self.count_label)
         
         layout.addLayout(header)
         
         # Scroll area for alerts
         scroll = QScrollArea()
+        scroll.setObjectName("timelineScroll")
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { border: none; background: transparent; }
-            QScrollBar:vertical {
-                background-color: #0a0a1a;
-                width: 6px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #2a3f5f;
-                border-radius: 3px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover { background-color: #3a5f8f; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-        """)
-        
-        self.alerts_container = QWidget()
+        
+        self.alerts_container = _TimelineItems()
         self.alerts_layout = QVBoxLayout()
         self.alerts_layout.setSpacing(6)
         self.alerts_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.alerts_container.setLayout(self.alerts_layout)
+        # One click connection and one cursor for the whole pool; items
+        # inherit the cursor from the container
+        self.alerts_container.item_clicked.connect(self.alert_clicked.emit)
+        self.alerts_container.setCursor(Qt.CursorShape.PointingHandCursor)
         
         scroll.setWidget(self.alerts_container)
         layout.addWidget(scroll, 1)
         
         self.setLayout(layout)
         
-        # Show empty state initially
-        self._show_empty_state()
+        # Empty state and a fixed pool of items, built once and toggled
+        self._empty_widget = self._create_empty_state()
+        self.alerts_layout.addWidget(self._empty_widget)
+        self._pool = []
+        for _ in range(self.MAX_ITEMS):
+            item = RecentAlertItem()
+            item.hide()
+            self.alerts_layout.addWidget(item)
+            self._pool.append(item)
     
-    def _show_empty_state(self):
-        """Show empty state when no alerts"""
-        self._clear_alerts()
-        
+    def _create_empty_state(self) -> QFrame:
+        """Build the widget shown when there are no alerts"""
         empty_widget = QFrame()
-        empty_widget.setStyleSheet("background: transparent;")
+        empty_widget.setObjectName("timelineEmpty")
+        empty_widget.setCursor(Qt.CursorShape.ArrowCursor)
         empty_layout = QVBoxLayout()
         empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.setSpacing(15)
         
         icon = QLabel("✅")
-        icon.setFont(QFont("Segoe UI Emoji", 32))
+        icon.setFont(_F_EMOJI_LG)
         icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(icon)
         
         title = QLabel("All Clear")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        title.setStyleSheet("color: #4CAF50;")
+        title.setObjectName("timelineEmptyTitle")
+        title.setFont(_F_TITLE_LG)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(title)
         
         desc = QLabel("No threats detected in analyzed logs.\nAlerts will appear here when detected.")
-        desc.setFont(QFont("Segoe UI", 11))
-        desc.setStyleSheet("color: #888888;")
+        desc.setObjectName("timelineEmptyDesc")
+        desc.setFont(_F_BODY)
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(desc)
         
         empty_widget.setLayout(empty_layout)
-        self.alerts_layout.addWidget(empty_widget)
-        self._alert_items.append(empty_widget)
-    
-    def _clear_alerts(self):
-        """Clear all alert items"""
-        for item in self._alert_items:
-            self.alerts_layout.removeWidget(item)
-            item.deleteLater()
-        self._alert_items.clear()
-    
-    def update_alerts(self, alerts_data: list):
-        """Update timeline with new alerts"""
-        self._clear_alerts()
-        
-        if not alerts_data:
-            self._show_empty_state()
-            self.count_label.setText("0 alerts")
-            return
-        
-        self.count_label.setText(f"{len(alerts_data)} alert{'s' if len(alerts_data) != 1 else ''}")
-        
-        # Add alert items (limit to 15 for performance)
-        for alert in alerts_data[:15]:
-            item = RecentAlertItem(
-                batch_id=alert.get("batch_id", ""),
-                classification=alert.get("classification", "Unknown"),
-                priority=alert.get("priority", "low"),
-                source_ip=alert.get("source_ip", ""),
-                timestamp=alert.get("timestamp", "")
-            )
-            item.clicked.connect(self.alert_clicked.emit)
-            self.alerts_layout.addWidget(item)
-            self._alert_items.append(item)
+        return empty_widget
+    
+    def update_alerts(self, alerts_data: Iterable, total: Optional[int] = None,
+                      max_items: Optional[int] = None):
+        """Update timeline with new alerts
+        
+        `alerts_data` yields AlertRow tuples; at most `max_items` (capped at
+        MAX_ITEMS) are consumed, so an iterator can be passed without
+        building a list. `total` is the overall alert count for the header
+        when alerts_data holds only the rows to display. The redraw is
+        deferred briefly so a burst of calls draws once, with the latest data.
+        """
+        limit = self.MAX_ITEMS if max_items is None else min(max_items, self.MAX_ITEMS)
+        rows = list(islice(alerts_data, limit))
+        if total is None:
+            total = len(alerts_data) if isinstance(alerts_data, Sized) else len(rows)
+        self._pending = (rows, total)
+        self._update_timer.start()
+    
+    def flush(self):
+        """Apply a pending update immediately"""
+        if self._update_timer.isActive():
+            self._update_timer.stop()
+            self._do_update()
+    
+    def _do_update(self):
+        """Re-label pooled items from the pending data; hide unused ones
+        
+        Runs from the debounce timer, outside the dashboard's own batched
+        refresh, so updates are suspended here for one paint per batch.
+        """
+        rows, total = self._pending
+        
+        self.setUpdatesEnabled(False)
+        try:
+            self._empty_widget.setVisible(not rows)
+            
+            if not rows:
+                self.count_label.setText("0 alerts")
+            else:
+                self.count_label.setText(_plural(total, "alert"))
+            
+            for i, item in enumerate(self._pool):
+                if i < len(rows):
+                    item.update_data(*rows[i])
+                    item.show()
+                else:
+                    item.hide()
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class EmptyStateCard(QFrame):
@@ -394,21 +425,8 @@ class EmptyStateCard(QFrame):
     def _init_ui(self, icon: str, title: str, description: str, 
                  action_text: str, state_type: str):
         
-        colors = {
-            "info": {"bg": "#16213e", "title": "#00d4ff", "border": "#1a2744"},
-            "warning": {"bg": "#2d2d00", "title": "#ffaa00", "border": "#665c00"},
-            "error": {"bg": "#2d1a1a", "title": "#ff4444", "border": "#4a0000"},
-            "success": {"bg": "#0d2818", "title": "#4CAF50", "border": "#1a4d26"}
-        }
-        config = colors.get(state_type, colors["info"])
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {config['bg']};
-                border: 1px solid {config['border']};
-                border-radius: 12px;
-            }}
-        """)
+        # Colors come from the shared sheet, keyed on this property
+        self.setProperty("state", state_type)
         
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -416,40 +434,27 @@ class EmptyStateCard(QFrame):
         layout.setSpacing(15)
         
         icon_label = QLabel(icon)
-        icon_label.setFont(QFont("Segoe UI Emoji", 40))
+        icon_label.setFont(_F_EMOJI_XL)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon_label)
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {config['title']};")
+        title_label.setObjectName("emptyTitle")
+        title_label.setFont(_F_TITLE_XL)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         desc_label = QLabel(description)
-        desc_label.setFont(QFont("Segoe UI", 12))
-        desc_label.setStyleSheet("color: #888888;")
+        desc_label.setObjectName("emptyDescription")
+        desc_label.setFont(_F_BODY_LG)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
         if action_text:
             action_btn = QPushButton(action_text)
+            action_btn.setObjectName("emptyAction")
             action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {config['title']};
-                    color: #0a0a1a;
-                    border: none;
-                    padding: 12px 30px;
-                    border-radius: 8px;
-                    font-size: 13px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    opacity: 0.9;
-                }}
-            """)
             action_btn.clicked.connect(self.action_clicked.emit)
             layout.addWidget(action_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -470,20 +475,15 @@ class QuickActionsBar(QFrame):
     
     def _init_ui(self):
         self.setFixedHeight(60)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-            }
-        """)
         
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 5, 0, 5)
         layout.setSpacing(15)
         
         # Upload Logs Button (Primary)
-        upload_btn = self._create_button("📁 Upload Logs", primary=True)
-        upload_btn.clicked.connect(self.upload_clicked.emit)
-        layout.addWidget(upload_btn)
+        self.upload_btn = self._create_button("📁 Upload Logs", primary=True)
+        self.upload_btn.clicked.connect(self.upload_clicked.emit)
+        layout.addWidget(self.upload_btn)
         
         # View Alerts Button
         alerts_btn = self._create_button("🚨 View Alerts")
@@ -507,38 +507,8 @@ class QuickActionsBar(QFrame):
     def _create_button(self, text: str, primary: bool = False) -> QPushButton:
         btn = QPushButton(text)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        
         if primary:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d4ff;
-                    color: #0a0a1a;
-                    border: none;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-size: 13px;
-                    font-weight: bold;
-                }
-                QPushButton:hover { background-color: #00a8cc; }
-                QPushButton:pressed { background-color: #0088aa; }
-            """)
-        else:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #16213e;
-                    color: #ffffff;
-                    border: 1px solid #1a2744;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-size: 13px;
-                }
-                QPushButton:hover { 
-                    background-color: #1a2744;
-                    border-color: #2a3f5f;
-                }
-                QPushButton:pressed { background-color: #0f1629; }
-            """)
-        
+            btn.setObjectName("primaryAction")
         return btn
     
     def set_refreshing(self, refreshing: bool):
@@ -549,6 +519,15 @@ class QuickActionsBar(QFrame):
         else:
             self.refresh_btn.setText("🔄 Refresh")
             self.refresh_btn.setEnabled(True)
+    
+    def set_uploading(self, uploading: bool):
+        """Update upload button state"""
+        if uploading:
+            self.upload_btn.setText("⏳ Processing...")
+            self.upload_btn.setEnabled(False)
+        else:
+            self.upload_btn.setText("📁 Upload Logs")
+            self.upload_btn.setEnabled(True)
 
 
 class CompactMetricCard(QFrame):
@@ -556,13 +535,14 @@ class CompactMetricCard(QFrame):
     
     clicked = pyqtSignal(str)  # priority filter
     
-    PRIORITY_STYLES = {
-        "total": {"bg": "#3F51B5", "icon": "📊"},
-        "critical": {"bg": "#d32f2f", "icon": "🚨"},
-        "high": {"bg": "#f57c00", "icon": "⚠️"},
-        "medium": {"bg": "#ffa000", "icon": "📋"},
-        "low": {"bg": "#4CAF50", "icon": "✓"}
-    }
+    # Card gradients live in styles.qss under CompactMetricCard[priority=...]
+    PRIORITY_STYLES = MappingProxyType({
+        "total": {"icon": "📊"},
+        "critical": {"icon": "🚨"},
+        "high": {"icon": "⚠️"},
+        "medium": {"icon": "📋"},
+        "low": {"icon": "✓"}
+    })
     
     def __init__(self, label: str, priority: str = "total"):
         super().__init__()
@@ -577,17 +557,8 @@ class CompactMetricCard(QFrame):
         style = self.PRIORITY_STYLES.get(self.priority, self.PRIORITY_STYLES["total"])
         
         self.setFixedHeight(90)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {style['bg']}, stop:1 {self._darken(style['bg'])});
-                border-radius: 10px;
-            }}
-            QFrame:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {self._lighten(style['bg'])}, stop:1 {style['bg']});
-            }}
-        """)
+        # Gradients come from the shared sheet, keyed on this property
+        self.setProperty("priority", self.priority)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 12, 15, 12)
@@ -597,12 +568,12 @@ class CompactMetricCard(QFrame):
         top_row = QHBoxLayout()
         
         icon_label = QLabel(style["icon"])
-        icon_label.setFont(QFont("Segoe UI Emoji", 12))
+        icon_label.setFont(_F_EMOJI_SM)
         top_row.addWidget(icon_label)
         
         name_label = QLabel(self.label)
-        name_label.setFont(QFont("Segoe UI", 11))
-        name_label.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
+        name_label.setObjectName("metricName")
+        name_label.setFont(_F_BODY)
         top_row.addWidget(name_label)
         top_row.addStretch()
         
@@ -612,83 +583,129 @@ class CompactMetricCard(QFrame):
         value_row = QHBoxLayout()
         
         self.value_label = QLabel("0")
-        self.value_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        self.value_label.setStyleSheet("color: white;")
+        self.value_label.setObjectName("metricValue")
+        self.value_label.setFont(_F_METRIC)
         value_row.addWidget(self.value_label)
         
         value_row.addStretch()
         
         # Trend indicator
         self.trend_label = QLabel("")
-        self.trend_label.setFont(QFont("Segoe UI", 10))
-        self.trend_label.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        self.trend_label.setObjectName("metricTrend")
+        self.trend_label.setFont(_F_CAPTION)
         value_row.addWidget(self.trend_label)
         
         layout.addLayout(value_row)
         
         self.setLayout(layout)
-        
-        # Add shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
-    
-    def _darken(self, hex_color: str) -> str:
-        c = QColor(hex_color)
-        return c.darker(120).name()
-    
-    def _lighten(self, hex_color: str) -> str:
-        c = QColor(hex_color)
-        return c.lighter(115).name()
     
     def set_value(self, value: int, trend: int = 0):
+        # Unchanged values skip the label and stylesheet updates
+        if value == self._value and trend == self._trend:
+            return
         self._value = value
         self._trend = trend
         self.value_label.setText(str(value))
         
         if trend > 0:
             self.trend_label.setText(f"↑ +{trend}")
-            self.trend_label.setStyleSheet("color: rgba(255, 200, 200, 0.9);")
+            direction = "up"
         elif trend < 0:
             self.trend_label.setText(f"↓ {trend}")
-            self.trend_label.setStyleSheet("color: rgba(200, 255, 200, 0.9);")
+            direction = "down"
         else:
             self.trend_label.setText("")
+            direction = self.trend_label.property("trend")
+        if direction != self.trend_label.property("trend"):
+            self.trend_label.setProperty("trend", direction)
+            repolish(self.trend_label)
     
     def mousePressEvent(self, event):
         self.clicked.emit(self.priority)
 
 
+class StaticTextLabel(QWidget):
+    """Single-line label painted from a cached QStaticText layout
+    
+    Meant for text that is rewritten on every refresh, such as the
+    dashboard footer: the glyph layout is only recomputed when the text
+    actually changes, and the size hint only grows.
+    """
+    
+    def __init__(self, text: str = "", color: str = "#555555"):
+        super().__init__()
+        self._static = QStaticText()
+        self._static.setTextFormat(Qt.TextFormat.PlainText)
+        self._static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        self._color = QColor(color)
+        self._hint_width = 0
+        self.setText(text)
+    
+    def text(self) -> str:
+        return self._static.text()
+    
+    def setText(self, text: str):
+        if text == self._static.text():
+            return
+        self._static.setText(text)
+        width = self.fontMetrics().horizontalAdvance(text)
+        if width > self._hint_width:
+            self._hint_width = width
+            self.updateGeometry()
+        self.update()
+    
+    def sizeHint(self) -> QSize:
+        return QSize(self._hint_width, self.fontMetrics().height())
+    
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == event.Type.FontChange:
+            self._static.prepare(font=self.font())
+            self._hint_width = self.fontMetrics().horizontalAdvance(self._static.text())
+            self.updateGeometry()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self._color)
+        y = (self.height() - self.fontMetrics().height()) // 2
+        painter.drawStaticText(0, y, self._static)
+        painter.end()
+
+
 class SystemHealthGrid(QFrame):
     """Compact 2-column grid showing system health status"""
     
+    # Row colors with a "tone" rule in the shared sheet
+    _TONES = {
+        "#4caf50": "ok",
+        "#2196f3": "info",
+        "#ffa000": "warn",
+        "#ff4444": "error",
+        "#888888": "idle",
+    }
+    
     def __init__(self):
         super().__init__()
         self._init_ui()
     
     def _init_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #16213e;
-                border: 1px solid #1a2744;
-                border-radius: 10px;
-            }
-        """)
-        
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 12, 15, 12)
         layout.setSpacing(10)
         
         # Header
         title = QLabel("System Health")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        title.setStyleSheet("color: #00d4ff;")
+        title.setObjectName("healthTitle")
+        title.setFont(_F_HEADING)
         layout.addWidget(title)
         
         # Status rows
         self.rows = {}
+        self._shown = {}  # key -> (value, color) currently displayed
         row_data = [
             ("pipeline", "ML Pipeline", "●", "Loading..."),
             ("ingestion", "Log Ingestion", "●", "Not Started"),
@@ -700,17 +717,17 @@ class SystemHealthGrid(QFrame):
             row.setSpacing(10)
             
             status_led = QLabel(icon)
-            status_led.setFont(QFont("Segoe UI", 10))
-            status_led.setStyleSheet("color: #888888;")
+            status_led.setFont(_F_CAPTION)
+            status_led.setProperty("tone", "idle")
             status_led.setFixedWidth(15)
             
             name = QLabel(label)
-            name.setFont(QFont("Segoe UI", 11))
-            name.setStyleSheet("color: #ffffff;")
+            name.setObjectName("healthName")
+            name.setFont(_F_BODY)
             
             value = QLabel(default_value)
-            value.setFont(QFont("Segoe UI", 10))
-            value.setStyleSheet("color: #888888;")
+            value.setFont(_F_CAPTION)
+            value.setProperty("tone", "idle")
             value.setAlignment(Qt.AlignmentFlag.AlignRight)
             
             row.addWidget(status_led)
@@ -724,9 +741,23 @@ class SystemHealthGrid(QFrame):
         self.setLayout(layout)
     
     def update_status(self, key: str, status: str, value: str, color: str = "#4CAF50"):
-        """Update a status row"""
-        if key in self.rows:
+        """Update a status row, skipping rows already showing this value"""
+        if key in self.rows and self._shown.get(key) != (value, color):
+            self._shown[key] = (value, color)
             led, val_label = self.rows[key]
-            led.setStyleSheet(f"color: {color};")
             val_label.setText(value)
-            val_label.setStyleSheet(f"color: {color};")
+            self._set_color(led, color)
+            self._set_color(val_label, color)
+    
+    def _set_color(self, label: QLabel, color: str):
+        """Color a row label via its tone property, re-polishing on change"""
+        tone = self._TONES.get(color.lower())
+        if tone is None:
+            # Colors outside the palette still get an inline sheet
+            label.setStyleSheet(f"color: {color};")
+            return
+        if label.styleSheet():
+            label.setStyleSheet("")
+        if label.property("tone") != tone:
+            label.setProperty("tone", tone)
+            repolish(label)
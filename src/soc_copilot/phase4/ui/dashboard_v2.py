@@ -10,18 +10,58 @@ Zone F: Footer Status
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QFileDialog, QTableWidget, QTableWidgetItem
+    QPushButton, QFileDialog, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QColor
+from collections import deque
 from datetime import datetime
+from operator import attrgetter
+
+from ..controller import PRIORITY_BUCKETS
+from .ingest_worker import FileIngestJob
+from .styles import MASTER_QSS, repolish
+
+
+# Timeline row color per AlertSummary.priority_bucket
+_BUCKET_COLORS = (
+    QColor("#ff4444"),  # critical
+    QColor("#ff8800"),  # high
+    QColor("#ffaa00"),  # medium
+    QColor("#ffffff"),  # low
+    QColor("#ffffff"),  # info
+)
+
+
+def _format_time(timestamp) -> str:
+    """HH:MM:SS for datetimes, str() for anything else"""
+    strftime = getattr(timestamp, "strftime", None)
+    return strftime("%H:%M:%S") if strftime is not None else str(timestamp)
+
+
+def _set_tone(label: QLabel, tone: str):
+    """Set a status label's tone property, re-polishing only on change"""
+    if label.property("tone") != tone:
+        label.setProperty("tone", tone)
+        repolish(label)
 
 
 class ThreatBanner(QFrame):
     """Zone A: Primary threat level indicator"""
     
+    # level -> (icon, text); colors come from the "level" rules in styles.qss
+    LEVELS = {
+        "loading": ("⏳", "LOADING"),
+        "critical": ("🚨", "CRITICAL THREAT"),
+        "high": ("⚠️", "HIGH ALERT"),
+        "elevated": ("⚡", "ELEVATED"),
+        "normal": ("✅", "NORMAL")
+    }
+    
     def __init__(self):
         super().__init__()
+        self._level = None
+        self._shown = None  # (level, critical, high) currently displayed
         self.setFixedHeight(80)
         self._init_ui()
     
@@ -37,11 +77,12 @@ class ThreatBanner(QFrame):
         text_layout.setSpacing(2)
         
         self.level_label = QLabel("NORMAL")
+        self.level_label.setObjectName("bannerLevel")
         self.level_label.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
         
         self.detail_label = QLabel("No critical threats detected")
         self.detail_label.setFont(QFont("Segoe UI", 11))
-        self.detail_label.setStyleSheet("color: #888888;")
+        self.detail_label.setObjectName("bannerDetail")
         
         text_layout.addWidget(self.level_label)
         text_layout.addWidget(self.detail_label)
@@ -54,27 +95,21 @@ class ThreatBanner(QFrame):
     
     def set_level(self, level: str, critical: int, high: int):
         """Update threat level"""
-        levels = {
-            "loading": ("#16213e", "#888888", "⏳", "LOADING"),
-            "critical": ("#4a0000", "#ff4444", "🚨", "CRITICAL THREAT"),
-            "high": ("#4a2000", "#ff8800", "⚠️", "HIGH ALERT"),
-            "elevated": ("#4a4000", "#ffaa00", "⚡", "ELEVATED"),
-            "normal": ("#004a2a", "#4CAF50", "✅", "NORMAL")
-        }
-        
-        bg, fg, icon, text = levels.get(level, levels["normal"])
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg};
-                border: 2px solid {fg};
-                border-radius: 10px;
-            }}
-        """)
-        
-        self.icon_label.setText(icon)
-        self.level_label.setText(text)
-        self.level_label.setStyleSheet(f"color: {fg};")
+        if level not in self.LEVELS:
+            level = "normal"
+        if (level, critical, high) == self._shown:
+            return
+        self._shown = (level, critical, high)
+        
+        # Restyle only on a level change, by re-polishing the level rules
+        if level != self._level:
+            self._level = level
+            icon, text = self.LEVELS[level]
+            self.setProperty("level", level)
+            repolish(self)
+            repolish(self.level_label)
+            self.icon_label.setText(icon)
+            self.level_label.setText(text)
         
         if level == "loading":
             self.detail_label.setText("Loading threat analysis...")
@@ -91,17 +126,11 @@ class SystemStatusStrip(QFrame):
     
     def __init__(self):
         super().__init__()
+        self._shown = None  # last update_status arguments
         self.setFixedHeight(40)
         self._init_ui()
     
     def _init_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #16213e;
-                border-bottom: 1px solid #1a2744;
-            }
-        """)
-        
         layout = QHBoxLayout()
         layout.setContentsMargins(20, 0, 20, 0)
         
@@ -111,7 +140,6 @@ class SystemStatusStrip(QFrame):
         
         for lbl in [self.pipeline_label, self.ingestion_label, self.governance_label]:
             lbl.setFont(QFont("Segoe UI", 10))
-            lbl.setStyleSheet("color: #888888;")
             layout.addWidget(lbl)
             layout.addWidget(self._separator())
         
@@ -119,47 +147,53 @@ class SystemStatusStrip(QFrame):
         
         self.timestamp_label = QLabel("")
         self.timestamp_label.setFont(QFont("Segoe UI", 9))
-        self.timestamp_label.setStyleSheet("color: #555555;")
+        self.timestamp_label.setObjectName("statusTime")
         layout.addWidget(self.timestamp_label)
         
         self.setLayout(layout)
     
     def _separator(self):
         sep = QLabel("|")
-        sep.setStyleSheet("color: #2a3f5f;")
+        sep.setObjectName("statusSep")
         return sep
     
     def update_status(self, pipeline: bool, sources: int, running: bool, killswitch: bool):
         """Update all status indicators"""
+        # Timestamp
+        self.timestamp_label.setText(datetime.now().strftime("%H:%M:%S"))
+        
+        # Labels are restyled only when a status actually changed
+        state = (pipeline, sources, running, killswitch)
+        if state == self._shown:
+            return
+        self._shown = state
+        
         # Pipeline
         if pipeline:
             self.pipeline_label.setText("Pipeline: ● Active")
-            self.pipeline_label.setStyleSheet("color: #4CAF50;")
+            _set_tone(self.pipeline_label, "ok")
         else:
             self.pipeline_label.setText("Pipeline: ○ Inactive")
-            self.pipeline_label.setStyleSheet("color: #ff8800;")
+            _set_tone(self.pipeline_label, "warn")
         
         # Ingestion
         if running and sources > 0:
             self.ingestion_label.setText(f"Ingestion: ● Active ({sources})")
-            self.ingestion_label.setStyleSheet("color: #2196F3;")
+            _set_tone(self.ingestion_label, "info")
         elif sources > 0:
             self.ingestion_label.setText(f"Ingestion: ○ Idle ({sources})")
-            self.ingestion_label.setStyleSheet("color: #888888;")
+            _set_tone(self.ingestion_label, "idle")
         else:
             self.ingestion_label.setText("Ingestion: Not Started")
-            self.ingestion_label.setStyleSheet("color: #888888;")
+            _set_tone(self.ingestion_label, "idle")
         
         # Governance
         if killswitch:
             self.governance_label.setText("Governance: 🛑 KILL SWITCH")
-            self.governance_label.setStyleSheet("color: #ff4444;")
+            _set_tone(self.governance_label, "error")
         else:
             self.governance_label.setText("Governance: ✓ OK")
-            self.governance_label.setStyleSheet("color: #4CAF50;")
-        
-        # Timestamp
-        self.timestamp_label.setText(datetime.now().strftime("%H:%M:%S"))
+            _set_tone(self.governance_label, "ok")
 
 
 class MetricCard(QFrame):
@@ -167,26 +201,25 @@ class MetricCard(QFrame):
     
     clicked = pyqtSignal(str)
     
+    # Accent color -> "priority" property matched by styles.qss
+    _PRIORITIES = {
+        "#3f51b5": "total",
+        "#ff4444": "critical",
+        "#ff8800": "high",
+        "#ffaa00": "medium",
+        "#4caf50": "low",
+    }
+    
     def __init__(self, title: str, icon: str, color: str):
         super().__init__()
         self.title = title
         self.color = color
+        self._value = 0
         self.setFixedHeight(90)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._init_ui(title, icon, color)
     
     def _init_ui(self, title: str, icon: str, color: str):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: #16213e;
-                border-left: 4px solid {color};
-                border-radius: 6px;
-            }}
-            QFrame:hover {{
-                background-color: #1a2744;
-            }}
-        """)
-        
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 10, 15, 10)
         layout.setSpacing(5)
@@ -198,13 +231,21 @@ class MetricCard(QFrame):
         
         title_lbl = QLabel(title)
         title_lbl.setFont(QFont("Segoe UI", 10))
-        title_lbl.setStyleSheet("color: #888888;")
+        title_lbl.setObjectName("cardTitle")
         header.addWidget(title_lbl)
         header.addStretch()
         
         self.value_label = QLabel("0")
         self.value_label.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
-        self.value_label.setStyleSheet(f"color: {color};")
+        self.value_label.setObjectName("cardValue")
+        
+        priority = self._PRIORITIES.get(color.lower())
+        if priority is not None:
+            self.setProperty("priority", priority)
+        else:
+            # Colors outside the palette still get an inline sheet
+            self.setStyleSheet(f"MetricCard {{ border-left-color: {color}; }}")
+            self.value_label.setStyleSheet(f"color: {color};")
         
         layout.addLayout(header)
         layout.addWidget(self.value_label)
@@ -213,6 +254,10 @@ class MetricCard(QFrame):
         self.setLayout(layout)
     
     def set_value(self, value: int):
+        # Unchanged values skip the label update and its relayout
+        if value == self._value:
+            return
+        self._value = value
         self.value_label.setText(str(value))
     
     def mousePressEvent(self, event):
@@ -270,33 +315,11 @@ class QuickActionsBar(QFrame):
         layout.setSpacing(10)
         
         self.upload_btn = QPushButton("📁 Upload Logs")
-        self.upload_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00d4ff;
-                color: #0a0a1a;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #00a8cc; }
-            QPushButton:disabled { background-color: #555555; color: #888888; }
-        """)
+        self.upload_btn.setObjectName("uploadBtn")
         self.upload_btn.clicked.connect(self.upload_clicked.emit)
         
         self.refresh_btn = QPushButton("🔄 Refresh")
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #424242;
-                color: #ffffff;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #616161; }
-        """)
+        self.refresh_btn.setObjectName("refreshBtn")
         self.refresh_btn.clicked.connect(self.refresh_clicked.emit)
         
         layout.addWidget(self.upload_btn)
@@ -311,6 +334,8 @@ class RecentAlertsTimeline(QFrame):
     
     alert_clicked = pyqtSignal(str, str)
     
+    MAX_ROWS = 10
+    
     def __init__(self):
         super().__init__()
         self._init_ui()
@@ -328,7 +353,7 @@ class RecentAlertsTimeline(QFrame):
         header.addStretch()
         
         self.count_label = QLabel("0 alerts")
-        self.count_label.setStyleSheet("color: #888888; font-size: 11px;")
+        self.count_label.setObjectName("recentCount")
         header.addWidget(self.count_label)
         
         layout.addLayout(header)
@@ -344,19 +369,34 @@ class RecentAlertsTimeline(QFrame):
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.itemClicked.connect(self._on_row_clicked)
         
+        # Fixed grid of items, re-labelled in place; unused rows are hidden
+        self.table.setRowCount(self.MAX_ROWS)
+        self._items = []
+        for row in range(self.MAX_ROWS):
+            row_items = [QTableWidgetItem() for _ in range(5)]
+            for col, item in enumerate(row_items):
+                self.table.setItem(row, col, item)
+            self._items.append(row_items)
+            self.table.setRowHidden(row, True)
+        self._columns_sized = False
+        
         layout.addWidget(self.table)
         
         # Empty state
         self.empty_label = QLabel("No recent alerts")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet("color: #888888; padding: 40px;")
+        self.empty_label.setObjectName("recentEmpty")
         self.empty_label.hide()
         layout.addWidget(self.empty_label)
         
         self.setLayout(layout)
     
-    def update_alerts(self, alerts_data: list):
-        """Update with latest 10 alerts"""
+    def update_alerts(self, alerts_data: list, total: int = None):
+        """Update with the latest MAX_ROWS alerts
+        
+        `total` is the overall alert count for the header when alerts_data
+        holds only the rows to display.
+        """
         if not alerts_data:
             self.table.hide()
             self.empty_label.show()
@@ -366,46 +406,38 @@ class RecentAlertsTimeline(QFrame):
         self.table.show()
         self.empty_label.hide()
         
-        # Limit to 10 most recent
-        recent = alerts_data[:10]
-        self.count_label.setText(f"{len(alerts_data)} alerts (showing {len(recent)})")
+        recent = alerts_data[:self.MAX_ROWS]
+        if total is None:
+            total = len(alerts_data)
+        self.count_label.setText(f"{total} alerts (showing {len(recent)})")
         
         self.table.setUpdatesEnabled(False)
-        self.table.setRowCount(len(recent))
-        
-        for row, alert in enumerate(recent):
-            items = [
-                QTableWidgetItem(alert["time"]),
-                QTableWidgetItem(alert["priority"]),
-                QTableWidgetItem(alert["classification"]),
-                QTableWidgetItem(alert["source_ip"]),
-                QTableWidgetItem(alert["confidence"])
-            ]
-            
-            for col, item in enumerate(items):
-                # Store batch_id in first column using UserRole
-                if col == 0:
-                    item.setData(Qt.ItemDataRole.UserRole, alert["batch_id"])
-                self.table.setItem(row, col, item)
-            
+        for row, row_items in enumerate(self._items):
+            if row >= len(recent):
+                self.table.setRowHidden(row, True)
+                continue
+            alert = recent[row]
+            texts = (
+                alert["time"], alert["priority"], alert["classification"],
+                alert["source_ip"], alert["confidence"]
+            )
             # Color by priority
-            color = self._get_priority_color(alert["priority"])
-            for col in range(5):
-                self.table.item(row, col).setForeground(color)
-        
+            color = _BUCKET_COLORS[alert["bucket"]]
+            for item, text in zip(row_items, texts):
+                item.setText(text)
+                item.setForeground(color)
+            # Store batch_id in first column using UserRole
+            row_items[0].setData(Qt.ItemDataRole.UserRole, alert["batch_id"])
+            self.table.setRowHidden(row, False)
         self.table.setUpdatesEnabled(True)
-        self.table.resizeColumnsToContents()
-    
-    def _get_priority_color(self, priority: str) -> QColor:
-        p = priority.lower()
-        if "critical" in p:
-            return QColor("#ff4444")
-        elif "high" in p:
-            return QColor("#ff8800")
-        elif "medium" in p:
-            return QColor("#ffaa00")
-        return QColor("#ffffff")
+        
+        # Size columns to the first real rows only; later the user's widths stay
+        if not self._columns_sized:
+            self._columns_sized = True
+            self.table.resizeColumnsToContents()
+            self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
     
+    @pyqtSlot(QTableWidgetItem)
     def _on_row_clicked(self, item):
         row = item.row()
         # Retrieve batch_id from UserRole in first column
@@ -414,6 +446,38 @@ class RecentAlertsTimeline(QFrame):
         self.alert_clicked.emit(batch_id, classification)
 
 
+class _RefreshSignals(QObject):
+    """Signals emitted by a _RefreshWorker (delivered on the GUI thread)"""
+    
+    finished = pyqtSignal(object, object, object)  # new results, cursor, stats
+    failed = pyqtSignal()
+
+
+class _RefreshWorker(QRunnable):
+    """Fetch new results and stats from the bridge off the GUI thread
+    
+    Only bridge calls run here; all widget updates happen in the slots
+    connected to the signals.
+    """
+    
+    def __init__(self, bridge, cursor: int, signals: _RefreshSignals):
+        super().__init__()
+        # The dashboard keeps a reference while in flight; Qt must not delete it
+        self.setAutoDelete(False)
+        self.bridge = bridge
+        self.cursor = cursor
+        self.signals = signals
+    
+    def run(self):
+        try:
+            new_results, cursor = self.bridge.get_results_since(self.cursor)
+            stats = self.bridge.get_stats()
+        except Exception:
+            self.signals.failed.emit()
+            return
+        self.signals.finished.emit(new_results, cursor, stats)
+
+
 class Dashboard(QWidget):
     """Main dashboard with Zones A-F"""
     
@@ -422,20 +486,64 @@ class Dashboard(QWidget):
     navigate_to_settings = pyqtSignal()
     alert_selected = pyqtSignal(str, str)
     
+    # New results are pushed by the bridge; the timer is only a heartbeat
+    # for status changes and a fallback for missed notifications
+    REFRESH_INTERVAL_MS = 30000
+    REFRESH_COALESCE_MS = 200
+    # Timer ticks and manual refreshes run at most once per window
+    REFRESH_THROTTLE_MS = 500
+    RECENT_RESULTS = 100
+    
     def __init__(self, bridge):
         super().__init__()
         self.bridge = bridge
         self._alerts_cache = []
+        # Formatted timeline rows by (batch_id, alert_id), for rows on screen
+        self._row_cache = {}
+        # Window of recent results, fed incrementally from the bridge cursor
+        self._cursor = 0
+        self._rendered_cursor = None
+        self._ingest_job = None
+        # Background fetch in flight, and whether another was requested meanwhile
+        self._fetch_job = None
+        self._refetch = False
+        self._fetch_signals = _RefreshSignals()
+        self._fetch_signals.finished.connect(self._apply_refresh)
+        self._fetch_signals.failed.connect(self._on_refresh_failed)
+        self._recent_results = deque(maxlen=self.RECENT_RESULTS)
+        self._bucket_counts = [0] * len(PRIORITY_BUCKETS)
         self._init_ui()
         
-        # Unified polling (3 seconds)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh)
-        self.timer.start(3000)
+        # Refresh when the bridge reports new results or status, coalescing bursts
+        # into at most one refresh per REFRESH_COALESCE_MS
+        self._refresh_pending = QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(self.REFRESH_COALESCE_MS)
+        self._refresh_pending.timeout.connect(self.refresh)
+        self.bridge.alerts_changed.connect(self._schedule_refresh)
+        self.bridge.stats_changed.connect(self._schedule_refresh)
+        
+        # Leading+trailing throttle for ticks and the Refresh button: the
+        # first request runs at once, later ones in the window fold into one
+        self._refresh_trailing = False
+        self._throttle = QTimer(self)
+        self._throttle.setSingleShot(True)
+        self._throttle.setInterval(self.REFRESH_THROTTLE_MS)
+        self._throttle.timeout.connect(self._on_throttle_timeout)
+        
+        # Heartbeat polling, paused while the dashboard is hidden
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.timeout.connect(self._request_refresh)
+        self.timer.start(self.REFRESH_INTERVAL_MS)
         
         self.refresh()
     
     def _init_ui(self):
+        # Zone styles come from the shared sheet, matched by class name,
+        # object name and dynamic property
+        self.setStyleSheet(MASTER_QSS)
+        
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
@@ -456,7 +564,7 @@ class Dashboard(QWidget):
         # Zone D: Actions
         self.actions_bar = QuickActionsBar()
         self.actions_bar.upload_clicked.connect(self._upload_logs)
-        self.actions_bar.refresh_clicked.connect(self.refresh)
+        self.actions_bar.refresh_clicked.connect(self._request_refresh)
         layout.addWidget(self.actions_bar)
         
         # Zone E: Recent Alerts
@@ -466,43 +574,92 @@ class Dashboard(QWidget):
         
         self.setLayout(layout)
     
+    @pyqtSlot()
+    def _schedule_refresh(self):
+        """Refresh at most once per REFRESH_COALESCE_MS while notifications arrive"""
+        if not self._refresh_pending.isActive():
+            self._refresh_pending.start()
+    
+    @pyqtSlot()
+    def _request_refresh(self):
+        """Refresh now, or once at the end of the current throttle window"""
+        if self._throttle.isActive():
+            self._refresh_trailing = True
+            return
+        self.refresh()
+        self._throttle.start()
+    
+    @pyqtSlot()
+    def _on_throttle_timeout(self):
+        if self._refresh_trailing:
+            self._refresh_trailing = False
+            self.refresh()
+            self._throttle.start()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start(self.REFRESH_INTERVAL_MS)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+    
+    @pyqtSlot()
     def refresh(self):
-        """Unified refresh - single data fetch"""
-        # Show loading state
-        self.threat_banner.set_level("loading", 0, 0)
+        """Unified refresh - single data fetch, run on the thread pool
+        
+        Zones update in _apply_refresh once the fetch completes. A request
+        made while a fetch is in flight starts one more fetch afterwards.
+        """
+        if not self.isVisible():
+            return
+        if self._fetch_job is not None:
+            self._refetch = True
+            return
         
+        # Only results added since the last fetch are requested
+        self._fetch_job = _RefreshWorker(self.bridge, self._cursor, self._fetch_signals)
+        QThreadPool.globalInstance().start(self._fetch_job)
+    
+    def _fetch_done(self):
+        self._fetch_job = None
+        if self._refetch:
+            self._refetch = False
+            self.refresh()
+    
+    @pyqtSlot()
+    def _on_refresh_failed(self):
+        self._rendered_cursor = None
+        self.threat_banner.set_level("normal", 0, 0)
+        self._fetch_done()
+    
+    @pyqtSlot(object, object, object)
+    def _apply_refresh(self, new_results: list, cursor: int, stats: dict):
+        """Update all zones from a completed fetch (GUI thread)"""
+        self._cursor = cursor
+        
+        # Collapse all zone updates below into a single repaint
+        self.setUpdatesEnabled(False)
         try:
-            # Single data fetch
-            results = self.bridge.get_latest_alerts(limit=100)
-            stats = self.bridge.get_stats()
+            if new_results:
+                self._add_results(new_results)
             
-            # Process alerts
-            total = critical = high = medium = low = 0
-            alerts_data = []
+            # Update Zone B: Status Strip
+            self.status_strip.update_status(
+                stats.get("pipeline_loaded", False),
+                stats.get("sources_count", 0),
+                stats.get("running", False),
+                stats.get("shutdown_flag", False)
+            )
             
-            for result in results:
-                for alert in result.alerts:
-                    total += 1
-                    p = alert.priority.lower()
-                    if "critical" in p:
-                        critical += 1
-                    elif "high" in p:
-                        high += 1
-                    elif "medium" in p:
-                        medium += 1
-                    elif "low" in p:
-                        low += 1
-                    
-                    alerts_data.append({
-                        "batch_id": result.batch_id,
-                        "time": alert.timestamp.strftime("%H:%M:%S") if hasattr(alert.timestamp, 'strftime') else str(alert.timestamp),
-                        "priority": alert.priority,
-                        "classification": alert.classification,
-                        "source_ip": getattr(alert, 'source_ip', 'N/A'),
-                        "confidence": f"{alert.confidence:.2f}" if hasattr(alert, 'confidence') else "N/A"
-                    })
+            # Counts and rows only move when new results arrive
+            if self._cursor == self._rendered_cursor:
+                return
             
-            self._alerts_cache = alerts_data
+            critical, high, medium, low, _ = self._bucket_counts
+            total = sum(self._bucket_counts)
+            alerts_data = self._alerts_cache
             
             # Update Zone A: Threat Banner
             if critical > 0:
@@ -514,23 +671,61 @@ class Dashboard(QWidget):
             else:
                 self.threat_banner.set_level("normal", critical, high)
             
-            # Update Zone B: Status Strip
-            self.status_strip.update_status(
-                stats.get("pipeline_loaded", False),
-                stats.get("sources_count", 0),
-                stats.get("running", False),
-                stats.get("shutdown_flag", False)
-            )
-            
             # Update Zone C: Metrics
             self.metrics_row.update_metrics(total, critical, high, medium, low)
             
             # Update Zone E: Alerts Timeline
-            self.alerts_timeline.update_alerts(alerts_data)
+            self.alerts_timeline.update_alerts(alerts_data, total)
+            self._rendered_cursor = self._cursor
             
         except Exception:
+            self._rendered_cursor = None
             self.threat_banner.set_level("normal", 0, 0)
-    
+        finally:
+            self.setUpdatesEnabled(True)
+            self._fetch_done()
+    
+    def _add_results(self, new_results: list):
+        """Slide new results into the recent window and rebuild timeline rows"""
+        window = self._recent_results
+        counts = self._bucket_counts
+        bucket_of = attrgetter("priority_bucket")
+        for result in new_results:
+            if len(window) == window.maxlen:
+                for bucket in map(bucket_of, window[0].alerts):
+                    counts[bucket] -= 1
+            window.append(result)
+            for bucket in map(bucket_of, result.alerts):
+                counts[bucket] += 1
+        
+        # Only the rows the timeline shows are built, newest first; rows
+        # still on screen from the last build are reused as formatted
+        alerts_data = []
+        previous = self._row_cache
+        cache = {}
+        max_rows = RecentAlertsTimeline.MAX_ROWS
+        for result in reversed(window):
+            if len(alerts_data) >= max_rows:
+                break
+            for alert in reversed(result.alerts[-(max_rows - len(alerts_data)):]):
+                key = (result.batch_id, alert.alert_id)
+                row = previous.get(key)
+                if row is None:
+                    row = {
+                        "batch_id": result.batch_id,
+                        "time": _format_time(alert.timestamp),
+                        "priority": alert.priority,
+                        "bucket": alert.priority_bucket,
+                        "classification": alert.classification,
+                        "source_ip": alert.source_ip or "N/A",
+                        "confidence": f"{alert.confidence:.2f}"
+                    }
+                cache[key] = row
+                alerts_data.append(row)
+        self._row_cache = cache
+        self._alerts_cache = alerts_data
+    
+    @pyqtSlot(str)
     def _on_metric_clicked(self, card_title: str):
         """Handle metric card click"""
         priority_map = {
@@ -547,6 +742,7 @@ class Dashboard(QWidget):
         else:
             self.navigate_to_alerts_filtered.emit(priority)
     
+    @pyqtSlot()
     def _upload_logs(self):
         """Upload log files"""
         files, _ = QFileDialog.getOpenFileNames(
@@ -560,17 +756,18 @@ class Dashboard(QWidget):
         self.actions_bar.upload_btn.setEnabled(False)
         self.actions_bar.upload_btn.setText("⏳ Processing...")
         
-        for file_path in files:
-            try:
-                self.bridge.add_file_source(file_path)
-            except Exception:
-                pass
-        
+        # Files are analyzed on a pool thread; the button re-enables when done
+        self._ingest_job = FileIngestJob(self.bridge, files)
+        self._ingest_job.signals.finished.connect(self._on_upload_finished)
+        QThreadPool.globalInstance().start(self._ingest_job)
+    
+    @pyqtSlot(int)
+    def _on_upload_finished(self, success_count: int):
         self.bridge.start_ingestion()
-        
-        QTimer.singleShot(1000, self._reset_upload_btn)
-        QTimer.singleShot(500, self.refresh)
+        self.refresh()
+        self._reset_upload_btn()
     
+    @pyqtSlot()
     def _reset_upload_btn(self):
         self.actions_bar.upload_btn.setEnabled(True)
         self.actions_bar.upload_btn.setText("📁 Upload Logs")
@@ -0,0 +1,39 @@
+"""Background file ingestion for the dashboards"""
+
+from typing import List
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class FileIngestSignals(QObject):
+    """Signals emitted by a FileIngestJob (delivered on the GUI thread)"""
+    
+    progress = pyqtSignal(int)  # files completed so far
+    finished = pyqtSignal(int)  # files processed successfully
+
+
+class FileIngestJob(QRunnable):
+    """Feed selected files to the bridge off the GUI thread
+    
+    Files are processed one after another inside a single job so the
+    pipeline never sees concurrent batches and results keep file order.
+    """
+    
+    def __init__(self, bridge, files: List[str]):
+        super().__init__()
+        # The submitting widget keeps a reference; Qt must not delete it
+        self.setAutoDelete(False)
+        self.bridge = bridge
+        self.files = list(files)
+        self.signals = FileIngestSignals()
+    
+    def run(self):
+        success_count = 0
+        for i, file_path in enumerate(self.files):
+            try:
+                if self.bridge.add_file_source(file_path):
+                    success_count += 1
+            except Exception:
+                pass
+            self.signals.progress.emit(i + 1)
+        self.signals.finished.emit(success_count)
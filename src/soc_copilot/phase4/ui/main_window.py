@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QSplitter, QTabWidget, QStatusBar, QMenuBar, QMenu,
     QStackedWidget, QPushButton, QFrame, QLabel
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor, QPen, QPolygonF, QFont
 from PyQt6.QtCore import QPointF
 
@@ -103,7 +103,7 @@ class Sidebar(QFrame):
         super().__init__()
         self.bridge = bridge
         self._init_ui()
-        self._start_polling()
+        self._update_status()
     
     def _init_ui(self):
         self.setFixedWidth(200)
@@ -188,16 +188,15 @@ class Sidebar(QFrame):
             btn.setActive(btn.index == index)
         self.nav_changed.emit(index)
     
-    def _start_polling(self):
-        """Poll for status and badge updates (reduced to 3 seconds)"""
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self._update_status)
-        self.poll_timer.start(3000)  # Reduced from 1000ms
+    @pyqtSlot()
+    def refresh_status(self):
+        """Public method to refresh the status section (called by MainWindow)"""
         self._update_status()
     
     def _update_status(self):
         try:
-            stats = self.bridge.get_stats()
+            # Counts and status in one call; no alert payloads cross the bridge
+            stats = self.bridge.get_priority_summary()
             
             # Update status indicator
             if stats.get("shutdown_flag"):
@@ -217,12 +216,8 @@ class Sidebar(QFrame):
                 self.status_detail.setText("Loading ML models")
             
             # Update nav badges
-            alerts = self.bridge.get_latest_alerts(limit=100)
-            total_alerts = sum(len(r.alerts) for r in alerts)
-            critical_count = sum(
-                1 for r in alerts for a in r.alerts 
-                if "critical" in a.priority.lower()
-            )
+            total_alerts = stats["total"]
+            critical_count = stats["critical"]
             
             # Alerts button badge
             if critical_count > 0:
@@ -248,6 +243,12 @@ class MainWindow(QMainWindow):
     """Optimized SOC Copilot main window with sidebar navigation"""
     
     VERSION = "0.3.0"
+    # Status is pushed by the bridge's alerts_changed and stats_changed;
+    # the heartbeat is a safety net for anything else
+    STATUS_INTERVAL_MS = 30000
+    STATUS_COALESCE_MS = 200
+    # The kill switch flips on its own, so it alone is polled quickly
+    KILL_SWITCH_POLL_MS = 3000
     
     def __init__(self, controller):
         super().__init__()
@@ -289,7 +290,7 @@ class MainWindow(QMainWindow):
                 color: #00d4ff;
                 font-weight: bold;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #0f1629;
                 alternate-background-color: #12192e;
                 gridline-color: #1a2744;
@@ -399,10 +400,21 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self._update_status_bar()
         
-        # Status bar updates (reduced to 3 seconds)
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_status_bar)
-        self.status_timer.start(3000)
+        # One status refresh feeds both the sidebar and the status bar
+        self._status_pending = QTimer(self)
+        self._status_pending.setSingleShot(True)
+        self._status_pending.setInterval(self.STATUS_COALESCE_MS)
+        self._status_pending.timeout.connect(self._refresh_status)
+        self.bridge.alerts_changed.connect(self._schedule_status)
+        self.bridge.stats_changed.connect(self._schedule_status)
+        
+        self.status_timer = QTimer(self)
+        self.status_timer.timeout.connect(self._refresh_status)
+        self.status_timer.start(self.STATUS_INTERVAL_MS)
+        
+        self.kill_switch_timer = QTimer(self)
+        self.kill_switch_timer.timeout.connect(self.bridge.poll_kill_switch)
+        self.kill_switch_timer.start(self.KILL_SWITCH_POLL_MS)
         
         # Keyboard shortcuts
         self._setup_shortcuts()
@@ -424,6 +436,7 @@ class MainWindow(QMainWindow):
         # Escape to return to dashboard
         QShortcut(QKeySequence("Escape"), self).activated.connect(lambda: self._on_nav_changed(0))
     
+    @pyqtSlot()
     def _refresh_current_view(self):
         """Refresh the currently active view"""
         current_index = self.page_stack.currentIndex()
@@ -433,6 +446,7 @@ class MainWindow(QMainWindow):
             self.alerts_view.refresh()
         self.status_bar.showMessage("View refreshed", 1000)
     
+    @pyqtSlot(int)
     def _on_nav_changed(self, index: int):
         """Handle navigation changes"""
         self.page_stack.setCurrentIndex(index)
@@ -441,6 +455,7 @@ class MainWindow(QMainWindow):
         for btn in self.sidebar.nav_buttons:
             btn.setActive(btn.index == index)
     
+    @pyqtSlot(str)
     def _on_navigate_alerts_filtered(self, priority: str):
         """Navigate to alerts with a specific priority filter"""
         # Switch to alerts page
@@ -452,6 +467,7 @@ class MainWindow(QMainWindow):
         
         self.status_bar.showMessage(f"Showing {priority.title()} priority alerts", 2000)
     
+    @pyqtSlot(str, str)
     def _on_alert_selected(self, batch_id: str, alert_classification: str):
         """Handle alert selection - navigate to investigation"""
         try:
@@ -473,6 +489,18 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.status_bar.showMessage(f"Error: {str(e)}", 3000)
     
+    @pyqtSlot()
+    def _schedule_status(self):
+        """Refresh status at most once per STATUS_COALESCE_MS while changes arrive"""
+        if not self._status_pending.isActive():
+            self._status_pending.start()
+    
+    @pyqtSlot()
+    def _refresh_status(self):
+        self.sidebar.refresh_status()
+        self._update_status_bar()
+    
+    @pyqtSlot()
     def _update_status_bar(self):
         """Update status bar with real-time info"""
         try:
@@ -499,7 +527,10 @@ class MainWindow(QMainWindow):
             if stats.get("shutdown_flag"):
                 parts.append("🛑 KILL SWITCH ACTIVE")
             
-            self.status_bar.showMessage(" │ ".join(parts))
+            # An unchanged message is not re-shown, so the bar is not repainted
+            message = " │ ".join(parts)
+            if message != self.status_bar.currentMessage():
+                self.status_bar.showMessage(message)
             
         except Exception:
             self.status_bar.showMessage("Status unavailable")
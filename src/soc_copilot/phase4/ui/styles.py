@@ -0,0 +1,14 @@
+"""Shared widget stylesheet, read once at import"""
+
+from pathlib import Path
+
+
+MASTER_QSS = (Path(__file__).parent / "styles.qss").read_text(encoding="utf-8")
+
+
+def repolish(widget):
+    """Re-apply stylesheet rules after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -112,7 +112,7 @@ def test_alerts_view_hides_empty_state_with_alerts(alerts_view, mock_bridge):
     
     assert not alerts_view.empty_label.isVisible()
     assert alerts_view.table.isVisible()
-    assert alerts_view.table.rowCount() == 1
+    assert alerts_view.model.rowCount() == 1
 
 
 def test_alerts_view_handles_error_gracefully(alerts_view, mock_bridge):
@@ -133,7 +133,7 @@ def test_alerts_view_safe_refresh_with_empty_results(alerts_view, mock_bridge):
     # Should not raise exception
     alerts_view.refresh()
     
-    assert alerts_view.table.rowCount() == 0
+    assert alerts_view.model.rowCount() == 0
     assert alerts_view.empty_label.isVisible()
 
 
@@ -150,3 +150,54 @@ def test_alerts_view_configured_state(alerts_view, mock_bridge):
     
     assert "No alerts detected" in alerts_view.empty_label.text()
     assert alerts_view.empty_label.isVisible()
+
+
+def test_alerts_view_counter_single_pass(alerts_view):
+    """Counter label should tally priorities from one pass over the cache"""
+    alerts_data = [
+        {"priority": "P0-Critical"},
+        {"priority": "P1-High"},
+        {"priority": "P1-High"},
+        {"priority": "P2-Medium"},
+        {"priority": "P4-Info"},
+    ]
+    
+    alerts_view._update_counter(alerts_data)
+    
+    text = alerts_view.counter_label.text()
+    assert "Total: 5" in text
+    assert "Critical: 1" in text
+    assert "High: 2" in text
+    assert "Medium: 1" in text
+
+
+def test_alerts_view_empty_state_cached_between_timer_ticks(alerts_view, mock_bridge):
+    """Consecutive empty timer refreshes should reuse the cached stats"""
+    alerts_view.refresh()
+    calls = mock_bridge.get_stats.call_count
+    
+    alerts_view._incremental_refresh()
+    alerts_view._incremental_refresh()
+    
+    assert mock_bridge.get_stats.call_count == calls
+    assert "No log sources configured" in alerts_view.empty_label.text()
+    
+    # Expired cache refetches
+    alerts_view._empty_cache = (None, "", -alerts_view.EMPTY_STATE_TTL)
+    alerts_view._incremental_refresh()
+    assert mock_bridge.get_stats.call_count == calls + 1
+
+
+def test_alerts_model_multiple_roles(alerts_view):
+    """MULTIPLE_ROLES should return display text and color in one call"""
+    from PyQt6.QtCore import Qt
+    from soc_copilot.phase4.ui.alerts_view import MULTIPLE_ROLES
+    
+    alerts_view._update_table([{
+        "time": "12:00:00", "priority": "P0-Critical", "classification": "Malware",
+        "source_ip": "10.0.0.1", "confidence": "0.99", "batch_id": "batch-1",
+    }])
+    
+    roles = alerts_view.model.index(0, 2).data(MULTIPLE_ROLES)
+    assert roles[Qt.ItemDataRole.DisplayRole] == "Malware"
+    assert roles[Qt.ItemDataRole.ForegroundRole].name() == "#ff4444"
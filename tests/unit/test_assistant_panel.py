@@ -0,0 +1,124 @@
+"""Unit tests for the assistant chat panel"""
+
+import pytest
+from unittest.mock import Mock
+
+from PyQt6.QtGui import QFont
+
+from soc_copilot.phase4.ui.assistant_panel import AssistantPanel
+
+
+@pytest.fixture
+def panel(qtbot):
+    """Create assistant panel widget"""
+    widget = AssistantPanel()
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture
+def alert():
+    """Create mock alert summary"""
+    return Mock(
+        classification="PortScan",
+        confidence=0.9,
+        anomaly_score=0.5,
+        risk_score=0.8,
+        priority="P1-High",
+        reasoning="Many ports probed",
+        suggested_action="Block source",
+        source_ip="10.0.0.5",
+        destination_ip=None,
+    )
+
+
+def test_welcome_message_shown(panel):
+    """Panel should greet the user on startup"""
+    assert "Assistant Ready" in panel.chat_display.toPlainText()
+
+
+def test_explain_alert_renders_explanation(panel, alert):
+    """Selecting an alert should render its explanation in the header labels"""
+    panel.explain_alert(alert)
+    
+    assert "Analyzing: PortScan" in panel.explanation_title.text()
+    assert "Port scanning is reconnaissance" in panel.explanation_answer.text()
+    assert "<b>PortScan</b>" in panel.explanation_answer.text()
+    assert "Assistant Ready" not in panel.chat_display.toPlainText()
+
+
+def test_quick_action_appends_response(panel, alert):
+    """Quick actions should append to the follow-up chat"""
+    panel.explain_alert(alert)
+    panel._handle_quick_action("risk")
+    panel._handle_quick_action("why")
+    
+    text = panel.chat_display.toPlainText()
+    assert "Level: HIGH" in text
+    assert "This alert was generated because" in text
+
+
+def test_chat_scrollback_is_bounded(panel):
+    """Long sessions should not grow the chat document without bound"""
+    for i in range(panel.MAX_CHAT_BLOCKS * 2):
+        panel._add_message("user", f"question {i}")
+    
+    assert panel.chat_display.document().blockCount() <= panel.MAX_CHAT_BLOCKS
+
+
+def test_bold_markers_are_paired(panel):
+    """**text** should render bold without leaking markers or open tags"""
+    panel._add_message("assistant", "**Risk** is <high> & **rising**")
+    
+    text = panel.chat_display.toPlainText()
+    assert "**" not in text
+    assert "Risk is <high> & rising" in text
+
+
+def test_system_messages_keep_bold(panel):
+    """**text** in a system message should render bold as well as italic"""
+    panel._add_message("system", "Alert **escalated**")
+    
+    cursor = panel.chat_display.document().find("escalated")
+    fmt = cursor.charFormat()
+    assert fmt.fontWeight() == QFont.Weight.Bold
+    assert fmt.fontItalic()
+
+
+def test_quick_action_response_is_memoized(panel, alert):
+    """Repeated quick actions on the same alert should reuse the response"""
+    panel.explain_alert(alert)
+    panel._generate_risk = Mock(wraps=panel._generate_risk)
+    
+    panel._handle_quick_action("risk")
+    panel._handle_quick_action("risk")
+    
+    assert panel._generate_risk.call_count == 1
+    assert panel.chat_display.toPlainText().count("Level: HIGH") == 2
+
+
+def test_general_answers_match_whole_words(panel):
+    """General questions should match keywords as words, not substrings"""
+    assert panel._answer_general("hello there").startswith("Hi there!")
+    assert panel._answer_general("help?").startswith("I can help you understand")
+    # "this" contains "hi" but is not a greeting
+    assert panel._answer_general("what is this").startswith("I can help analyze")
+
+
+def test_quick_actions_built_on_first_alert(panel, alert):
+    """Quick action buttons should only be created once an alert is selected"""
+    assert panel.quick_buttons == []
+    
+    panel.explain_alert(alert)
+    buttons = list(panel.quick_buttons)
+    assert len(buttons) == 4
+    
+    panel.explain_alert(alert)
+    assert panel.quick_buttons == buttons
+
+
+def test_chat_display_keeps_no_undo_history(panel):
+    """The read-only chat log should not record undo steps"""
+    panel._add_message("user", "hello")
+    
+    assert not panel.chat_display.document().isUndoAvailable()
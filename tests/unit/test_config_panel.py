@@ -267,6 +267,78 @@ class TestConfigSafety:
         assert "socket" not in source.lower()
 
 
+# ============================================================================
+# ConfigPanel Widget Tests
+# ============================================================================
+
+class TestConfigPanelWidgets:
+    """Test ConfigPanel widgets with a QApplication"""
+    
+    def test_toggle_switch_moves_knob(self, qtbot):
+        """Toggling should slide the knob without rebuilding a layout"""
+        from soc_copilot.phase4.ui.config_panel import ToggleSwitch
+        
+        toggled = []
+        toggle = ToggleSwitch(False, toggled.append)
+        qtbot.addWidget(toggle)
+        assert toggle.knob.x() == ToggleSwitch.KNOB_OFF_X
+        
+        toggle.mousePressEvent(None)
+        
+        assert toggle.is_on()
+        assert toggled == [True]
+        assert toggle.knob.x() == ToggleSwitch.KNOB_ON_X
+        
+        toggle.set_state(False)
+        assert toggle.knob.x() == ToggleSwitch.KNOB_OFF_X
+    
+    def test_toggle_state_property(self, qtbot):
+        """State changes should set a style property, not a new stylesheet"""
+        from soc_copilot.phase4.ui.config_panel import ToggleSwitch
+        
+        toggle = ToggleSwitch(True)
+        qtbot.addWidget(toggle)
+        assert toggle.property("on") is True
+        assert toggle.styleSheet() == ""
+    
+    def test_status_grid_updates(self, qtbot):
+        """StatusGrid should store row values and repaint only on change"""
+        from soc_copilot.phase4.ui.config_panel import StatusGrid
+        
+        grid = StatusGrid()
+        qtbot.addWidget(grid)
+        grid.add_status("kill", "Kill Switch", "Inactive", "#4CAF50")
+        grid.add_status("perm", "Permissions", "OK", "#4CAF50")
+        assert grid.sizeHint().height() == StatusGrid.ROW_HEIGHT
+        
+        grid.update = Mock()
+        grid.update_status("kill", "Inactive", "#4CAF50")
+        grid.update.assert_not_called()
+        
+        grid.update_status("kill", "Active", "#f44336")
+        assert grid.status("kill") == ("Active", "#f44336")
+        grid.update.assert_called_once()
+    
+    def test_refresh_skips_unchanged_indicators(self, qtbot, tmp_path):
+        """Refreshing with unchanged state should not repaint the grid"""
+        from soc_copilot.phase4.ui.config_panel import ConfigPanel
+        
+        bridge = Mock()
+        bridge.get_stats.return_value = {"running": True, "sources_count": 1}
+        panel = ConfigPanel(bridge, tmp_path)
+        qtbot.addWidget(panel)
+        assert panel.status_grid.status("ingestion") == ("Active", "#4caf50")
+        
+        panel.status_grid.update = Mock()
+        panel.refresh()
+        panel.status_grid.update.assert_not_called()
+        
+        bridge.get_stats.return_value = {"shutdown_flag": True, "sources_count": 1}
+        panel.refresh()
+        panel.status_grid.update.assert_called_once()
+        assert panel.status_grid.status("ingestion") == ("Stopped", "#ffc107")
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
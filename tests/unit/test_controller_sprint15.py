@@ -41,6 +41,22 @@ class TestSchemas:
         assert alert.alert_id == "test-001"
         assert alert.priority == "P1-High"
         assert alert.classification == "BruteForce"
+        assert alert.priority_bucket == 1
+    
+    def test_priority_bucket(self):
+        """Test priority label to bucket mapping"""
+        from soc_copilot.phase4.controller.schemas import priority_bucket
+        
+        assert priority_bucket("P0-Critical") == 0
+        assert priority_bucket("P1-High") == 1
+        assert priority_bucket("P2-Medium") == 2
+        assert priority_bucket("p3-low") == 3
+        assert priority_bucket("P4-Info") == 4
+        
+        # Repeated labels are served from the cache
+        hits = priority_bucket.cache_info().hits
+        assert priority_bucket("P1-High") == 1
+        assert priority_bucket.cache_info().hits == hits + 1
     
     def test_pipeline_stats_creation(self):
         """Test PipelineStats creation"""
@@ -165,6 +181,70 @@ class TestResultStore:
         store.clear()
         assert store.count() == 0
     
+    def test_get_since_cursor(self):
+        """get_since should return only results added after the cursor"""
+        store = ResultStore(max_results=3)
+        
+        results, cursor = store.get_since(0)
+        assert results == [] and cursor == 0
+        
+        for i in range(2):
+            store.add(self._create_mock_result(f"batch-{i}"))
+        results, cursor = store.get_since(cursor)
+        assert [r.batch_id for r in results] == ["batch-0", "batch-1"]
+        
+        results, cursor = store.get_since(cursor)
+        assert results == []
+        
+        for i in range(2, 7):
+            store.add(self._create_mock_result(f"batch-{i}"))
+        results, cursor = store.get_since(cursor)
+        assert [r.batch_id for r in results] == ["batch-4", "batch-5", "batch-6"]
+        assert cursor == 7
+    
+    def test_priority_counts_follow_inserts_and_evictions(self):
+        """Priority counters should track only the results still stored"""
+        store = ResultStore(max_results=2)
+        store.add(self._create_mock_result("batch-0", "P0-Critical", "P1-High"))
+        store.add(self._create_mock_result("batch-1", "P1-High"))
+        
+        counts = store.priority_counts()
+        assert counts["critical"] == 1
+        assert counts["high"] == 2
+        assert counts["total"] == 3
+        
+        store.add(self._create_mock_result("batch-2", "P4-Info"))
+        counts = store.priority_counts()
+        assert counts["critical"] == 0
+        assert counts["high"] == 1
+        assert counts["info"] == 1
+        assert counts["total"] == 2
+        
+        store.clear()
+        assert store.priority_counts()["total"] == 0
+    
+    def test_get_recent_alerts(self):
+        """Recent alerts should be the newest ones, newest first, capped at limit"""
+        store = ResultStore(max_results=10)
+        store.add(self._create_mock_result("batch-0", "P0-Critical", "P1-High"))
+        store.add(self._create_mock_result("batch-1", "P2-Medium", "P3-Low"))
+        
+        recent = store.get_recent_alerts(limit=3)
+        assert [(b, a.priority) for b, a in recent] == [
+            ("batch-1", "P3-Low"), ("batch-1", "P2-Medium"), ("batch-0", "P1-High")
+        ]
+        assert len(store.get_recent_alerts(limit=10)) == 4
+    
+    def test_snapshot(self):
+        """Snapshot should pair the counters with the newest alerts"""
+        store = ResultStore(max_results=10)
+        store.add(self._create_mock_result("batch-0", "P0-Critical", "P1-High"))
+        
+        counts, recent = store.snapshot(limit=1)
+        assert counts["total"] == 2
+        assert counts["critical"] == 1
+        assert [(b, a.priority) for b, a in recent] == [("batch-0", "P1-High")]
+    
     def test_thread_safety(self):
         """Test thread-safe operations"""
         store = ResultStore(max_results=100)
@@ -185,12 +265,28 @@ class TestResultStore:
         # Should have added results safely
         assert store.count() <= 100
     
-    def _create_mock_result(self, batch_id: str) -> AnalysisResult:
-        """Create mock analysis result"""
+    def _create_mock_result(self, batch_id: str, *priorities: str) -> AnalysisResult:
+        """Create mock analysis result with one alert per priority"""
+        alerts = [
+            AlertSummary(
+                alert_id=f"{batch_id}-{i}",
+                priority=priority,
+                classification="BruteForce",
+                confidence=0.9,
+                anomaly_score=0.5,
+                risk_score=0.5,
+                source_ip=None,
+                destination_ip=None,
+                timestamp=datetime.now(),
+                reasoning="Test",
+                suggested_action="Test"
+            )
+            for i, priority in enumerate(priorities)
+        ]
         return AnalysisResult(
             batch_id=batch_id,
             timestamp=datetime.now(),
-            alerts=[],
+            alerts=alerts,
             stats=PipelineStats(
                 total_records=0,
                 processed_records=0,
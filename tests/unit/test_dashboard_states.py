@@ -4,7 +4,12 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from datetime import datetime
 
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QFileDialog, QScrollArea
+
 from soc_copilot.phase4.ui.dashboard import Dashboard
+from soc_copilot.phase4.ui.dashboard_components import AlertRow, CompactMetricCard, RecentAlertItem
 
 
 @pytest.fixture
@@ -150,3 +155,313 @@ def test_dashboard_get_ingestion_status_configured(dashboard):
     stats = {"running": False, "shutdown_flag": False, "sources_count": 1}
     status = dashboard._get_ingestion_status(stats)
     assert status == "Configured"
+
+
+def make_snapshot(bridge, **counts):
+    """Build a dashboard snapshot with the given priority counts"""
+    return {
+        "counts": {
+            "total": 0, "critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0,
+            **counts
+        },
+        "recent_alerts": [],
+        "stats": bridge.get_stats.return_value,
+    }
+
+
+def test_dashboard_skips_refresh_while_hidden(dashboard, mock_bridge):
+    """Dashboard should not poll the bridge while it is hidden"""
+    dashboard.hide()
+    assert not dashboard.timer.isActive()
+    mock_bridge.get_dashboard_snapshot.reset_mock()
+    
+    dashboard.refresh()
+    mock_bridge.get_dashboard_snapshot.assert_not_called()
+    
+    dashboard.show()
+    assert mock_bridge.get_dashboard_snapshot.called
+    assert dashboard.timer.isActive()
+
+
+def test_dashboard_skips_unchanged_payload(dashboard, mock_bridge):
+    """Unchanged counts should only move the footer timestamp"""
+    mock_bridge.get_dashboard_snapshot.return_value = make_snapshot(mock_bridge)
+    dashboard.refresh()
+    dashboard.alerts_timeline.update_alerts = Mock()
+    dashboard.health_grid.update_status = Mock()
+    
+    dashboard.refresh()
+    dashboard.alerts_timeline.update_alerts.assert_not_called()
+    dashboard.health_grid.update_status.assert_not_called()
+    assert "Last updated" in dashboard.last_update_label.text()
+
+
+def test_dashboard_polling_backs_off_while_idle(dashboard, mock_bridge):
+    """Idle ticks should stretch the interval; new alerts should reset it"""
+    mock_bridge.get_dashboard_snapshot.return_value = make_snapshot(mock_bridge)
+    dashboard.refresh()
+    assert dashboard.timer.interval() == dashboard.MIN_REFRESH_INTERVAL_MS
+    
+    dashboard.refresh()
+    dashboard.refresh()
+    assert dashboard.timer.interval() == dashboard.MIN_REFRESH_INTERVAL_MS * 4
+    
+    for _ in range(10):
+        dashboard.refresh()
+    assert dashboard.timer.interval() == dashboard.MAX_REFRESH_INTERVAL_MS
+    
+    mock_bridge.get_dashboard_snapshot.return_value = make_snapshot(mock_bridge, total=1, low=1)
+    dashboard.refresh()
+    assert dashboard.timer.interval() == dashboard.MIN_REFRESH_INTERVAL_MS
+    assert dashboard.timer.timerType() == Qt.TimerType.CoarseTimer
+
+
+def test_dashboard_timeline_rows(dashboard, mock_bridge):
+    """Recent alerts should reach the timeline as AlertRow tuples"""
+    alert = Mock(alert_id="a1", classification="BruteForce", priority_bucket=0, source_ip=None)
+    snapshot = make_snapshot(mock_bridge, total=1, critical=1)
+    snapshot["recent_alerts"] = [("b1", alert)]
+    mock_bridge.get_dashboard_snapshot.return_value = snapshot
+    dashboard.alerts_timeline.update_alerts = Mock()
+    
+    dashboard.refresh()
+    
+    rows, total = dashboard.alerts_timeline.update_alerts.call_args[0]
+    assert total == 1
+    assert rows[0].batch_id == "b1"
+    assert rows[0].priority == "critical"
+    assert rows[0].source_ip == ""
+
+
+def test_metric_card_skips_unchanged_value(dashboard):
+    """Setting the same value and trend again should not touch the labels"""
+    card = dashboard.critical_card
+    card.set_value(3, 1)
+    assert card.value_label.text() == "3"
+    card.value_label.setText = Mock()
+    
+    card.set_value(3, 1)
+    card.value_label.setText.assert_not_called()
+    
+    card.set_value(3, 0)
+    card.value_label.setText.assert_called_once_with("3")
+
+
+def test_metric_card_clicks_navigate(dashboard):
+    """Cards should navigate to all alerts or to their priority filter"""
+    all_alerts = Mock()
+    filtered = Mock()
+    dashboard.navigate_to_alerts.connect(all_alerts)
+    dashboard.navigate_to_alerts_filtered.connect(filtered)
+    
+    dashboard.total_card.clicked.emit("total")
+    dashboard.high_card.clicked.emit("high")
+    
+    all_alerts.assert_called_once_with()
+    filtered.assert_called_once_with("high")
+
+
+def test_footer_label_caches_static_text(dashboard):
+    """The footer should only relayout its text when the text changes"""
+    label = dashboard.last_update_label
+    label.setText("Last updated: 12:00:00")
+    width = label.sizeHint().width()
+    assert width > 0
+    label.update = Mock()
+    
+    label.setText("Last updated: 12:00:00")
+    label.update.assert_not_called()
+    
+    label.setText("Last updated: 1")
+    label.update.assert_called_once()
+    assert label.text() == "Last updated: 1"
+    assert label.sizeHint().width() == width
+
+
+def test_progress_bar_created_on_first_upload(dashboard, mock_bridge, monkeypatch):
+    """The upload progress bar should only exist once an upload starts"""
+    assert dashboard.progress_bar is None
+    monkeypatch.setattr(QFileDialog, "getOpenFileNames", Mock(return_value=(["a.log"], "")))
+    monkeypatch.setattr(QThreadPool, "globalInstance", Mock())
+    
+    dashboard._upload_logs()
+    
+    bar = dashboard.progress_bar
+    assert bar is not None
+    assert dashboard.layout().indexOf(bar) == dashboard.layout().indexOf(dashboard.alerts_timeline) - 1
+    assert bar.maximum() == 1
+    
+    # Uploading is disabled until the ingest job finishes
+    assert not dashboard.quick_actions.upload_btn.isEnabled()
+    dashboard._on_upload_finished(1)
+    assert dashboard.quick_actions.upload_btn.isEnabled()
+
+
+def test_health_grid_skips_unchanged_rows(dashboard):
+    """Re-applying a row's current value should not re-polish it"""
+    grid = dashboard.health_grid
+    grid.update_status("pipeline", "Active", "Active", "#4CAF50")
+    led, value = grid.rows["pipeline"]
+    assert led.property("tone") == "ok"
+    led.setProperty = Mock()
+    
+    grid.update_status("pipeline", "Active", "Active", "#4CAF50")
+    led.setProperty.assert_not_called()
+    
+    grid.update_status("pipeline", "Loading", "Loading...", "#ffa000")
+    led.setProperty.assert_called_once_with("tone", "warn")
+    assert value.text() == "Loading..."
+    assert led.styleSheet() == ""
+
+
+def test_threat_banner_restyles_only_on_level_change(dashboard):
+    """The banner should only be re-polished when the level changes"""
+    banner = dashboard.threat_banner
+    banner.set_threat_level(0, 2, 0, 2)
+    assert banner.threat_value.text() == "HIGH"
+    assert banner.property("level") == "high"
+    banner.setProperty = Mock()
+    
+    banner.set_threat_level(0, 3, 0, 3)
+    banner.setProperty.assert_not_called()
+    assert banner.action_count_label.text() == "3 Alerts"
+    
+    banner.set_threat_level(1, 3, 0, 4)
+    banner.setProperty.assert_called_once_with("level", "critical")
+    assert banner.threat_value.text() == "CRITICAL"
+    assert banner.styleSheet() == ""
+
+
+def test_components_styled_by_shared_sheet(dashboard):
+    """Components should carry selector properties instead of own sheets"""
+    card = dashboard.high_card
+    assert card.styleSheet() == ""
+    assert card.property("priority") == "high"
+    
+    card.set_value(5, 2)
+    assert card.trend_label.property("trend") == "up"
+    card.set_value(4, -1)
+    assert card.trend_label.property("trend") == "down"
+    
+    item = RecentAlertItem("b1", "BruteForce", "Critical", "10.0.0.1", "12:00:00")
+    assert item.styleSheet() == ""
+    assert item.property("priority") == "critical"
+    
+    banner = dashboard.threat_banner
+    for widget in (banner.threat_container, banner.threat_label,
+                   banner.action_count_label, banner.action_text, banner.view_btn):
+        assert widget.styleSheet() == ""
+    
+    # Container sheets would cascade onto child QLabels (QLabel is a QFrame)
+    assert dashboard.alerts_timeline.styleSheet() == ""
+    assert dashboard.health_grid.styleSheet() == ""
+    scroll = dashboard.alerts_timeline.findChild(QScrollArea, "timelineScroll")
+    assert scroll is not None and scroll.styleSheet() == ""
+    assert dashboard.alerts_timeline._empty_widget.styleSheet() == ""
+
+
+def test_timeline_reuses_pooled_items(dashboard):
+    """Timeline updates should re-label the same item widgets"""
+    timeline = dashboard.alerts_timeline
+    pool = list(timeline._pool)
+    assert len(pool) == timeline.MAX_ITEMS
+    
+    timeline.update_alerts([AlertRow("b1", "BruteForce", "high", "", "12:00:00")], 1)
+    timeline.flush()
+    assert not timeline._pool[0].isHidden()
+    assert timeline._pool[1].isHidden()
+    assert timeline._empty_widget.isHidden()
+    assert timeline._pool[0].ip_label.isHidden()
+    
+    timeline.update_alerts([AlertRow("b2", "PortScan", "critical", "10.0.0.1", "12:00:01")], 2)
+    timeline.flush()
+    assert timeline._pool == pool
+    assert timeline._pool[0].class_label.text() == "PortScan"
+    assert timeline._pool[0].property("priority") == "critical"
+    assert timeline.count_label.text() == "2 alerts"
+    
+    timeline.update_alerts([])
+    timeline.flush()
+    assert not timeline._empty_widget.isHidden()
+    assert timeline._pool[0].isHidden()
+
+
+def test_timeline_update_bursts_coalesce(dashboard):
+    """Rapid timeline updates should redraw once with the latest rows"""
+    timeline = dashboard.alerts_timeline
+    for i in range(5):
+        timeline.update_alerts([AlertRow(f"b{i}", "PortScan", "high", "", "12:00:00")], i + 1)
+    assert timeline._update_timer.isActive()
+    assert timeline._pool[0].isHidden()
+    
+    timeline._update_timer.timeout.emit()
+    assert timeline._pool[0].batch_id == "b4"
+    assert timeline.count_label.text() == "5 alerts"
+
+
+def test_banner_and_cards_have_no_graphics_effect(dashboard):
+    """Banner and metric cards should not use blurred drop-shadow effects"""
+    assert dashboard.threat_banner.graphicsEffect() is None
+    for card in dashboard.findChildren(CompactMetricCard):
+        assert card.graphicsEffect() is None
+
+
+def test_timeline_update_restores_updates_after_error(dashboard):
+    """Timeline painting must be re-enabled even if an item update fails"""
+    timeline = dashboard.alerts_timeline
+    timeline._pool[0].update_data = Mock(side_effect=RuntimeError("bad row"))
+    timeline.update_alerts([AlertRow("b1", "PortScan", "high", "", "12:00:00")], 1)
+    with pytest.raises(RuntimeError):
+        timeline.flush()
+    assert timeline.updatesEnabled()
+
+
+def test_timeline_consumes_at_most_max_items(dashboard):
+    """An iterator of rows should only be read up to the display limit"""
+    timeline = dashboard.alerts_timeline
+    rows = (AlertRow(f"b{i}", "PortScan", "high", "", "12:00:00") for i in range(100))
+    timeline.update_alerts(rows, 100, max_items=3)
+    timeline.flush()
+    
+    assert next(rows).batch_id == "b3"
+    assert [item.isHidden() for item in timeline._pool[:4]] == [False, False, False, True]
+    assert timeline.count_label.text() == "100 alerts"
+
+
+def test_timeline_click_resolves_pooled_item(dashboard):
+    """Clicking anywhere on an item should emit its batch and class once"""
+    timeline = dashboard.alerts_timeline
+    timeline.update_alerts([
+        AlertRow("b1", "BruteForce", "high", "10.0.0.1", "12:00:00"),
+        AlertRow("b2", "PortScan", "low", "", "12:00:01"),
+    ])
+    timeline.flush()
+    QApplication.processEvents()
+    clicks = []
+    timeline.alert_clicked.connect(lambda *args: clicks.append(args))
+    
+    QTest.mouseClick(timeline._pool[1].class_label, Qt.MouseButton.LeftButton)
+    QTest.mouseClick(timeline._pool[0], Qt.MouseButton.LeftButton)
+    assert clicks == [("b2", "PortScan"), ("b1", "BruteForce")]
+
+
+def test_banner_pluralizes_counts(dashboard):
+    """Banner text should use singular and plural alert nouns correctly"""
+    banner = dashboard.threat_banner
+    banner.set_threat_level(1, 0, 0, 1)
+    assert banner.action_count_label.text() == "1 Alert"
+    assert banner.action_text.text() == "1 Critical Alert Need Immediate Attention"
+    
+    banner.set_threat_level(0, 0, 2, 2)
+    assert banner.action_count_label.text() == "2 Alerts"
+    assert banner.action_text.text() == "2 Medium Priority Alerts Detected"
+
+
+def test_timeline_items_inherit_container_cursor(dashboard):
+    """Pooled items should not set their own cursor"""
+    timeline = dashboard.alerts_timeline
+    assert timeline.alerts_container.cursor().shape() == Qt.CursorShape.PointingHandCursor
+    assert timeline._empty_widget.cursor().shape() == Qt.CursorShape.ArrowCursor
+    for item in timeline._pool:
+        assert not item.testAttribute(Qt.WidgetAttribute.WA_SetCursor)
+        assert item.cursor().shape() == Qt.CursorShape.PointingHandCursor
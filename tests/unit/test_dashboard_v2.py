@@ -0,0 +1,355 @@
+"""Unit tests for the Zones A-F dashboard"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime
+
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtWidgets import QApplication, QFileDialog
+
+from soc_copilot.phase4.controller import AnalysisResult, AlertSummary
+from soc_copilot.phase4.ui.dashboard_v2 import Dashboard
+
+
+def make_result(batch_id: str, *priorities: str) -> AnalysisResult:
+    """Create an analysis result with one alert per priority"""
+    alerts = [
+        AlertSummary(
+            alert_id=f"{batch_id}-{i}",
+            priority=priority,
+            classification="BruteForce",
+            confidence=0.9,
+            anomaly_score=0.5,
+            risk_score=0.7,
+            source_ip="10.0.0.1",
+            destination_ip="10.0.0.2",
+            timestamp=datetime(2026, 1, 1, 12, 0, 0),
+            reasoning="Test",
+            suggested_action="Test",
+        )
+        for i, priority in enumerate(priorities)
+    ]
+    return AnalysisResult(
+        batch_id=batch_id, timestamp=datetime.now(), alerts=alerts, stats=Mock(), raw_count=1
+    )
+
+
+def settle(dashboard):
+    """Wait for background fetches and deliver their results"""
+    while True:
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        if dashboard._fetch_job is None:
+            return
+
+
+@pytest.fixture
+def mock_bridge():
+    """Bridge serving results through the incremental cursor API"""
+    bridge = Mock()
+    bridge.pending = []
+    
+    def get_results_since(cursor):
+        new, bridge.pending = bridge.pending, []
+        return new, cursor + len(new)
+    
+    bridge.get_results_since = Mock(side_effect=get_results_since)
+    bridge.get_stats = Mock(return_value={"pipeline_loaded": True})
+    return bridge
+
+
+@pytest.fixture
+def dashboard(qtbot, mock_bridge):
+    widget = Dashboard(mock_bridge)
+    qtbot.addWidget(widget)
+    widget.show()
+    settle(widget)
+    return widget
+
+
+def test_refresh_fetches_only_new_results(dashboard, mock_bridge):
+    """Counts should accumulate from deltas without refetching old results"""
+    mock_bridge.pending = [make_result("b1", "P0-Critical", "P1-High")]
+    dashboard.refresh()
+    settle(dashboard)
+    assert dashboard.metrics_row.critical_card.value_label.text() == "1"
+    assert dashboard._cursor == 1
+    
+    mock_bridge.pending = [make_result("b2", "P1-High", "P3-Low")]
+    dashboard.refresh()
+    settle(dashboard)
+    assert dashboard.metrics_row.total_card.value_label.text() == "4"
+    assert dashboard.metrics_row.high_card.value_label.text() == "2"
+    assert dashboard._cursor == 2
+    mock_bridge.get_results_since.assert_called_with(1)
+
+
+def test_window_evicts_oldest_results(dashboard, mock_bridge):
+    """Results falling out of the recent window should stop being counted"""
+    dashboard._recent_results = type(dashboard._recent_results)(maxlen=2)
+    mock_bridge.pending = [
+        make_result("b1", "P0-Critical"),
+        make_result("b2", "P2-Medium"),
+        make_result("b3", "P2-Medium"),
+    ]
+    dashboard.refresh()
+    settle(dashboard)
+    
+    assert dashboard.metrics_row.critical_card.value_label.text() == "0"
+    assert dashboard.metrics_row.medium_card.value_label.text() == "2"
+    assert len(dashboard._alerts_cache) == 2
+
+
+def test_refresh_restores_updates_after_error(dashboard, mock_bridge):
+    """Updates must be re-enabled even when the bridge fails"""
+    mock_bridge.get_results_since.side_effect = RuntimeError("bridge down")
+    dashboard.refresh()
+    settle(dashboard)
+    
+    assert dashboard.updatesEnabled()
+    assert dashboard.threat_banner.level_label.text() == "NORMAL"
+
+
+def test_unchanged_tick_skips_zone_updates(dashboard, mock_bridge):
+    """A tick without new results should leave metrics and timeline alone"""
+    mock_bridge.pending = [make_result("b1", "P1-High")]
+    dashboard.refresh()
+    settle(dashboard)
+    dashboard.metrics_row.update_metrics = Mock()
+    dashboard.alerts_timeline.update_alerts = Mock()
+    
+    dashboard.refresh()
+    settle(dashboard)
+    dashboard.metrics_row.update_metrics.assert_not_called()
+    dashboard.alerts_timeline.update_alerts.assert_not_called()
+    
+    mock_bridge.pending = [make_result("b2", "P2-Medium")]
+    dashboard.refresh()
+    settle(dashboard)
+    dashboard.metrics_row.update_metrics.assert_called_once()
+
+
+def test_upload_runs_off_the_gui_thread(dashboard, mock_bridge, monkeypatch):
+    """Uploads should be analyzed on a pool thread, then re-enable the button"""
+    monkeypatch.setattr(
+        QFileDialog, "getOpenFileNames",
+        Mock(return_value=(["a.log", "b.log"], ""))
+    )
+    gui_thread = threading.get_ident()
+    threads = []
+    mock_bridge.add_file_source = Mock(
+        side_effect=lambda path: threads.append(threading.get_ident()) or True
+    )
+    
+    dashboard._upload_logs()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    
+    assert len(threads) == 2
+    assert gui_thread not in threads
+    mock_bridge.start_ingestion.assert_called_once()
+    assert dashboard.actions_bar.upload_btn.isEnabled()
+
+
+def test_timeline_colors_rows_by_priority_bucket(dashboard, mock_bridge):
+    """Timeline rows should be colored from the alert's priority bucket"""
+    mock_bridge.pending = [make_result("b1", "P0-Critical", "P3-Low")]
+    dashboard.refresh()
+    settle(dashboard)
+    
+    table = dashboard.alerts_timeline.table
+    colors = {table.item(row, 1).text(): table.item(row, 1).foreground().color().name()
+              for row in range(table.rowCount()) if not table.isRowHidden(row)}
+    assert colors == {"P0-Critical": "#ff4444", "P3-Low": "#ffffff"}
+
+
+def test_timeline_rows_capped_at_capacity(dashboard, mock_bridge):
+    """Only the newest rows the timeline can show should be built"""
+    mock_bridge.pending = [make_result(f"b{i}", "P1-High", "P3-Low") for i in range(8)]
+    dashboard.refresh()
+    settle(dashboard)
+    
+    rows = dashboard._alerts_cache
+    assert len(rows) == dashboard.alerts_timeline.MAX_ROWS
+    assert (rows[0]["batch_id"], rows[0]["priority"]) == ("b7", "P3-Low")
+    assert dashboard.alerts_timeline.count_label.text() == "16 alerts (showing 10)"
+
+
+def test_bridge_notifications_schedule_refresh(dashboard, mock_bridge):
+    """New-result notifications from the bridge should schedule a refresh"""
+    mock_bridge.alerts_changed.connect.assert_called_once_with(dashboard._schedule_refresh)
+    assert dashboard.timer.interval() == Dashboard.REFRESH_INTERVAL_MS
+
+
+def test_notification_bursts_coalesce_into_one_refresh(dashboard, mock_bridge):
+    """Several notifications within the coalescing window refresh once"""
+    calls = mock_bridge.get_results_since.call_count
+    for _ in range(5):
+        dashboard._schedule_refresh()
+    assert dashboard._refresh_pending.isActive()
+    assert mock_bridge.get_results_since.call_count == calls
+    
+    dashboard._refresh_pending.timeout.emit()
+    settle(dashboard)
+    assert mock_bridge.get_results_since.call_count == calls + 1
+
+
+def test_threat_banner_styles_by_level_property(dashboard):
+    """The banner should be styled by the shared sheet and re-polish only on a level change"""
+    banner = dashboard.threat_banner
+    banner.set_level("high", 0, 2)
+    assert banner.property("level") == "high"
+    assert banner.styleSheet() == ""
+    assert banner.level_label.text() == "HIGH ALERT"
+    
+    with patch("soc_copilot.phase4.ui.dashboard_v2.repolish") as repolish:
+        banner.set_level("high", 0, 3)
+        repolish.assert_not_called()
+        assert banner.detail_label.text() == "3 high-priority alerts detected"
+        
+        banner.set_level("unknown", 0, 0)
+        assert banner.property("level") == "normal"
+        assert repolish.call_count == 2
+
+
+def test_manual_refreshes_are_throttled(dashboard, mock_bridge):
+    """The first refresh request runs at once; the rest of the window folds into one"""
+    calls = mock_bridge.get_results_since.call_count
+    for _ in range(3):
+        dashboard.actions_bar.refresh_btn.click()
+        settle(dashboard)
+    assert mock_bridge.get_results_since.call_count == calls + 1
+    assert dashboard._throttle.isActive()
+    
+    dashboard._throttle.timeout.emit()
+    settle(dashboard)
+    assert mock_bridge.get_results_since.call_count == calls + 2
+    
+    dashboard._throttle.stop()
+    dashboard._throttle.timeout.emit()
+    settle(dashboard)
+    assert mock_bridge.get_results_since.call_count == calls + 2
+
+
+def test_refresh_fetches_off_the_gui_thread(dashboard, mock_bridge):
+    """Bridge calls should run on a pool thread and zones update afterwards"""
+    gui_thread = threading.get_ident()
+    threads = []
+    fetch = mock_bridge.get_results_since.side_effect
+    mock_bridge.get_results_since.side_effect = (
+        lambda cursor: threads.append(threading.get_ident()) or fetch(cursor)
+    )
+    mock_bridge.pending = [make_result("b1", "P0-Critical")]
+    
+    dashboard.refresh()
+    dashboard.refresh()  # folded into one follow-up fetch
+    settle(dashboard)
+    
+    assert len(threads) == 2
+    assert gui_thread not in threads
+    assert dashboard.metrics_row.critical_card.value_label.text() == "1"
+
+
+def test_rows_still_on_screen_are_reused(dashboard, mock_bridge):
+    """Rows formatted on an earlier refresh should not be rebuilt"""
+    mock_bridge.pending = [make_result("b1", "P1-High")]
+    dashboard.refresh()
+    settle(dashboard)
+    first = dashboard._alerts_cache[0]
+    
+    mock_bridge.pending = [make_result("b2", "P3-Low")]
+    dashboard.refresh()
+    settle(dashboard)
+    assert dashboard._alerts_cache[0]["batch_id"] == "b2"
+    assert dashboard._alerts_cache[1] is first
+    assert set(dashboard._row_cache) == {("b1", "b1-0"), ("b2", "b2-0")}
+
+
+def test_timeline_items_updated_in_place(dashboard, mock_bridge):
+    """Table items should be re-labelled, with surplus rows hidden"""
+    table = dashboard.alerts_timeline.table
+    first_item = table.item(0, 2)
+    mock_bridge.pending = [make_result("b1", "P1-High", "P2-Medium")]
+    dashboard.refresh()
+    settle(dashboard)
+    
+    assert table.item(0, 2) is first_item
+    assert table.rowCount() == dashboard.alerts_timeline.MAX_ROWS
+    assert [table.isRowHidden(row) for row in range(3)] == [False, False, True]
+    assert table.item(0, 0).data(Qt.ItemDataRole.UserRole) == "b1"
+
+
+def test_status_strip_restyles_only_on_change(dashboard):
+    """Re-reporting the same status should only refresh the timestamp"""
+    strip = dashboard.status_strip
+    strip.update_status(True, 2, True, False)
+    assert strip.ingestion_label.text() == "Ingestion: ● Active (2)"
+    assert strip.ingestion_label.property("tone") == "info"
+    
+    with patch("soc_copilot.phase4.ui.dashboard_v2.repolish") as repolish:
+        strip.update_status(True, 2, True, False)
+        repolish.assert_not_called()
+        
+        strip.update_status(True, 2, False, False)
+        repolish.assert_called_once_with(strip.ingestion_label)
+    assert strip.ingestion_label.property("tone") == "idle"
+    assert strip.ingestion_label.text() == "Ingestion: ○ Idle (2)"
+
+
+def test_zones_use_shared_stylesheet(dashboard):
+    """Zone widgets should rely on the dashboard-level sheet, not their own"""
+    from soc_copilot.phase4.ui.styles import MASTER_QSS
+    
+    assert dashboard.styleSheet() == MASTER_QSS
+    card = dashboard.metrics_row.critical_card
+    assert card.property("priority") == "critical"
+    for widget in (dashboard.status_strip, card, card.value_label,
+                   dashboard.actions_bar.upload_btn, dashboard.actions_bar.refresh_btn):
+        assert widget.styleSheet() == ""
+
+
+def test_threat_banner_skips_unchanged_counts(dashboard):
+    """Identical level and counts should leave the banner untouched"""
+    banner = dashboard.threat_banner
+    banner.set_level("high", 0, 2)
+    banner.detail_label.setText = Mock()
+    
+    banner.set_level("high", 0, 2)
+    banner.detail_label.setText.assert_not_called()
+    
+    banner.set_level("high", 0, 3)
+    banner.detail_label.setText.assert_called_once_with("3 high-priority alerts detected")
+
+
+def test_metric_card_skips_unchanged_value(dashboard):
+    """Setting a card to its current value should not touch the label"""
+    card = dashboard.metrics_row.high_card
+    card.set_value(3)
+    card.value_label.setText = Mock()
+    
+    card.set_value(3)
+    card.value_label.setText.assert_not_called()
+    card.set_value(4)
+    card.value_label.setText.assert_called_once_with("4")
+
+
+def test_rows_format_non_datetime_timestamps(dashboard, mock_bridge):
+    """Timestamps without strftime should be shown as strings"""
+    result = make_result("b1", "P1-High")
+    result.alerts[0].timestamp = "2026-01-01T12:00:00"
+    mock_bridge.pending = [make_result("b0", "P3-Low"), result]
+    dashboard.refresh()
+    settle(dashboard)
+    
+    times = [row["time"] for row in dashboard._alerts_cache]
+    assert times == ["2026-01-01T12:00:00", "12:00:00"]
+
+
+def test_signal_handlers_are_registered_slots(dashboard):
+    """Connected handlers should be declared slots on the meta-object"""
+    meta = dashboard.metaObject()
+    for signature in ("refresh()", "_apply_refresh(PyQt_PyObject,PyQt_PyObject,PyQt_PyObject)",
+                      "_on_metric_clicked(QString)", "_on_upload_finished(int)"):
+        assert meta.indexOfSlot(signature) >= 0, signature
@@ -141,3 +141,48 @@ def test_status_bar_shows_configured_state(main_window, mock_controller):
     
     status_text = main_window.status_bar.currentMessage()
     assert "Configured" in status_text
+
+
+def test_status_refresh_is_pushed_and_coalesced(main_window, mock_controller):
+    """A burst of alerts_changed should trigger one shared status refresh"""
+    assert main_window.status_timer.interval() == MainWindow.STATUS_INTERVAL_MS
+    calls = mock_controller.get_stats.call_count
+    
+    for _ in range(5):
+        main_window.bridge.alerts_changed.emit()
+    assert main_window._status_pending.isActive()
+    assert mock_controller.get_stats.call_count == calls
+    
+    main_window._status_pending.timeout.emit()
+    # Sidebar summary and status bar each read the stats once
+    assert mock_controller.get_stats.call_count == calls + 2
+
+
+def test_status_bar_skips_unchanged_message(main_window, mock_controller):
+    """Re-reading identical stats should not re-show the status message"""
+    main_window._update_status_bar()
+    message = main_window.status_bar.currentMessage()
+    main_window.status_bar.showMessage = Mock()
+    
+    main_window._update_status_bar()
+    main_window.status_bar.showMessage.assert_not_called()
+    
+    mock_controller.get_stats.return_value = {
+        **mock_controller.get_stats.return_value, "results_stored": 5
+    }
+    main_window._update_status_bar()
+    main_window.status_bar.showMessage.assert_called_once()
+    assert main_window.status_bar.showMessage.call_args[0][0] != message
+
+
+def test_stats_changed_and_kill_switch_schedule_status(main_window, mock_controller):
+    """Status changes outside alert batches should reach the status bar quickly"""
+    assert main_window.kill_switch_timer.interval() == MainWindow.KILL_SWITCH_POLL_MS
+    
+    main_window.bridge.stats_changed.emit()
+    assert main_window._status_pending.isActive()
+    main_window._status_pending.stop()
+    
+    mock_controller.killswitch_check = Mock(return_value=True)
+    main_window.kill_switch_timer.timeout.emit()
+    assert main_window._status_pending.isActive()
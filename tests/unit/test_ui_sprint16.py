@@ -1,7 +1,7 @@
 """Unit tests for Sprint-16: UI/UX Layer"""
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
 from soc_copilot.phase4.ui import ControllerBridge
@@ -61,6 +61,54 @@ class TestControllerBridge:
         
         assert count == 42
     
+    def test_get_priority_counts(self, mock_controller):
+        """Priority counts should come straight from the result store"""
+        mock_controller.result_store.priority_counts.return_value = {"total": 3}
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert bridge.get_priority_counts() == {"total": 3}
+        mock_controller.get_results.assert_not_called()
+    
+    def test_get_dashboard_snapshot(self, mock_controller):
+        """Snapshot should read counts and alerts from one store call"""
+        mock_controller.result_store.snapshot.return_value = ({"total": 1}, [("b1", "alert")])
+        mock_controller.get_stats.return_value = {"pipeline_loaded": True}
+        mock_controller.killswitch_check = None
+        
+        bridge = ControllerBridge(mock_controller)
+        snapshot = bridge.get_dashboard_snapshot(timeline_limit=5)
+        
+        mock_controller.result_store.snapshot.assert_called_once_with(5)
+        assert snapshot["counts"] == {"total": 1}
+        assert snapshot["recent_alerts"] == [("b1", "alert")]
+        assert snapshot["stats"]["pipeline_loaded"] is True
+    
+    def test_get_priority_summary(self, mock_controller):
+        """Summary should combine store counters with headline stats"""
+        mock_controller.result_store.priority_counts.return_value = {"total": 4, "critical": 1}
+        mock_controller.get_stats.return_value = {"pipeline_loaded": True, "results_stored": 2}
+        mock_controller.killswitch_check = None
+        
+        bridge = ControllerBridge(mock_controller)
+        summary = bridge.get_priority_summary()
+        
+        assert summary["total"] == 4
+        assert summary["critical"] == 1
+        assert summary["pipeline_loaded"] is True
+        assert summary["results_stored"] == 2
+        assert summary["shutdown_flag"] is False
+        mock_controller.get_results.assert_not_called()
+    
+    def test_permission_check_is_lazy(self, mock_controller):
+        """Permissions should be checked on first request, then reused"""
+        bridge = ControllerBridge(mock_controller)
+        assert "_permission_status" not in vars(bridge)
+        
+        status = bridge.get_permission_status()
+        assert "has_permission" in status
+        assert bridge.get_permission_status() is status
+    
     def test_read_only_access(self, mock_controller):
         """Verify bridge provides read-only access"""
         bridge = ControllerBridge(mock_controller)
@@ -69,6 +117,249 @@ class TestControllerBridge:
         assert not hasattr(bridge, 'process_batch')
         assert not hasattr(bridge, 'clear_results')
         assert not hasattr(bridge, 'initialize')
+    
+    def test_add_file_source_streams_batches(self, mock_controller, tmp_path):
+        """Large files should reach the controller in BATCH_SIZE chunks"""
+        logfile = tmp_path / "big.log"
+        logfile.write_text("\n".join(f"line {i}" for i in range(2500)) + "\n")
+        
+        bridge = ControllerBridge(mock_controller)
+        assert bridge.add_file_source(str(logfile)) is True
+        
+        sizes = [len(c.args[0]) for c in mock_controller.process_batch.call_args_list]
+        assert sizes == [1000, 1000, 500]
+        first = mock_controller.process_batch.call_args_list[0].args[0][0]
+        assert first == {"raw_line": "line 0"}
+    
+    def test_alerts_changed_emitted_per_result(self, mock_controller, tmp_path):
+        """Listeners should hear about batches that produced results only"""
+        logfile = tmp_path / "two.log"
+        logfile.write_text("one\ntwo\n")
+        mock_controller.process_batch.side_effect = [Mock(), None]
+        
+        bridge = ControllerBridge(mock_controller)
+        bridge.BATCH_SIZE = 1
+        listener = Mock()
+        bridge.alerts_changed.connect(listener)
+        
+        assert bridge.add_file_source(str(logfile)) is True
+        assert listener.call_count == 1
+    
+    def test_stats_changed_on_ingest_and_kill_switch(self, mock_controller, tmp_path):
+        """Status listeners should hear about ingested files and kill switch flips"""
+        logfile = tmp_path / "one.log"
+        logfile.write_text("one\n")
+        mock_controller.killswitch_check = Mock(return_value=False)
+        
+        bridge = ControllerBridge(mock_controller)
+        listener = Mock()
+        bridge.stats_changed.connect(listener)
+        
+        assert bridge.add_file_source(str(logfile)) is True
+        assert bridge.add_file_source(str(tmp_path / "missing.log")) is False
+        assert listener.call_count == 1
+        
+        assert bridge.poll_kill_switch() is False
+        assert listener.call_count == 1
+        mock_controller.killswitch_check.return_value = True
+        assert bridge.poll_kill_switch() is True
+        assert bridge.poll_kill_switch() is True
+        assert listener.call_count == 2
+    
+    def test_text_lines_stripped_and_blank_skipped(self, mock_controller, tmp_path):
+        """Plain text files should yield one record per non-blank line"""
+        logfile = tmp_path / "auth.log"
+        logfile.write_bytes("  first\r\n\n\t\nsécond line".encode("utf-8"))
+        empty = tmp_path / "empty.log"
+        empty.write_bytes(b"")
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert list(bridge._iter_file(logfile)) == [
+            {"raw_line": "first"},
+            {"raw_line": "sécond line"},
+        ]
+        assert list(bridge._iter_file(empty)) == []
+    
+    def test_text_lines_split_across_blocks(self, mock_controller, tmp_path, monkeypatch):
+        """Lines and multi-byte characters spanning read blocks stay intact"""
+        logfile = tmp_path / "auth.log"
+        logfile.write_bytes("ééé one\nsecond\nthird".encode("utf-8"))
+        monkeypatch.setattr(ControllerBridge, "TEXT_READ_SIZE", 3)
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert [r["raw_line"] for r in bridge._iter_file(logfile)] == [
+            "ééé one", "second", "third"
+        ]
+    
+    def test_log_suffix_sniffed_as_json(self, mock_controller, tmp_path):
+        """JSONL content in a .log file should be parsed as JSON, not text"""
+        logfile = tmp_path / "app.log"
+        logfile.write_text('  {"src_ip": "10.0.0.1"}\n')
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert list(bridge._iter_file(logfile)) == [
+            {"raw_line": '{"src_ip": "10.0.0.1"}', "src_ip": "10.0.0.1"}
+        ]
+        
+        syslog = tmp_path / "syslog.log"
+        syslog.write_text("[2026-01-01 12:00:00] sshd: accepted\n")
+        assert list(bridge._iter_file(syslog)) == [
+            {"raw_line": "[2026-01-01 12:00:00] sshd: accepted"}
+        ]
+    
+    def test_sniffed_json_falls_back_to_text(self, mock_controller, tmp_path):
+        """A .log file that only looks like JSON should still ingest as text"""
+        logfile = tmp_path / "app.log"
+        logfile.write_text('{not json} sshd: accepted\nsecond line\n')
+        mixed = tmp_path / "mixed.log"
+        mixed.write_text('{"a": 1}\nplain line\n')
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert list(bridge._iter_file(logfile)) == [
+            {"raw_line": "{not json} sshd: accepted"},
+            {"raw_line": "second line"},
+        ]
+        assert list(bridge._iter_file(mixed)) == [
+            {"raw_line": '{"a": 1}', "a": 1},
+            {"raw_line": "plain line"},
+        ]
+        assert bridge.add_file_source(str(logfile)) is True
+        
+        # A real .json file that fails to parse is still an error
+        broken = tmp_path / "broken.json"
+        broken.write_text('{"a": \n')
+        with pytest.raises(ValueError):
+            list(bridge._iter_file(broken))
+    
+    def test_csv_keeps_original_line(self, mock_controller, tmp_path):
+        """CSV records should carry the file line itself as raw_line"""
+        logfile = tmp_path / "flows.csv"
+        logfile.write_text(
+            'src_ip,dst_ip,note\n10.0.0.1,10.0.0.2,"a, b"\n\n10.0.0.3,10.0.0.4,"multi\nline"\n'
+        )
+        
+        bridge = ControllerBridge(mock_controller)
+        records = list(bridge._iter_file(logfile))
+        
+        assert records == [
+            {
+                "raw_line": '10.0.0.1,10.0.0.2,"a, b"',
+                "src_ip": "10.0.0.1",
+                "dst_ip": "10.0.0.2",
+                "note": "a, b",
+            },
+            {
+                "raw_line": '10.0.0.3,10.0.0.4,"multi\nline"',
+                "src_ip": "10.0.0.3",
+                "dst_ip": "10.0.0.4",
+                "note": "multi\nline",
+            },
+        ]
+    
+    def test_json_lines_kept_verbatim(self, mock_controller, tmp_path):
+        """Newline-delimited JSON should stream with each line as raw_line"""
+        logfile = tmp_path / "events.json"
+        logfile.write_text('{"src_ip": "10.0.0.1"}\n\n{"src_ip": "10.0.0.2"}\n')
+        
+        bridge = ControllerBridge(mock_controller)
+        records = list(bridge._iter_file(logfile))
+        
+        assert records == [
+            {"raw_line": '{"src_ip": "10.0.0.1"}', "src_ip": "10.0.0.1"},
+            {"raw_line": '{"src_ip": "10.0.0.2"}', "src_ip": "10.0.0.2"},
+        ]
+    
+    def test_malformed_json_lines_skipped(self, mock_controller, tmp_path):
+        """A bad JSONL line should be dropped without aborting the file"""
+        logfile = tmp_path / "events.jsonl"
+        logfile.write_text('{"a": 1}\n{"a": \n[1, 2]\n{"a": 3}\n')
+        
+        bridge = ControllerBridge(mock_controller)
+        
+        assert [r["a"] for r in bridge._iter_file(logfile)] == [1, 3]
+        assert bridge.add_file_source(str(logfile)) is True
+    
+    def test_add_file_source_reports_partial_success(self, mock_controller, tmp_path):
+        """An error after batches were stored should not report the file as failed"""
+        logfile = tmp_path / "three.log"
+        logfile.write_text("one\ntwo\nthree\n")
+        mock_controller.process_batch.side_effect = [Mock(), RuntimeError("boom")]
+        
+        bridge = ControllerBridge(mock_controller)
+        bridge.BATCH_SIZE = 1
+        assert bridge.add_file_source(str(logfile)) is True
+        assert mock_controller.process_batch.call_count == 2
+        
+        mock_controller.process_batch.side_effect = RuntimeError("boom")
+        assert bridge.add_file_source(str(logfile)) is False
+    
+    def test_json_array_document(self, mock_controller, tmp_path):
+        """A pretty-printed JSON array should still yield one record per item"""
+        import json
+        
+        logfile = tmp_path / "events.json"
+        logfile.write_text(json.dumps([{"a": 1}, {"a": 2}], indent=2))
+        
+        bridge = ControllerBridge(mock_controller)
+        records = list(bridge._iter_file(logfile))
+        
+        assert [r["a"] for r in records] == [1, 2]
+        assert json.loads(records[0]["raw_line"]) == {"a": 1}
+    
+    def test_evtx_prefers_rust_bindings(self, mock_controller, tmp_path, monkeypatch):
+        """EVTX files should be read through the `evtx` bindings when available"""
+        import sys
+        import types
+        
+        parser = Mock()
+        parser.records.return_value = iter([{"event_record_id": 1, "data": "<Event/>"}])
+        fake_evtx = types.ModuleType("evtx")
+        fake_evtx.PyEvtxParser = Mock(return_value=parser)
+        monkeypatch.setitem(sys.modules, "evtx", fake_evtx)
+        monkeypatch.setattr("soc_copilot.phase4.ui.controller_bridge._EVTX_BACKEND", None)
+        
+        bridge = ControllerBridge(mock_controller)
+        records = list(bridge._iter_file(tmp_path / "security.evtx"))
+        
+        assert records == [{"raw_line": "<Event/>"}]
+        fake_evtx.PyEvtxParser.assert_called_once_with(
+            str(tmp_path / "security.evtx"), number_of_threads=ControllerBridge.EVTX_THREADS
+        )
+    
+    def test_evtx_error_mid_file_is_surfaced(self, mock_controller, tmp_path, monkeypatch):
+        """A parser failure after some records should not pass as a full ingest"""
+        def records():
+            yield {"event_record_id": 1, "data": "<Event>1</Event>"}
+            yield {"event_record_id": 2, "data": "<Event>2</Event>"}
+            raise OSError("truncated chunk")
+        
+        parser = Mock()
+        parser.records.side_effect = records
+        monkeypatch.setattr(
+            "soc_copilot.phase4.ui.controller_bridge._EVTX_BACKEND", ("rust", Mock(return_value=parser))
+        )
+        logfile = tmp_path / "security.evtx"
+        logfile.write_bytes(b"ElfFile\x00")
+        
+        bridge = ControllerBridge(mock_controller)
+        with pytest.raises(OSError):
+            list(bridge._iter_file(logfile))
+        
+        # Nothing was stored before the error: the file failed as a whole
+        assert bridge.add_file_source(str(logfile)) is False
+        mock_controller.process_batch.assert_not_called()
+        
+        # Earlier batches were stored: reported as a partial ingest
+        bridge.BATCH_SIZE = 1
+        with patch("soc_copilot.phase4.ui.controller_bridge.logger") as logger:
+            assert bridge.add_file_source(str(logfile)) is True
+        assert mock_controller.process_batch.call_count == 2
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[0] == "file_source_partial"
 
 
 # ============================================================================